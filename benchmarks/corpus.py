@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import random
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "skills" / "shared" / "research"))
+
+from research_toolkit.schema import CATEGORY_MAPPING  # noqa: E402
+
+LANGUAGES = ("en", "ja", "zh")
+LAYOUTS = ("flat", "nested")
+UNCERTAIN = {"en": "[uncertain]", "ja": "[uncertain]", "zh": "[不确定]"}
+LONG_TEXT = "Synthetic description sentence used to pad long text values. "
+
+
+def category_labels(canonical):
+    aliases = CATEGORY_MAPPING[canonical]
+    return {"en": next(a for a in aliases if a.isascii() and a != a.lower()), "ja": aliases[-2], "zh": aliases[-1]}
+
+
+def build_fields(categories, fields_per_category, language):
+    schema = []
+    for c, canonical in enumerate(categories):
+        fields = [
+            {
+                "name": f"{canonical}_{j}",
+                "description": f"Synthetic field {j} of {canonical}",
+                "detail_level": ("brief", "moderate", "detailed")[j % 3],
+                **({"required": True} if j == 0 else {}),
+            }
+            for j in range(fields_per_category)
+        ]
+        if c == 0:
+            fields.insert(0, {"name": "name", "description": "Item name", "detail_level": "brief", "required": True})
+        schema.append({"category": category_labels(canonical)[language], "fields": fields})
+    return {"field_categories": schema}
+
+
+def deep_list(rng, depth, width):
+    return [
+        {
+            "date": f"20{rng.randint(10, 25)}-{rng.randint(1, 12):02d}",
+            "event": f"event {rng.randint(0, 10**6)}",
+            **({"details": deep_list(rng, depth - 1, width)} if depth > 1 else {}),
+        }
+        for _ in range(width)
+    ]
+
+
+def field_value(rng, field, j, language, depth):
+    roll = rng.random()
+    if roll < 0.05:
+        return UNCERTAIN[language]
+    kind = j % 5
+    if kind == 0:
+        return f"{field} value {rng.randint(0, 10**6)}"
+    if kind == 1:
+        return rng.randint(0, 10**7)
+    if kind == 2:
+        return LONG_TEXT * rng.randint(2, 6)
+    if kind == 3:
+        return [f"tag{rng.randint(0, 999)}" for _ in range(rng.randint(1, 8))]
+    return deep_list(rng, depth, rng.randint(1, 3))
+
+
+def build_item(rng, index, categories, fields_per_category, layout, language, depth, fill_rate):
+    name = f"Synthetic Item {index:05d}"
+    sections = {}
+    uncertain = []
+    for canonical in categories:
+        section = {}
+        if canonical == categories[0]:
+            section["name"] = name
+        for j in range(fields_per_category):
+            field = f"{canonical}_{j}"
+            if j > 0 and rng.random() > fill_rate:
+                continue
+            value = field_value(rng, field, j, language, depth)
+            if value == UNCERTAIN[language]:
+                uncertain.append(field)
+            section[field] = value
+        if rng.random() < 0.1:
+            section[f"extra_{canonical}"] = "unmapped value"
+        sections[canonical] = section
+    if layout == "flat":
+        data = {k: v for section in sections.values() for k, v in section.items()}
+    else:
+        data = {category_labels(c)[language] if rng.random() < 0.5 else c: section for c, section in sections.items()}
+    data["uncertain"] = uncertain
+    return name, data
+
+
+def generate(
+    out_dir,
+    items=10000,
+    categories=5,
+    fields_per_category=8,
+    layouts=LAYOUTS,
+    languages=LANGUAGES,
+    depth=3,
+    fill_rate=0.9,
+    seed=0,
+    schema_language="en",
+):
+    rng = random.Random(seed)
+    out_dir = Path(out_dir)
+    results = out_dir / "results"
+    results.mkdir(parents=True, exist_ok=True)
+    chosen = list(CATEGORY_MAPPING)[:categories]
+    (out_dir / "fields.yaml").write_text(
+        _dump_yaml(build_fields(chosen, fields_per_category, schema_language)), encoding="utf-8"
+    )
+    names = []
+    total_bytes = 0
+    for index in range(items):
+        layout = layouts[index % len(layouts)]
+        language = languages[(index // len(layouts)) % len(languages)]
+        name, data = build_item(rng, index, chosen, fields_per_category, layout, language, depth, fill_rate)
+        payload = json.dumps(data, ensure_ascii=False, indent=2 if index % 2 else None)
+        (results / f"{name.replace(' ', '_')}.json").write_text(payload, encoding="utf-8")
+        total_bytes += len(payload.encode("utf-8"))
+        names.append(name)
+    (out_dir / "outline.yaml").write_text(
+        _dump_yaml(
+            {
+                "topic": "Synthetic benchmark corpus",
+                "items": [{"name": name, "category": chosen[i % len(chosen)]} for i, name in enumerate(names)],
+                "execution": {"batch_size": 8, "items_per_agent": 1, "output_dir": "./results"},
+            }
+        ),
+        encoding="utf-8",
+    )
+    info = {
+        "items": items,
+        "categories": categories,
+        "fields": categories * fields_per_category + 1,
+        "layouts": list(layouts),
+        "languages": list(languages),
+        "schema_language": schema_language,
+        "depth": depth,
+        "seed": seed,
+        "bytes": total_bytes,
+    }
+    (out_dir / "corpus.json").write_text(json.dumps(info), encoding="utf-8")
+    return info
+
+
+def _dump_yaml(data):
+    import yaml
+    return yaml.safe_dump(data, allow_unicode=True, sort_keys=False)
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Generate a synthetic fields.yaml, outline.yaml and results corpus")
+    parser.add_argument("output", type=str, help="Directory to write the corpus into")
+    parser.add_argument("--items", "-n", type=int, default=10000, help="Number of result JSON files (default: 10000)")
+    parser.add_argument("--categories", type=int, default=5, help=f"Field categories (max {len(CATEGORY_MAPPING)})")
+    parser.add_argument("--fields-per-category", type=int, default=8, help="Fields per category")
+    parser.add_argument("--layout", choices=(*LAYOUTS, "mixed"), default="mixed", help="JSON layout")
+    parser.add_argument("--language", choices=(*LANGUAGES, "mixed"), default="mixed", help="Category key language")
+    parser.add_argument("--schema-language", choices=LANGUAGES, default="en", help="Category names in fields.yaml")
+    parser.add_argument("--depth", type=int, default=3, help="Nesting depth of list-of-dict values")
+    parser.add_argument("--fill-rate", type=float, default=0.9, help="Probability that an optional field is present")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    info = generate(
+        args.output,
+        items=args.items,
+        categories=min(args.categories, len(CATEGORY_MAPPING)),
+        fields_per_category=args.fields_per_category,
+        layouts=LAYOUTS if args.layout == "mixed" else (args.layout,),
+        languages=LANGUAGES if args.language == "mixed" else (args.language,),
+        depth=args.depth,
+        fill_rate=args.fill_rate,
+        seed=args.seed,
+        schema_language=args.schema_language,
+    )
+    print(json.dumps(info, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
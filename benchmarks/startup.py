@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_SCRIPT = ROOT / "skills" / "research-en" / "research" / "validate_json.py"
+
+SCENARIOS = {
+    "help": ["--help"],
+    "single": ["--no-daemon", "-q", "-f", "{fields}", "-j", "{json}"],
+    "uncached": ["--no-daemon", "--no-cache", "-q", "-f", "{fields}", "-j", "{json}"],
+}
+
+
+def parse_importtime(stderr):
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        head, cumulative_us, name = line.split("|", 2)
+        self_us = head.split(":", 1)[1].strip()
+        if self_us.isdigit():
+            modules[name.strip()] = {"self_us": int(self_us), "cumulative_us": int(cumulative_us)}
+    return modules
+
+
+def run_once(argv, cwd):
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    return time.perf_counter() - start, parse_importtime(proc.stderr)
+
+
+def bench(argv, cwd, runs):
+    run_once(argv, cwd)
+    walls = []
+    for _ in range(runs):
+        wall, imports = run_once(argv, cwd)
+        walls.append(wall * 1000)
+    return {
+        "runs": runs,
+        "wall_ms_median": statistics.median(walls),
+        "wall_ms_min": min(walls),
+        "import_us_total": sum(m["self_us"] for m in imports.values()),
+        "modules": sorted(imports),
+        "slowest_imports": sorted(
+            ({"module": name, **m} for name, m in imports.items()),
+            key=lambda m: m["self_us"],
+            reverse=True,
+        )[:10],
+    }
+
+
+def make_fixture(workdir):
+    fields = workdir / "fields.yaml"
+    fields.write_text(
+        "field_categories:\n"
+        "  - category: Basic Info\n"
+        "    fields:\n"
+        "      - name: name\n"
+        "        required: true\n"
+        "      - name: release_date\n",
+        encoding="utf-8",
+    )
+    item = workdir / "item.json"
+    item.write_text(json.dumps({"basic_info": {"name": "x", "release_date": "2025"}}), encoding="utf-8")
+    return fields, item
+
+
+def main():
+    import argparse
+    import tempfile
+    parser = argparse.ArgumentParser(description="Measure validate_json.py cold-start latency and import cost")
+    parser.add_argument("--script", type=str, default=str(DEFAULT_SCRIPT), help="validate_json.py to benchmark")
+    parser.add_argument("--runs", "-n", type=int, default=20, help="Runs per scenario")
+    parser.add_argument("--output", "-o", type=str, help="Write results JSON to this path")
+    parser.add_argument("--baseline", "-b", type=str, help="Compare against a previous results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression (default: 0.2)")
+    args = parser.parse_args()
+    script = Path(args.script).resolve()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        fields, item = make_fixture(workdir)
+        interpreter = bench(["-c", "pass"], workdir, args.runs)
+        results = []
+        for scenario, template in SCENARIOS.items():
+            argv = [str(script), *(a.format(fields=fields, json=item) for a in template)]
+            results.append({"scenario": scenario, **bench(argv, workdir, args.runs)})
+    report = {
+        "python": sys.version.split()[0],
+        "script": str(script),
+        "interpreter_ms_median": interpreter["wall_ms_median"],
+        "results": results,
+    }
+    print(f"bare interpreter {interpreter['wall_ms_median']:.1f} ms")
+    for r in results:
+        print(
+            f"{r['scenario']:<8} wall {r['wall_ms_median']:7.1f} ms (min {r['wall_ms_min']:.1f})  "
+            f"imports {r['import_us_total'] / 1000:6.1f} ms  modules {len(r['modules'])}"
+        )
+        print("         slowest: " + ", ".join(f"{m['module']} {m['self_us'] / 1000:.1f}" for m in r["slowest_imports"][:5]))
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.baseline:
+        baseline = {r["scenario"]: r for r in json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]}
+        regressed = False
+        for r in results:
+            old = baseline.get(r["scenario"])
+            if old is None:
+                continue
+            for metric in ("wall_ms_median", "import_us_total"):
+                if r[metric] > old[metric] * (1 + args.tolerance):
+                    print(f"[REGRESSION] {r['scenario']} {metric}: {old[metric]:.1f} -> {r[metric]:.1f}")
+                    regressed = True
+            added = sorted(set(r["modules"]) - set(old["modules"]))
+            if added:
+                print(f"[INFO] {r['scenario']} new imports: {', '.join(added[:20])}")
+        if regressed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "skills" / "shared" / "research"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+PHASES = (
+    "schema_load_yaml",
+    "schema_load_compiled",
+    "extract",
+    "validate_file",
+    "validate_dir",
+    "validate_dir_jobs",
+    "validate_dir_cached",
+    "report",
+    "report_incremental",
+    "stream_large",
+)
+SCHEMA_REPEAT = 200
+LARGE_ITEM_MB = 64
+# The streaming extractor must not grow with the item: peak RSS may rise at most this much while it runs.
+STREAM_RSS_LIMIT_KB = 16 * 1024
+
+
+def corpus_paths(corpus):
+    corpus = Path(corpus)
+    return corpus / "fields.yaml", sorted((corpus / "results").glob("*.json"))
+
+
+def peak_rss_kb():
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    scale = 1024 if sys.platform == "darwin" else 1
+    return max(own, children) // scale
+
+
+def write_large_item(path, megabytes):
+    # Written event by event so that generating the item does not raise the peak RSS being measured.
+    size = megabytes * 1024 * 1024
+    with path.open("w", encoding="utf-8") as f:
+        f.write('{"name": "Large Item", "basic_info": {"vendor": "Synthetic"}, "key_events": [')
+        i = 0
+        while f.tell() < size:
+            event = {"date": f"20{i % 100:02d}-01", "event": f"event {i}", "details": [f"detail {i}\n" * 8]}
+            f.write((", " if i else "") + json.dumps(event, ensure_ascii=i % 2 == 0))
+            i += 1
+        f.write('], "notes": "[uncertain] marker after the large array"}')
+
+
+def run_phase(phase, corpus, jobs, scratch):
+    from research_toolkit.cache import CACHE_NAME
+    from research_toolkit.extract import extract_json_fields, extract_json_fields_stream
+    from research_toolkit.report import REPORT_CACHE_NAME, write_report
+    from research_toolkit.schema import compiled_schema_path, load_schema
+    from research_toolkit.validate import validate_cached, validate_json, validate_many
+
+    fields, paths = corpus_paths(corpus)
+    scratch = Path(scratch)
+    scratch.mkdir(parents=True, exist_ok=True)
+    report_path = scratch / "report.md"
+    results = paths[0].parent
+    for sidecar in (results / CACHE_NAME, *(results / REPORT_CACHE_NAME).glob("*")):
+        sidecar.unlink(missing_ok=True)
+    steps = {
+        "schema_load_yaml": (None, lambda: [load_schema(fields, use_compiled=False) for _ in range(SCHEMA_REPEAT)]),
+        "schema_load_compiled": (
+            lambda: load_schema(fields),
+            lambda: [load_schema(fields) for _ in range(SCHEMA_REPEAT)],
+        ),
+        "extract": (None, lambda: [extract_json_fields(json.loads(p.read_bytes())) for p in paths]),
+        "validate_file": (None, lambda: [validate_json(p, *schema) for p in paths]),
+        "validate_dir": (None, lambda: list(validate_many(paths, schema, jobs=1))),
+        "validate_dir_jobs": (None, lambda: list(validate_many(paths, schema, jobs=jobs))),
+        "validate_dir_cached": (
+            lambda: list(validate_cached(paths, schema)),
+            lambda: list(validate_cached(paths, schema)),
+        ),
+        "report": (None, lambda: write_report(report_path, paths, fields, "Benchmark")),
+        "report_incremental": (
+            lambda: write_report(report_path, paths, fields, "Benchmark", cache_dir=results),
+            lambda: write_report(report_path, paths, fields, "Benchmark", cache_dir=results),
+        ),
+    }
+    if phase == "stream_large":
+        large = scratch / "large.json"
+        write_large_item(large, LARGE_ITEM_MB)
+        uncertain = set()
+        before = peak_rss_kb()
+        start = time.perf_counter()
+        with large.open(encoding="utf-8") as f:
+            extract_json_fields_stream(f, uncertain=uncertain)
+        seconds = time.perf_counter() - start
+        assert uncertain == {"notes"}, uncertain
+        return {
+            "phase": phase,
+            "seconds": seconds,
+            "count": 1,
+            "per_item_us": seconds * 1e6,
+            "peak_rss_kb": peak_rss_kb(),
+            "rss_growth_kb": peak_rss_kb() - before,
+            "bytes": large.stat().st_size,
+        }
+    if phase.startswith("schema_load"):
+        compiled_schema_path(fields).unlink(missing_ok=True)
+    schema = load_schema(fields)
+    setup, step = steps[phase]
+    if setup:
+        setup()
+    start = time.perf_counter()
+    step()
+    seconds = time.perf_counter() - start
+    count = SCHEMA_REPEAT if phase.startswith("schema_load") else len(paths)
+    return {
+        "phase": phase,
+        "seconds": seconds,
+        "count": count,
+        "per_item_us": seconds / count * 1e6 if count else 0.0,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+
+def measure(phase, corpus, jobs, scratch):
+    proc = subprocess.run(
+        [
+            sys.executable,
+            __file__,
+            "--phase",
+            phase,
+            "--corpus",
+            str(corpus),
+            "--jobs",
+            str(jobs),
+            "--scratch",
+            str(Path(scratch) / phase),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def compare(results, baseline_path, tolerance):
+    baseline = {r["phase"]: r for r in json.loads(Path(baseline_path).read_text(encoding="utf-8"))["results"]}
+    regressed = False
+    for r in results:
+        old = baseline.get(r["phase"])
+        if old is None:
+            continue
+        for metric in ("seconds", "peak_rss_kb"):
+            if r[metric] > old[metric] * (1 + tolerance):
+                print(f"[REGRESSION] {r['phase']} {metric}: {old[metric]:.3f} -> {r[metric]:.3f}")
+                regressed = True
+    return regressed
+
+
+def check_stream_memory(results):
+    failed = False
+    for r in results:
+        if r["phase"] == "stream_large" and r["rss_growth_kb"] > STREAM_RSS_LIMIT_KB:
+            print(
+                f"[REGRESSION] stream_large peak RSS grew {r['rss_growth_kb'] / 1024:.1f} MB while streaming a "
+                f"{r['bytes'] / 1024 / 1024:.0f} MB item (limit {STREAM_RSS_LIMIT_KB / 1024:.0f} MB)"
+            )
+            failed = True
+    return failed
+
+
+def main():
+    import argparse
+    import tempfile
+    parser = argparse.ArgumentParser(
+        description="Benchmark schema load, extraction, validation and report rendering on a synthetic corpus"
+    )
+    parser.add_argument("--corpus", "-c", type=str, help="Existing corpus directory (default: generate a fresh one)")
+    parser.add_argument("--items", "-n", type=int, default=10000, help="Items in the generated corpus (default: 10000)")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus random seed")
+    parser.add_argument("--jobs", "-J", type=int, default=os.cpu_count() or 1, help="Workers for validate_dir_jobs")
+    parser.add_argument("--phases", nargs="*", choices=PHASES, default=list(PHASES), help="Phases to run")
+    parser.add_argument("--output", "-o", type=str, help="Write results JSON to this path")
+    parser.add_argument("--baseline", "-b", type=str, help="Compare against a previous results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression (default: 0.2)")
+    parser.add_argument("--phase", type=str, help=argparse.SUPPRESS)
+    parser.add_argument("--scratch", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.phase:
+        print(json.dumps(run_phase(args.phase, args.corpus, args.jobs, args.scratch)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = Path(args.corpus) if args.corpus else Path(tmp) / "corpus"
+        info_path = corpus / "corpus.json"
+        if not args.corpus:
+            from corpus import generate
+            started = time.perf_counter()
+            info = generate(corpus, items=args.items, seed=args.seed)
+            print(f"generated {info['items']} items ({info['bytes'] / 1e6:.1f} MB) in {time.perf_counter() - started:.1f} s")
+        try:
+            info = json.loads(info_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            info = {"items": len(corpus_paths(corpus)[1])}
+        results = []
+        for phase in args.phases:
+            r = measure(phase, corpus, args.jobs, Path(tmp) / "scratch")
+            results.append(r)
+            print(
+                f"{r['phase']:<22} {r['seconds']:8.3f} s  {r['per_item_us']:9.1f} us/item  "
+                f"peak {r['peak_rss_kb'] / 1024:7.1f} MB"
+            )
+    report = {"python": sys.version.split()[0], "jobs": args.jobs, "corpus": info, "results": results}
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    regressed = check_stream_memory(results)
+    if args.baseline and compare(results, args.baseline, args.tolerance):
+        regressed = True
+    if regressed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import sys
+from pathlib import Path
+
+try:
+    import research_toolkit  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "shared" / "research"))
+
+from research_toolkit.report import main
+
+if __name__ == "__main__":
+    main(locale="en")
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+_EXPORTS = {
+    "CATEGORY_MAPPING": "schema",
+    "NESTED_KEYS": "schema",
+    "find_fields_yaml": "schema",
+    "load_fields_yaml": "schema",
+    "load_schema": "schema",
+    "extract_json_fields": "extract",
+    "extract_json_fields_stream": "extract",
+    "STREAM_THRESHOLD": "extract",
+    "CACHE_NAME": "cache",
+    "ValidationCache": "cache",
+    "schema_digest": "cache",
+    "validate_json": "validate",
+    "validate_many": "validate",
+    "validate_cached": "validate",
+    "summarize_results": "validate",
+    "print_result": "validate",
+    "validate_json_timed": "validate",
+    "Timings": "timings",
+    "collect_timings": "timings",
+    "UNCERTAIN_MARKERS": "schema",
+    "CoverageMatrix": "coverage",
+    "write_report": "report",
+    "ReportCache": "report",
+    "ResearchState": "state",
+    "record_results": "state",
+    "slugify": "outline",
+    "Scheduler": "scheduler",
+    "ItemIndex": "dedup",
+    "migrate_results": "migrate",
+    "ResultStore": "store",
+    "validate_stored": "store",
+    "UncertaintyIndex": "uncertainty",
+    "request_daemon": "daemon",
+    "serve": "daemon",
+    "msg": "locales",
+    "set_locale": "locales",
+    "get_locale": "locales",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
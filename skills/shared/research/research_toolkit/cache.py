@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+from pathlib import Path
+
+from .schema import NESTED_KEYS, UNCERTAIN_MARKERS, _sha256
+
+CACHE_NAME = ".validate_cache.sqlite"
+STORE_NAME = ".results_store.sqlite"
+CACHE_VERSION = 4
+CACHE_TIMEOUT = 30
+# File lists smaller than this are cheaper to revalidate than to look up.
+CACHE_MIN_BYTES = 256 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS entries (
+    name TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT, result TEXT
+);
+"""
+
+
+def schema_digest(schema):
+    all_fields, required_fields, field_categories = schema
+    payload = json.dumps(
+        [
+            CACHE_VERSION,
+            sorted(all_fields),
+            sorted(required_fields),
+            sorted(field_categories.items()),
+            sorted(NESTED_KEYS),
+            UNCERTAIN_MARKERS,
+        ],
+        ensure_ascii=False,
+    )
+    return _sha256(payload.encode("utf-8"))
+
+
+def file_digest(path):
+    return _sha256(path.read_bytes())
+
+
+class ValidationCache:
+    def __init__(self, directory, schema_key, path=None):
+        import sqlite3
+        self.directory = Path(directory)
+        self.path = Path(path) if path else self.directory / CACHE_NAME
+        self.schema_key = schema_key
+        self.pending = {}
+        self.db = None
+        try:
+            self.db = sqlite3.connect(self.path, timeout=CACHE_TIMEOUT)
+            self.db.executescript(_SCHEMA)
+            if dict(self.db.execute("SELECT key, value FROM meta")).get("schema") != schema_key:
+                with self.db:
+                    self.db.execute("DELETE FROM entries")
+                    self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('schema', ?)", (schema_key,))
+        except sqlite3.Error:
+            self.close()
+
+    def lookup(self, json_path):
+        if self.db is None:
+            return None
+        row = self.db.execute(
+            "SELECT size, mtime_ns, sha256, result FROM entries WHERE name = ?", (json_path.name,)
+        ).fetchone()
+        if row is None:
+            return None
+        size, mtime_ns, sha, result = row
+        st = json_path.stat()
+        if size != st.st_size:
+            return None
+        if mtime_ns != st.st_mtime_ns:
+            if sha != file_digest(json_path):
+                return None
+            self.pending[json_path.name] = (json_path.name, st.st_size, st.st_mtime_ns, sha, result)
+        return json.loads(result)
+
+    def store(self, json_path, result):
+        st = json_path.stat()
+        self.pending[json_path.name] = (
+            json_path.name,
+            st.st_size,
+            st.st_mtime_ns,
+            file_digest(json_path),
+            json.dumps(result, ensure_ascii=False),
+        )
+
+    def names(self):
+        if self.db is None:
+            return set()
+        return {name for name, in self.db.execute("SELECT name FROM entries")} | set(self.pending)
+
+    def evict_missing(self):
+        import sqlite3
+        if self.db is None:
+            return
+        present = set(os.listdir(self.directory))
+        for name in [name for name in self.pending if name not in present]:
+            del self.pending[name]
+        try:
+            with self.db:
+                self.db.executemany(
+                    "DELETE FROM entries WHERE name = ?", [(name,) for name in self.names() if name not in present]
+                )
+        except sqlite3.Error:
+            pass
+
+    def save(self):
+        import sqlite3
+        if self.db is None or not self.pending:
+            return
+        try:
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO entries (name, size, mtime_ns, sha256, result) VALUES (?, ?, ?, ?, ?)",
+                    self.pending.values(),
+                )
+        except sqlite3.Error:
+            return
+        self.pending = {}
+
+    def close(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+from functools import partial
+from pathlib import Path
+
+from .cache import CACHE_NAME, STORE_NAME
+from .locales import msg, set_locale
+from .schema import find_fields_yaml, load_schema
+from .store import validate_stored
+from .validate import validate_cached, validate_many
+
+
+def _popcount(bits):
+    return bin(bits).count("1")
+
+
+def _iter_bits(bits):
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class CoverageMatrix:
+    def __init__(self, schema):
+        all_fields, required_fields, field_categories = schema
+        self.fields = sorted(all_fields)
+        self.index = {field: i for i, field in enumerate(self.fields)}
+        self.required_mask = self.mask(required_fields)
+        self.category_masks = {}
+        for field in self.fields:
+            category = field_categories.get(field, msg("unknown_category"))
+            self.category_masks[category] = self.category_masks.get(category, 0) | 1 << self.index[field]
+        self.items = []
+        self.rows = []
+        self.columns = [0] * len(self.fields)
+
+    def mask(self, fields):
+        return sum(1 << self.index[f] for f in set(fields) if f in self.index)
+
+    def add(self, item, covered_fields):
+        row = self.mask(covered_fields)
+        item_bit = 1 << len(self.items)
+        self.items.append(item)
+        self.rows.append(row)
+        for i in _iter_bits(row):
+            self.columns[i] |= item_bit
+
+    def add_result(self, result):
+        missing = self.mask(result["missing_required"]) | self.mask(result["missing_optional"])
+        row = ((1 << len(self.fields)) - 1) & ~missing
+        self.add(result["file"], (self.fields[i] for i in _iter_bits(row)))
+
+    @classmethod
+    def from_results(cls, results, schema):
+        matrix = cls(schema)
+        for result in results:
+            matrix.add_result(result)
+        return matrix
+
+    def fill_rates(self):
+        total = len(self.items)
+        return {
+            field: _popcount(self.columns[i]) / total * 100 if total else 0
+            for i, field in enumerate(self.fields)
+        }
+
+    def category_gaps(self):
+        gaps = {}
+        for category, mask in self.category_masks.items():
+            missing = [_popcount(mask & ~row) for row in self.rows]
+            gaps[category] = {
+                "fields": _popcount(mask),
+                "missing_cells": sum(missing),
+                "items_with_gaps": sum(1 for m in missing if m),
+            }
+        return gaps
+
+    def items_missing(self, field):
+        all_items = (1 << len(self.items)) - 1
+        return [self.items[i] for i in _iter_bits(all_items & ~self.columns[self.index[field]])]
+
+    def items_missing_required(self):
+        return [item for item, row in zip(self.items, self.rows) if self.required_mask & ~row]
+
+    def missing_fields(self, row):
+        return [self.fields[i] for i in _iter_bits(((1 << len(self.fields)) - 1) & ~row)]
+
+    def write_csv(self, f):
+        import csv
+        writer = csv.writer(f)
+        writer.writerow(["item", *self.fields])
+        for item, row in zip(self.items, self.rows):
+            writer.writerow([item, *((row >> i) & 1 for i in range(len(self.fields)))])
+
+    def write_ndjson(self, f):
+        f.write(json.dumps({"type": "columns", "fields": self.fields}, ensure_ascii=False) + "\n")
+        for item, row in zip(self.items, self.rows):
+            record = {"type": "row", "item": item, "bits": format(row, "x"), "missing": self.missing_fields(row)}
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def main(argv=None, locale=None):
+    import argparse
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("coverage_description"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"), default="fields.yaml")
+    parser.add_argument("--json", "-j", type=str, nargs="*", help=msg("help_include_json"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"), default="results")
+    parser.add_argument("--jobs", "-J", type=int, default=1, help=msg("help_jobs"))
+    parser.add_argument("--no-cache", action="store_true", help=msg("help_no_cache", cache=CACHE_NAME))
+    parser.add_argument("--store", action="store_true", help=msg("help_store", store=STORE_NAME))
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("summary", help=msg("help_summary"))
+    missing = sub.add_parser("missing", help=msg("help_missing"))
+    missing.add_argument("field", nargs="*", help=msg("help_missing_fields"))
+    export = sub.add_parser("export", help=msg("help_export"))
+    export.add_argument("--format", choices=("csv", "ndjson"), default="csv", help=msg("help_export_format"))
+    export.add_argument("--output", "-o", type=str, help=msg("help_output"))
+    args = parser.parse_args(argv)
+    fields_path = find_fields_yaml(args.fields)
+    if not fields_path.exists():
+        print(msg("fields_not_found", path=fields_path))
+        sys.exit(1)
+    schema = load_schema(fields_path, use_compiled=not args.no_cache)
+    json_files = (
+        [Path(p) for p in args.json]
+        if args.json
+        else sorted(Path(args.dir).glob("*.json")) if Path(args.dir).exists() else []
+    )
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    if args.store:
+        validate = validate_stored
+    else:
+        validate = validate_many if args.no_cache else partial(validate_cached, evict=not args.json)
+    matrix = CoverageMatrix.from_results(validate([p for p in json_files if p.exists()], schema, jobs=jobs), schema)
+    if args.command == "export":
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", newline="") as f:
+                getattr(matrix, f"write_{args.format}")(f)
+        else:
+            getattr(matrix, f"write_{args.format}")(sys.stdout)
+        return
+    if args.command == "missing":
+        unknown = [f for f in args.field if f not in matrix.index]
+        if unknown:
+            print(msg("unknown_fields", fields=", ".join(unknown)))
+            sys.exit(1)
+        if not args.field:
+            items = matrix.items_missing_required()
+            print(msg("items_missing_required", count=len(items), total=len(matrix.items)))
+            print("\n".join(f"  - {item}" for item in items))
+        for field in args.field:
+            items = matrix.items_missing(field)
+            print(msg("field_missing_in", field=field, count=len(items), total=len(matrix.items)))
+            print("\n".join(f"  - {item}" for item in items))
+        return
+
+    required = {matrix.fields[i] for i in _iter_bits(matrix.required_mask)}
+    print(msg("matrix_header", items=len(matrix.items), fields=len(matrix.fields)))
+    print("\n" + msg("fill_rates"))
+    for field, rate in sorted(matrix.fill_rates().items(), key=lambda kv: (kv[1], kv[0])):
+        print(f"  {rate:5.1f}%  {field}{' *' if field in required else ''}")
+    print("\n" + msg("category_gaps"))
+    for category, gap in sorted(matrix.category_gaps().items(), key=lambda kv: -kv[1]["missing_cells"]):
+        print(
+            msg(
+                "category_gap",
+                category=category,
+                cells=gap["missing_cells"],
+                items=gap["items_with_gaps"],
+                total=len(matrix.items),
+            )
+        )
+
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from .locales import DEFAULT_LOCALE, msg, set_locale
+from .cache import schema_digest
+from .schema import NESTED_KEYS, load_schema
+from .validate import use_fast_json, validate_cached, validate_many
+
+DAEMON_TIMEOUT = 30
+CONNECTION_TIMEOUT = 5
+
+
+def default_socket_path():
+    env = os.environ.get("RESEARCH_VALIDATE_SOCKET")
+    if env:
+        return Path(env)
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(os.environ.get("TMPDIR") or "/tmp") / f"research-validate-{uid}.sock"
+
+
+def request_daemon(socket_path, request, connect_timeout=0.5, timeout=None):
+    if not socket_path.exists():
+        return None
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(connect_timeout)
+        sock.connect(str(socket_path))
+        # A busy or wedged daemon must not block the caller; it validates in-process instead.
+        sock.settimeout(DAEMON_TIMEOUT if timeout is None else timeout)
+        sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8"))
+        sock.shutdown(socket.SHUT_WR)
+        response = json.loads(_recv_all(sock))
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+    return None if "error" in response else response
+
+
+def _recv_all(sock):
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            return b"".join(chunks).decode("utf-8")
+        chunks.append(chunk)
+
+
+def _handle_request(request, schemas):
+    if request.get("ping"):
+        return {"pong": True}
+    if request.get("nested_keys") != sorted(NESTED_KEYS):
+        return {"error": "CATEGORY_MAPPING mismatch"}
+    set_locale(request.get("locale", DEFAULT_LOCALE))
+    fields_path = Path(request["fields"])
+    use_cache = request.get("cache", True)
+    st = fields_path.stat()
+    stamp = (st.st_mtime_ns, st.st_size, use_cache)
+    cached = schemas.get(fields_path)
+    if cached is None or cached[0] != stamp:
+        cached = schemas[fields_path] = (stamp, load_schema(fields_path, use_compiled=use_cache))
+    schema = cached[1]
+    validate = validate_cached if use_cache else validate_many
+    json_paths = [Path(p) for p in request["json"]]
+    return {
+        "all_fields": sorted(schema[0]),
+        "required_fields": sorted(schema[1]),
+        "schema": schema_digest(schema),
+        "results": list(validate(json_paths, schema, jobs=request.get("jobs", 1), stream=request.get("stream"))),
+    }
+
+
+def serve(socket_path):
+    import signal
+    import socket
+    if request_daemon(socket_path, {"ping": True}) is not None:
+        print(msg("daemon_running", path=socket_path))
+        sys.exit(1)
+    socket_path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    server.listen()
+    print(msg("listening", path=socket_path))
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    use_fast_json()
+    schemas = {}
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                conn.settimeout(CONNECTION_TIMEOUT)
+                try:
+                    response = _handle_request(json.loads(_recv_all(conn)), schemas)
+                except Exception as e:
+                    response = {"error": f"{type(e).__name__}: {e}"}
+                try:
+                    conn.sendall(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+                except OSError:
+                    pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import unicodedata
+from pathlib import Path
+
+from .cache import file_digest
+from .locales import msg, set_locale
+from .outline import find_outline, load_outline, slugify
+
+INDEX_NAME = ".outline_index.sqlite"
+INDEX_VERSION = "1"
+FUZZY_MIN_LENGTH = 5
+
+_NORMALIZE_STRIP = re.compile(r"[^\w+#]|_")
+_TOKEN_SPLIT = re.compile(r"(?:[^\w+#]|_)+")
+_PARENTHETICAL = re.compile(r"\s*[(（][^)）]*[)）]\s*")
+_ITEMS_KEY = re.compile(r"^items[ \t]*:[ \t]*([^#\n]*?)[ \t]*(?:#.*)?$", re.M)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT NOT NULL, slug TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS keys (key TEXT NOT NULL, kind TEXT NOT NULL, item INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS keys_key ON keys (key, kind);
+"""
+
+
+def normalize_name(name):
+    return _NORMALIZE_STRIP.sub("", unicodedata.normalize("NFKC", str(name)).casefold())
+
+
+def token_key(name):
+    tokens = [t for t in _TOKEN_SPLIT.split(unicodedata.normalize("NFKC", str(name)).casefold()) if t]
+    return " ".join(sorted(tokens)) if len(tokens) > 1 else None
+
+
+def deletes(key):
+    return {key[:i] + key[i + 1 :] for i in range(len(key))} | {key}
+
+
+def edit_distance(a, b, limit=2):
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def fuzzy_limit(key):
+    return 1 if len(key) < 8 else 2
+
+
+def item_keys(name, item=None):
+    key = normalize_name(name)
+    keys = [(key, "name")]
+    tokens = token_key(name)
+    if tokens:
+        keys.append((tokens, "tokens"))
+    aliases = []
+    if isinstance(item, dict):
+        aliases = item.get("aliases") or item.get("alias") or []
+        aliases = [aliases] if isinstance(aliases, str) else list(aliases)
+    stripped = _PARENTHETICAL.sub(" ", str(name)).strip()
+    if stripped and stripped != str(name).strip():
+        aliases.append(stripped)
+    keys.extend((normalize_name(alias), "alias") for alias in aliases if normalize_name(alias))
+    if len(key) >= FUZZY_MIN_LENGTH:
+        keys.extend((variant, "fuzzy") for variant in deletes(key))
+    keys.append((slugify(name).casefold(), "slug"))
+    return keys
+
+
+class ItemIndex:
+    def __init__(self, outline_path, outline=None):
+        self.outline_path = Path(outline_path)
+        self.path = self.outline_path.with_name(INDEX_NAME)
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+        if not self._is_current():
+            self.rebuild(outline if outline is not None else load_outline(self.outline_path))
+
+    def _meta(self):
+        return dict(self.db.execute("SELECT key, value FROM meta"))
+
+    def _outline_stamp(self):
+        st = self.outline_path.stat()
+        return {"size": str(st.st_size), "mtime_ns": str(st.st_mtime_ns)}
+
+    def _is_current(self):
+        meta = self._meta()
+        if meta.get("version") != INDEX_VERSION or not self.outline_path.exists():
+            return False
+        stamp = self._outline_stamp()
+        if all(meta.get(k) == v for k, v in stamp.items()):
+            return True
+        if meta.get("sha256") == file_digest(self.outline_path):
+            self._stamp()
+            self.db.commit()
+            return True
+        return False
+
+    def _stamp(self):
+        meta = {"version": INDEX_VERSION, "sha256": file_digest(self.outline_path), **self._outline_stamp()}
+        self.db.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", meta.items())
+
+    def rebuild(self, outline):
+        with self.db:
+            self.db.execute("DELETE FROM keys")
+            self.db.execute("DELETE FROM items")
+            for item in outline.get("items") or []:
+                name = item.get("name") if isinstance(item, dict) else item
+                if name:
+                    self.add(str(name), item)
+            self._stamp()
+
+    def add(self, name, item=None):
+        cursor = self.db.execute("INSERT INTO items (name, slug) VALUES (?, ?)", (name, slugify(name)))
+        self.db.executemany(
+            "INSERT INTO keys (key, kind, item) VALUES (?, ?, ?)",
+            [(key, kind, cursor.lastrowid) for key, kind in set(item_keys(name, item))],
+        )
+        return cursor.lastrowid
+
+    def _lookup(self, keys, kinds):
+        keys = list(keys)
+        if not keys:
+            return []
+        placeholders = ",".join("?" * len(keys))
+        kind_placeholders = ",".join("?" * len(kinds))
+        return self.db.execute(
+            f"SELECT DISTINCT items.id, items.name, keys.kind FROM keys JOIN items ON items.id = keys.item "
+            f"WHERE keys.key IN ({placeholders}) AND keys.kind IN ({kind_placeholders}) ORDER BY items.id",
+            [*keys, *kinds],
+        ).fetchall()
+
+    def check(self, name, item=None):
+        key = normalize_name(name)
+        own = item_keys(name, item)
+        exact = [k for k, kind in own if kind in ("name", "alias")]
+        matches = self._lookup(exact, ("name", "alias"))
+        tokens = token_key(name)
+        if not matches and tokens:
+            matches = self._lookup([tokens], ("tokens",))
+        if matches:
+            return {"name": name, "status": "duplicate", "matches": [m[1] for m in matches]}
+        slug = slugify(name)
+        collisions = self._lookup([slug.casefold()], ("slug",))
+        if collisions:
+            return {"name": name, "status": "slug_collision", "slug": slug, "matches": [m[1] for m in collisions]}
+        if len(key) >= FUZZY_MIN_LENGTH:
+            near = []
+            for item_id, other, _ in self._lookup(deletes(key), ("fuzzy",)):
+                distance = edit_distance(key, normalize_name(other), fuzzy_limit(key))
+                if distance <= fuzzy_limit(key):
+                    near.append((distance, other))
+            if near:
+                return {"name": name, "status": "near_duplicate", "matches": [other for _, other in sorted(near)]}
+        return {"name": name, "status": "new", "slug": slug}
+
+    def slug_collisions(self):
+        rows = self.db.execute(
+            "SELECT keys.key, items.name FROM keys JOIN items ON items.id = keys.item WHERE keys.kind = 'slug' "
+            "AND keys.key IN (SELECT key FROM keys WHERE kind = 'slug' GROUP BY key HAVING COUNT(*) > 1) "
+            "ORDER BY keys.key, items.id"
+        )
+        collisions = {}
+        for slug, name in rows:
+            collisions.setdefault(slug, []).append(name)
+        return collisions
+
+    def close(self):
+        self.db.close()
+
+
+def load_candidates(path):
+    text = sys.stdin.read() if path == "-" else Path(path).read_text(encoding="utf-8")
+    try:
+        data = json.loads(text)
+    except ValueError:
+        import yaml
+        data = yaml.safe_load(text)
+    if isinstance(data, dict):
+        data = data.get("items") or []
+    return [item for item in data or [] if (item.get("name") if isinstance(item, dict) else item)]
+
+
+def _items_block(text):
+    m = _ITEMS_KEY.search(text)
+    if m is None or m.group(1) not in ("", "[]", "null", "~"):
+        return None
+    end, indent, pos = m.end(1), None, m.end()
+    for line in text[m.end():].splitlines(keepends=True):
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            if line.startswith(("---", "...")) or not (line[0].isspace() or line.startswith("-")):
+                break
+            if indent is None:
+                indent = line[: len(line) - len(line.lstrip())]
+            end = pos + len(line)
+        pos += len(line)
+    return m, end, indent or ""
+
+
+def append_items(outline_path, items):
+    import yaml
+    text = outline_path.read_text(encoding="utf-8")
+    entries = yaml.dump(
+        items,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        allow_unicode=True,
+        sort_keys=False,
+        default_flow_style=False,
+    )
+    block = _items_block(text)
+    if block is not None:
+        m, end, indent = block
+        entries = "".join(indent + line for line in entries.splitlines(keepends=True))
+        if end == m.end(1):
+            key = (text[: m.start(1)] + text[m.end(1) : m.end()]).rstrip(" \t")
+            text = key + "\n" + entries + text[m.end() + 1 :]
+        else:
+            text = text[:end] + ("" if text[:end].endswith("\n") else "\n") + entries + text[end:]
+    else:
+        outline = load_outline(outline_path)
+        if "items" in outline:
+            outline["items"] = (outline["items"] or []) + items
+            text = yaml.dump(
+                outline, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), allow_unicode=True, sort_keys=False
+            )
+        else:
+            text += ("" if not text or text.endswith("\n") else "\n") + "items:\n" + entries
+    tmp = outline_path.with_name(f".{outline_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, outline_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def main(argv=None, locale=None):
+    import argparse
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("dedup_description"))
+    parser.add_argument("--outline", type=str, help=msg("help_outline"))
+    parser.add_argument("--format", choices=("text", "json"), default="text", help=msg("help_format"))
+    sub = parser.add_subparsers(dest="command")
+    check = sub.add_parser("check", help=msg("help_dedup_check"))
+    check.add_argument("name", nargs="*", help=msg("help_dedup_names"))
+    check.add_argument("--from", dest="source", type=str, help=msg("help_dedup_from"))
+    check.add_argument("--apply", action="store_true", help=msg("help_dedup_apply"))
+    check.add_argument("--allow-near", action="store_true", help=msg("help_dedup_allow_near"))
+    sub.add_parser("collisions", help=msg("help_dedup_collisions"))
+    args = parser.parse_args(argv)
+    outline_path = find_outline(args.outline)
+    if outline_path is None or not outline_path.exists():
+        print(msg("outline_not_found", path=outline_path or "outline.yaml"))
+        sys.exit(1)
+    index = ItemIndex(outline_path)
+    try:
+        if args.command != "check":
+            collisions = index.slug_collisions()
+            if args.format == "json":
+                json.dump({"slug_collisions": collisions}, sys.stdout, ensure_ascii=False, indent=2)
+                print()
+            else:
+                print(msg("dedup_collisions", count=len(collisions)))
+                for slug, names in collisions.items():
+                    print(f"  - {slug}.json: {', '.join(names)}")
+            if collisions:
+                sys.exit(1)
+            return
+        candidates = [*args.name, *(load_candidates(args.source) if args.source else [])]
+        accepted = []
+        results = []
+        for candidate in candidates:
+            name = str(candidate.get("name") if isinstance(candidate, dict) else candidate).strip()
+            result = index.check(name, candidate)
+            results.append(result)
+            if result["status"] == "new" or (result["status"] == "near_duplicate" and args.allow_near):
+                index.add(name, candidate)
+                accepted.append(candidate if isinstance(candidate, dict) else {"name": name})
+        if args.apply and accepted:
+            append_items(outline_path, accepted)
+            index._stamp()
+            index.db.commit()
+        else:
+            index.db.rollback()
+        if args.format == "json":
+            json.dump(
+                {"results": results, "accepted": len(accepted), "applied": bool(args.apply)},
+                sys.stdout,
+                ensure_ascii=False,
+                indent=2,
+            )
+            print()
+            return
+        for result in results:
+            matches = ", ".join(result.get("matches", []))
+            print(msg(f"dedup_{result['status']}", name=result["name"], matches=matches, slug=result.get("slug", "")))
+        print(msg("dedup_summary", accepted=len(accepted), total=len(results)))
+        if args.apply and accepted:
+            print(msg("dedup_applied", count=len(accepted), path=outline_path))
+    finally:
+        index.close()
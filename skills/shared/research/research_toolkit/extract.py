@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+import json
+import re
+
+from .schema import UNCERTAIN_MARKERS, nested_keys_for
+
+_SKIP_KEYS = frozenset({"_source_file", "uncertain"})
+_MARKER_BYTES = tuple(marker.encode("utf-8") for marker in (*UNCERTAIN_MARKERS, "\\u"))
+# Characters carried between chunks so that a marker split across them is still found.
+_MARKER_TAIL = max(len(marker) for marker in UNCERTAIN_MARKERS) - 1
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+STREAM_THRESHOLD = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING_BODY = re.compile(r'[^"\\]*')
+_SCALAR_BODY = re.compile(r"[^\s,\]}]*")
+_CONTAINER_BODY = re.compile(r'(?:[^\[\]{}"]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_STRUCTURE_BODY = re.compile(r'[^\[\]{}",:]*')
+# Strings without "[" or a \u escape cannot carry a marker and are skipped without decoding.
+_QUIET_STRING = r'"[^"\\\[]*(?:\\[^u][^"\\\[]*)*"'
+_QUIET_ITEMS = re.compile(rf'(?:[^\[\]{{}}"]+|{_QUIET_STRING})*')
+_QUIET_MEMBERS = re.compile(
+    rf'(?:[^\[\]{{}}"]+|("[^"\\]*(?:\\.[^"\\]*)*")(?=\s*:)|{_QUIET_STRING}(?=\s*[,}}]))*'
+)
+
+
+def is_uncertain(value):
+    stack = [value]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, str):
+            if "[" in obj and any(marker in obj for marker in UNCERTAIN_MARKERS):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, list):
+            stack.extend(obj)
+    return False
+
+
+def may_be_uncertain(raw):
+    return any(marker in raw for marker in _MARKER_BYTES)
+
+
+def extract_json_fields(data, category_mapping=None, uncertain=None, scan_values=True):
+    nested_keys = nested_keys_for(category_mapping)
+    fields = set()
+    stack = [(data, True)]
+    while stack:
+        obj, is_category_level = stack.pop()
+        if isinstance(obj, dict):
+            for k, v in obj.items():
+                if k in _SKIP_KEYS:
+                    if uncertain is not None and k == "uncertain" and isinstance(v, list):
+                        uncertain.update(str(f) for f in v)
+                    continue
+                if is_category_level and k in nested_keys:
+                    if isinstance(v, dict):
+                        stack.append((v, True))
+                    continue
+                fields.add(k)
+                if uncertain is not None and scan_values and is_uncertain(v):
+                    uncertain.add(k)
+        elif isinstance(obj, list):
+            stack.extend((item, is_category_level) for item in obj if isinstance(item, dict))
+    return fields
+
+
+class _JsonStream:
+    def __init__(self, f, chunk_size=STREAM_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _consume(self, pattern, keep=False):
+        parts = []
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if keep:
+                parts.append(m.group())
+            self.pos = m.end()
+            if self.pos < len(self.buf) or not self._fill():
+                return "".join(parts)
+
+    def _char(self):
+        if self.pos >= len(self.buf) and not self._fill():
+            raise ValueError("Unexpected end of JSON input")
+        c = self.buf[self.pos]
+        self.pos += 1
+        return c
+
+    def peek(self):
+        self._consume(_WHITESPACE)
+        return self.buf[self.pos] if self.pos < len(self.buf) else ""
+
+    def next_char(self):
+        self._consume(_WHITESPACE)
+        return self._char()
+
+    def expect(self, expected):
+        c = self.next_char()
+        if c != expected:
+            raise ValueError(f"Expected {expected!r}, got {c!r}")
+
+    def _string_body(self, keep):
+        parts = []
+        while True:
+            body = self._consume(_STRING_BODY, keep)
+            if keep:
+                parts.append(body)
+            if self._char() == '"':
+                return "".join(parts) if keep else None
+            escaped = self._char()
+            if keep:
+                parts.append("\\" + escaped)
+
+    def string(self, keep):
+        body = self._string_body(keep)
+        return json.loads(f'"{body}"') if keep else None
+
+    def skip_value(self, c=None, keep=False):
+        c = self.next_char() if c is None else c
+        parts = [c]
+        if c == '"':
+            parts.append(self._string_body(keep))
+            parts.append('"')
+        elif c in "{[":
+            depth = 1
+            while depth:
+                parts.append(self._consume(_CONTAINER_BODY, keep))
+                c = self._char()
+                if c == '"':
+                    parts.append(f'"{self._string_body(keep)}"')
+                else:
+                    parts.append(c)
+                    depth += 1 if c in "{[" else -1
+        else:
+            parts.append(self._consume(_SCALAR_BODY, keep))
+        return "".join(parts) if keep else None
+
+    def _skip_containers(self, depth):
+        while depth:
+            self._consume(_CONTAINER_BODY)
+            c = self._char()
+            if c == '"':
+                self._string_body(False)
+            else:
+                depth += 1 if c in "{[" else -1
+
+    def _scan_string(self):
+        # Runs between escapes are checked as they are read, so only a few trailing
+        # characters of the string are ever held.
+        tail = ""
+        while True:
+            m = _STRING_BODY.match(self.buf, self.pos)
+            text = tail + m.group()
+            if "[" in text and any(marker in text for marker in UNCERTAIN_MARKERS):
+                self._string_body(False)
+                return True
+            tail = text[-_MARKER_TAIL:]
+            self.pos = m.end()
+            if self.pos == len(self.buf) and self._fill():
+                continue
+            if self._char() == '"':
+                return False
+            c = self._char()
+            if c == "u":
+                c = chr(int("".join(self._char() for _ in range(4)), 16))
+            tail += _ESCAPES.get(c, c)
+
+    def _skip_members(self, key):
+        # Skips quiet members of an object, leaving key[0] set to the key whose value comes next.
+        while True:
+            start = self.pos
+            m = _QUIET_MEMBERS.match(self.buf, start)
+            self.pos = m.end()
+            raw = m.group(1)
+            if raw is not None:
+                pending = self.buf[m.end(1):self.pos].strip() == ":"
+                key[0] = (json.loads(raw) if "\\" in raw else raw[1:-1]) if pending else None
+            elif self.buf[start:self.pos].strip() not in ("", ":"):
+                key[0] = None
+            if self.pos < len(self.buf) or not self._fill():
+                return
+
+    def scan_value(self, c=None):
+        c = self.next_char() if c is None else c
+        if c == '"':
+            return self._scan_string()
+        if c not in "{[":
+            self._consume(_SCALAR_BODY)
+            return False
+        # Once an object has a flagged member it keeps a flag per key (arrays only whether
+        # any element was flagged) so that a repeated key replaces the earlier one, as
+        # json.load does. Until then quiet runs are skipped by the regexes above.
+        stack = [(c == "{", {}, [None])]
+        while True:
+            is_object, flags, key = stack[-1]
+            if not is_object:
+                self._consume(_QUIET_ITEMS)
+            elif flags:
+                self._consume(_STRUCTURE_BODY)
+            else:
+                self._skip_members(key)
+            c = self._char()
+            if c in "{[":
+                stack.append((c == "{", {}, [None]))
+                continue
+            if c in ",}" and key[0] is not None:
+                if flags:
+                    flags[key[0]] = False
+                key[0] = None
+            if c in ",:":
+                continue
+            if c == '"':
+                if is_object and key[0] is None:
+                    key[0] = self.string(True)
+                    continue
+                flag = self._scan_string()
+            else:
+                stack.pop()
+                flag = any(flags.values())
+                if not stack:
+                    return flag
+                is_object, flags, key = stack[-1]
+            # Nothing later in an array can clear its flag, so the rest of a flagged array is skipped.
+            while not is_object and flag:
+                self._skip_containers(1)
+                stack.pop()
+                if not stack:
+                    return True
+                is_object, flags, key = stack[-1]
+            if is_object and (flag or flags):
+                flags[key[0]] = flag
+            key[0] = None
+
+
+def extract_json_fields_stream(f, category_mapping=None, chunk_size=STREAM_CHUNK_SIZE, uncertain=None):
+    nested_keys = nested_keys_for(category_mapping)
+    stream = _JsonStream(f, chunk_size)
+    collect = uncertain is not None
+    c = stream.next_char()
+    if c not in "{[":
+        stream.skip_value(c)
+        return set()
+    # Objects map each key to the fields (and uncertain fields) it contributes
+    # so that a repeated key replaces the earlier one, as json.load does.
+    stack = [(c == "{", {} if c == "{" else set(), {} if c == "{" else set(), None)]
+    while True:
+        is_object, acc, unsure, key_in_parent = stack[-1]
+        c = stream.next_char()
+        if c in "}]":
+            stack.pop()
+            fields = set().union(*acc.values()) if is_object else acc
+            flagged = set().union(*unsure.values()) if is_object else unsure
+            if not stack:
+                if collect:
+                    uncertain.update(flagged)
+                return fields
+            if stack[-1][0]:
+                stack[-1][1][key_in_parent] = fields
+                stack[-1][2][key_in_parent] = flagged
+            else:
+                stack[-1][1].update(fields)
+                stack[-1][2].update(flagged)
+            continue
+        if c == ",":
+            c = stream.next_char()
+        if not is_object:
+            if c == "{":
+                stack.append((True, {}, {}, None))
+            else:
+                stream.skip_value(c)
+            continue
+        if c != '"':
+            raise ValueError(f"Expected object key, got {c!r}")
+        key = stream.string(True)
+        stream.expect(":")
+        if key in _SKIP_KEYS:
+            if collect and key == "uncertain":
+                value = json.loads(stream.skip_value(keep=True))
+                unsure[key] = {str(f) for f in value} if isinstance(value, list) else set()
+            else:
+                stream.skip_value()
+        elif key in nested_keys:
+            if stream.peek() == "{":
+                stream.next_char()
+                stack.append((True, {}, {}, key))
+            else:
+                stream.skip_value()
+                acc[key], unsure[key] = set(), set()
+        else:
+            acc[key] = {key}
+            if collect:
+                unsure[key] = {key} if stream.scan_value() else set()
+            else:
+                stream.skip_value()
+
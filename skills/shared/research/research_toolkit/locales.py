@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+
+DEFAULT_LOCALE = "en"
+
+MESSAGES = {
+    "en": {
+        "unknown_category": "Unknown",
+        "pass": "PASS",
+        "fail": "FAIL",
+        "coverage": "Coverage: {rate:.1f}% ({covered}/{total})",
+        "missing_required": "[ERROR] Missing required fields ({count}):",
+        "missing_optional": "[WARN] Missing optional fields ({count}):",
+        "extra_fields": "[INFO] Extra fields ({count}):",
+        "uncertain_in_file": "[INFO] Uncertain fields ({count}):",
+        "uncertainty_description": "Query uncertain (item, field) cells recorded during validation",
+        "help_uncertain_threshold": "List items whose share of uncertain fields is above this percentage (default: 0)",
+        "help_uncertain_field": "Only consider this field (repeatable)",
+        "help_uncertain_top": "Number of fields and items shown in the summary",
+        "help_uncertain_summary": "Uncertainty rates per field and category (default)",
+        "help_uncertain_cells": "List the uncertain cells of each item above the threshold",
+        "uncertain_header": "Uncertain cells: {cells} in {items}/{total} items",
+        "uncertain_by_field": "Uncertainty by field:",
+        "uncertain_by_category": "Uncertainty by category:",
+        "uncertain_above": "Items above {threshold:g}% ({count}):",
+        "uncertain_cells": "Uncertain cells to research: {pairs} in {items} items",
+        "and_more": "  ... and {count} more",
+        "fields_not_found": "[ERROR] fields.yaml not found: {path}",
+        "field_file": "Field definition file: {path}",
+        "total_fields": "Total fields: {total} (required: {required}, optional: {optional})",
+        "no_json": "[WARN] No JSON files found",
+        "file_not_found": "[WARN] File not found: {path}",
+        "summary": "Summary",
+        "passed": "Validation passed: {passed}/{total}",
+        "average_coverage": "Average coverage: {rate:.1f}%",
+        "daemon_running": "[ERROR] Daemon already running: {path}",
+        "listening": "Listening on {path}",
+        "validate_description": "Validate whether JSON files cover all fields defined in fields.yaml",
+        "help_fields": "Path to fields.yaml",
+        "help_json": "JSON file paths to validate",
+        "help_dir": "Directory containing JSON files",
+        "help_quiet": "Show summary only",
+        "help_jobs": "Number of worker processes (0 = CPU count)",
+        "help_stream": "Extract fields with the streaming parser (default: files over {mb} MB)",
+        "help_no_cache": "Do not use {cache} or the compiled schema",
+        "help_format": "Output format",
+        "help_top": "Number of most often missing fields in the json/ndjson summary",
+        "help_serve": "Run as a validation daemon on a Unix domain socket",
+        "help_socket": "Daemon socket path (default: $RESEARCH_VALIDATE_SOCKET or a per-user temp path)",
+        "help_no_daemon": "Always validate in-process",
+        "help_profile": "Record per-phase timings and bytes read for each file",
+        "help_slowest": "Number of slowest files listed with --profile",
+        "store_description": "Fold validated result JSON files into one SQLite store with a column per field",
+        "help_store": "Read results through the consolidated store {store} (refreshed for new or changed files)",
+        "help_store_build": "Build or refresh the store (default)",
+        "help_store_values": "List all values of one field",
+        "help_store_field": "Field name",
+        "help_include_uncertain": "Include values flagged as uncertain",
+        "store_built": "Store: {path} ({items} items, {updated} updated, {removed} removed)",
+        "store_values": "{field}: {count} values",
+        "store_uncertain": "Items with uncertain fields: {count}/{total}",
+        "timings_header": "Timings",
+        "timings_totals": "Files: {files} (cached: {cached})  Read: {mb:.1f} MB  Wall: {wall:.3f} s  Schema: {schema:.3f} s",
+        "timings_slowest": "Slowest files ({count}, ms):",
+        "coverage_description": "Build a field coverage matrix (items x fields) from result JSON files",
+        "help_include_json": "JSON file paths to include",
+        "help_summary": "Per-field fill rates and per-category gaps (default)",
+        "help_missing": "List items missing the given fields",
+        "help_missing_fields": "Field names (default: items missing any required field)",
+        "help_export": "Export the matrix",
+        "help_export_format": "Export format",
+        "help_output": "Output file (default: stdout)",
+        "unknown_fields": "[ERROR] Unknown fields: {fields}",
+        "items_missing_required": "Items missing required fields ({count}/{total}):",
+        "field_missing_in": "[{field}] missing in {count}/{total} items:",
+        "matrix_header": "Items: {items}  Fields: {fields}",
+        "fill_rates": "Field fill rates:",
+        "category_gaps": "Category gaps:",
+        "category_gap": "  [{category}] missing cells: {cells}, items with gaps: {items}/{total}",
+        "report_description": "Render report.md from research result JSON files",
+        "help_outline": "Path to outline.yaml (default: ./outline.yaml or */outline.yaml)",
+        "help_report_output": "Report path (default: report.md next to outline.yaml)",
+        "help_title": "Report title (default: topic from outline.yaml)",
+        "help_toc_fields": "Comma-separated summary fields for the TOC, optionally field:Label",
+        "help_list_toc_fields": "List fields suitable for the TOC and exit",
+        "table_of_contents": "Table of Contents",
+        "other_info": "Other Info",
+        "uncertain_fields": "Uncertain fields",
+        "toc_candidates": "Summary field candidates:",
+        "toc_candidate": "  {field}: {count}/{total} items (e.g. {example})",
+        "report_written": "Report written: {path} ({count} items)",
+        "help_incremental": "Reuse rendered item sections cached in {cache} and re-render only changed items",
+        "report_rendered": "Re-rendered {rendered}/{count} items",
+        "resume_description": "Plan the next research batch from the resume index in output_dir",
+        "help_limit": "Show at most N items still to research (0 = all)",
+        "outline_not_found": "[ERROR] outline.yaml not found: {path}",
+        "resume_bootstrap": "Building resume index from {count} existing JSON files",
+        "resume_done": "Completed: {done}/{total}",
+        "resume_failed": "Failed validation ({count}):",
+        "resume_todo": "To research ({count}):",
+        "scheduler_description": "Keep N research agent slots filled from the outline's work queue",
+        "help_slots": "Number of parallel agents (default: execution.batch_size)",
+        "help_items_per_agent": "Items per agent (default: execution.items_per_agent)",
+        "help_stale_after": "Re-queue items claimed longer than this many seconds ago",
+        "help_max_attempts": "Stop re-queueing an item after this many launches",
+        "help_next": "Claim items for free slots and print the agents to launch (default)",
+        "help_finished": "Agent IDs that have finished since the last call",
+        "help_sched_status": "Show running agents, queue length and duration estimates",
+        "help_run": "Run the scheduler locally with a simulated or command-line agent",
+        "help_simulate": "Use a simulated agent that sleeps and then writes a complete JSON",
+        "help_agent_cmd": "Shell command run per item; {name}, {output_path} and {fields_path} are substituted",
+        "help_sim_duration": "Base duration in seconds of a simulated item",
+        "help_seed": "Random seed for simulated durations",
+        "sched_launch": "Launch {agent}: {items}",
+        "sched_status": "Running agents: {running} | Queued: {queued} | Done: {done}/{total}",
+        "sched_gave_up": "Not re-queued after {attempts} attempts: {items}",
+        "sched_finished": "All agents finished in {seconds:.1f}s",
+        "sched_estimates": "Average duration by category:",
+        "sched_estimate": "  {category}: {seconds:.1f}s ({count} items)",
+        "dedup_description": "Check new outline items against a dedup index of normalized names, aliases and slugs",
+        "help_dedup_check": "Check candidate items (default)",
+        "help_dedup_names": "Candidate item names",
+        "help_dedup_from": "YAML/JSON file with candidate items (list of names or item dicts, '-' for stdin)",
+        "help_dedup_apply": "Append accepted items to outline.yaml",
+        "help_dedup_allow_near": "Accept near-duplicates as new items",
+        "help_dedup_collisions": "Report existing items that share a JSON file slug",
+        "dedup_new": "[NEW] {name} -> {slug}.json",
+        "dedup_duplicate": "[DUPLICATE] {name} = {matches}",
+        "dedup_near_duplicate": "[NEAR] {name} ~ {matches}",
+        "dedup_slug_collision": "[SLUG COLLISION] {name} -> {slug}.json already used by {matches}",
+        "dedup_summary": "Accepted: {accepted}/{total}",
+        "dedup_applied": "Appended {count} items to {path}",
+        "dedup_collisions": "Slug collisions: {count}",
+        "uncertain_marker": "[uncertain]",
+        "migrate_description": "Patch existing result JSONs after fields.yaml changes and list the (item, field) pairs still to research",
+        "help_dry_run": "Report what would change without writing files",
+        "help_migrate_run": "Diff the schema and patch affected JSONs (default)",
+        "help_migrate_old": "Previous fields.yaml (default: last migration snapshot or the validator's compiled schema)",
+        "help_migrate_pending": "Re-check the recorded (item, field) pairs and list those still to research",
+        "migrate_no_old": "[ERROR] Previous schema unknown: pass --old or keep {snapshot} in output_dir",
+        "migrate_diff": "Schema changes: {added} added, {moved} moved, {removed} removed",
+        "migrate_files": "Patched JSON files: {changed}/{scanned}",
+        "migrate_pending": "Still to research: {pairs} fields in {items} items",
+        "help_migrate_snapshot": "Record the current fields.yaml as the previous schema ({snapshot}) before editing it",
+        "migrate_snapshot": "Schema snapshot written: {path}",
+    },
+    "ja": {
+        "unknown_category": "不明",
+        "pass": "合格",
+        "fail": "不合格",
+        "coverage": "カバレッジ: {rate:.1f}% ({covered}/{total})",
+        "missing_required": "[エラー] 必須フィールドが不足 ({count}件):",
+        "missing_optional": "[警告] オプションフィールドが不足 ({count}件):",
+        "extra_fields": "[情報] 追加フィールド ({count}件):",
+        "uncertain_in_file": "[情報] 不確定フィールド ({count}件):",
+        "uncertainty_description": "検証時に記録された不確定な(項目, フィールド)セルを照会",
+        "help_uncertain_threshold": "不確定フィールドの割合がこの割合(%)を超える項目を一覧 (デフォルト: 0)",
+        "help_uncertain_field": "対象とするフィールド (複数指定可)",
+        "help_uncertain_top": "サマリーに表示するフィールド数と項目数",
+        "help_uncertain_summary": "フィールド別・カテゴリ別の不確定率 (デフォルト)",
+        "help_uncertain_cells": "しきい値を超える項目ごとに不確定なセルを一覧",
+        "uncertain_header": "不確定セル: {cells}件 ({items}/{total}項目)",
+        "uncertain_by_field": "フィールド別の不確定率:",
+        "uncertain_by_category": "カテゴリ別の不確定率:",
+        "uncertain_above": "{threshold:g}%を超える項目 ({count}件):",
+        "uncertain_cells": "調査対象の不確定セル: {pairs}件 ({items}項目)",
+        "and_more": "  ... 他 {count}件",
+        "fields_not_found": "[エラー] fields.yamlが見つかりません: {path}",
+        "field_file": "フィールド定義ファイル: {path}",
+        "total_fields": "総フィールド数: {total} (必須: {required}, オプション: {optional})",
+        "no_json": "[警告] JSONファイルが見つかりません",
+        "file_not_found": "[警告] ファイルが見つかりません: {path}",
+        "summary": "サマリー",
+        "passed": "検証合格: {passed}/{total}",
+        "average_coverage": "平均カバレッジ: {rate:.1f}%",
+        "daemon_running": "[エラー] デーモンは既に起動しています: {path}",
+        "listening": "待ち受け中: {path}",
+        "validate_description": "JSONファイルがfields.yamlで定義されたすべてのフィールドをカバーしているか検証",
+        "help_fields": "fields.yamlへのパス",
+        "help_json": "検証するJSONファイルのパス",
+        "help_dir": "JSONファイルを含むディレクトリ",
+        "help_quiet": "サマリーのみ表示",
+        "help_jobs": "ワーカープロセス数 (0 = CPUコア数)",
+        "help_stream": "ストリーミングパーサーでフィールドを抽出 (デフォルト: {mb} MB超のファイル)",
+        "help_no_cache": "{cache}とコンパイル済みスキーマを使用しない",
+        "help_format": "出力形式",
+        "help_top": "json/ndjsonサマリーに含める不足頻度上位フィールド数",
+        "help_serve": "Unixドメインソケット上で検証デーモンとして起動",
+        "help_socket": "デーモンのソケットパス (デフォルト: $RESEARCH_VALIDATE_SOCKET またはユーザーごとの一時パス)",
+        "help_no_daemon": "常にプロセス内で検証",
+        "help_profile": "ファイルごとのフェーズ別所要時間と読み込みバイト数を記録",
+        "help_slowest": "--profile で表示する遅いファイルの数",
+        "store_description": "検証済みの結果JSONを、フィールドごとの列を持つ1つのSQLiteストアに集約",
+        "help_store": "集約ストア {store} 経由で結果を読み込む (新規・変更ファイルは更新)",
+        "help_store_build": "ストアを構築・更新 (デフォルト)",
+        "help_store_values": "1つのフィールドの全ての値を一覧表示",
+        "help_store_field": "フィールド名",
+        "help_include_uncertain": "不確定とマークされた値も含める",
+        "store_built": "ストア: {path} ({items}件, 更新 {updated}, 削除 {removed})",
+        "store_values": "{field}: {count}件の値",
+        "store_uncertain": "不確定フィールドを含む項目: {count}/{total}",
+        "timings_header": "所要時間",
+        "timings_totals": "ファイル: {files} (キャッシュ: {cached})  読み込み: {mb:.1f} MB  経過: {wall:.3f} s  スキーマ: {schema:.3f} s",
+        "timings_slowest": "遅いファイル ({count}件, ms):",
+        "coverage_description": "結果JSONファイルからフィールドカバレッジ行列 (項目 x フィールド) を構築",
+        "help_include_json": "対象とするJSONファイルのパス",
+        "help_summary": "フィールドごとの充足率とカテゴリごとの不足 (デフォルト)",
+        "help_missing": "指定フィールドが不足している項目を一覧表示",
+        "help_missing_fields": "フィールド名 (デフォルト: 必須フィールドが不足している項目)",
+        "help_export": "行列をエクスポート",
+        "help_export_format": "エクスポート形式",
+        "help_output": "出力ファイル (デフォルト: 標準出力)",
+        "unknown_fields": "[エラー] 未定義のフィールド: {fields}",
+        "items_missing_required": "必須フィールドが不足している項目 ({count}/{total}件):",
+        "field_missing_in": "[{field}] 不足: {count}/{total}件:",
+        "matrix_header": "項目数: {items}  フィールド数: {fields}",
+        "fill_rates": "フィールド充足率:",
+        "category_gaps": "カテゴリ別の不足:",
+        "category_gap": "  [{category}] 不足セル数: {cells}, 不足のある項目: {items}/{total}",
+        "report_description": "調査結果のJSONファイルからreport.mdを生成",
+        "help_outline": "outline.yamlへのパス (デフォルト: ./outline.yaml または */outline.yaml)",
+        "help_report_output": "レポートのパス (デフォルト: outline.yamlと同じディレクトリのreport.md)",
+        "help_title": "レポートのタイトル (デフォルト: outline.yamlのtopic)",
+        "help_toc_fields": "目次に表示するサマリーフィールド (カンマ区切り、field:ラベル 形式も可)",
+        "help_list_toc_fields": "目次に適したフィールドを一覧表示して終了",
+        "table_of_contents": "目次",
+        "other_info": "その他の情報",
+        "uncertain_fields": "不確定なフィールド",
+        "toc_candidates": "サマリーフィールドの候補:",
+        "toc_candidate": "  {field}: {count}/{total}件 (例: {example})",
+        "report_written": "レポートを出力しました: {path} ({count}件)",
+        "help_incremental": "{cache}にキャッシュした項目セクションを再利用し、変更された項目のみ再生成",
+        "report_rendered": "再生成した項目: {rendered}/{count}件",
+        "resume_description": "output_dirの再開インデックスから次のバッチを計画",
+        "help_limit": "表示する未調査項目の最大数 (0 = すべて)",
+        "outline_not_found": "[エラー] outline.yamlが見つかりません: {path}",
+        "resume_bootstrap": "既存のJSONファイル{count}件から再開インデックスを作成しています",
+        "resume_done": "完了: {done}/{total}",
+        "resume_failed": "検証不合格 ({count}件):",
+        "resume_todo": "未調査 ({count}件):",
+        "scheduler_description": "アウトラインの作業キューからN個の調査エージェントスロットを常に埋める",
+        "help_slots": "並列エージェント数 (デフォルト: execution.batch_size)",
+        "help_items_per_agent": "エージェントあたりの項目数 (デフォルト: execution.items_per_agent)",
+        "help_stale_after": "この秒数より前に割り当てた項目を再キューする",
+        "help_max_attempts": "この回数起動した項目は再キューしない",
+        "help_next": "空きスロットに項目を割り当て、起動するエージェントを表示 (デフォルト)",
+        "help_finished": "前回の呼び出し以降に終了したエージェントID",
+        "help_sched_status": "実行中のエージェント、キューの長さ、所要時間の見積もりを表示",
+        "help_run": "シミュレーションまたはコマンドのエージェントでスケジューラをローカル実行",
+        "help_simulate": "スリープ後に完全なJSONを書き込むシミュレーションエージェントを使用",
+        "help_agent_cmd": "項目ごとに実行するシェルコマンド ({name}、{output_path}、{fields_path}を置換)",
+        "help_sim_duration": "シミュレーション項目の基本所要時間 (秒)",
+        "help_seed": "シミュレーション所要時間の乱数シード",
+        "sched_launch": "{agent}を起動: {items}",
+        "sched_status": "実行中のエージェント: {running} | 待機中: {queued} | 完了: {done}/{total}",
+        "sched_gave_up": "{attempts}回試行したため再キューしない項目: {items}",
+        "sched_finished": "すべてのエージェントが{seconds:.1f}秒で終了",
+        "sched_estimates": "カテゴリ別の平均所要時間:",
+        "sched_estimate": "  {category}: {seconds:.1f}秒 ({count}件)",
+        "dedup_description": "正規化した名前・別名・スラッグの重複インデックスで新しい項目を確認",
+        "help_dedup_check": "候補項目を確認 (デフォルト)",
+        "help_dedup_names": "候補項目の名前",
+        "help_dedup_from": "候補項目のYAML/JSONファイル (名前または項目辞書のリスト、'-'で標準入力)",
+        "help_dedup_apply": "受け入れた項目をoutline.yamlに追加",
+        "help_dedup_allow_near": "類似項目も新規項目として受け入れる",
+        "help_dedup_collisions": "同じJSONファイルのスラッグを共有する既存項目を報告",
+        "dedup_new": "[新規] {name} -> {slug}.json",
+        "dedup_duplicate": "[重複] {name} = {matches}",
+        "dedup_near_duplicate": "[類似] {name} ~ {matches}",
+        "dedup_slug_collision": "[スラッグ衝突] {name} -> {slug}.json は {matches} が使用中",
+        "dedup_summary": "受け入れ: {accepted}/{total}",
+        "dedup_applied": "{path}に{count}件の項目を追加しました",
+        "dedup_collisions": "スラッグ衝突: {count}件",
+        "uncertain_marker": "[uncertain]",
+        "migrate_description": "fields.yamlの変更後に既存の結果JSONを修正し、未調査の(項目, フィールド)の組を一覧表示",
+        "help_dry_run": "ファイルを書き込まずに変更内容を表示",
+        "help_migrate_run": "スキーマの差分を取り、影響を受けるJSONを修正 (デフォルト)",
+        "help_migrate_old": "変更前のfields.yaml (デフォルト: 前回の移行スナップショットまたは検証用のコンパイル済みスキーマ)",
+        "help_migrate_pending": "記録された(項目, フィールド)の組を再確認し、未調査のものを表示",
+        "migrate_no_old": "[エラー] 変更前のスキーマが不明です: --oldを指定するか、output_dirに{snapshot}を残してください",
+        "migrate_diff": "スキーマの変更: 追加 {added}、移動 {moved}、削除 {removed}",
+        "migrate_files": "修正したJSONファイル: {changed}/{scanned}",
+        "migrate_pending": "未調査: {items}項目の{pairs}フィールド",
+        "help_migrate_snapshot": "編集前に現在のfields.yamlを変更前のスキーマ ({snapshot}) として記録",
+        "migrate_snapshot": "スキーマのスナップショットを書き込みました: {path}",
+    },
+    "zh": {
+        "unknown_category": "未知",
+        "pass": "通过",
+        "fail": "失败",
+        "coverage": "覆盖率: {rate:.1f}% ({covered}/{total})",
+        "missing_required": "[错误] 缺少必填字段 ({count}):",
+        "missing_optional": "[警告] 缺少可选字段 ({count}):",
+        "extra_fields": "[信息] 额外字段 ({count}):",
+        "uncertain_in_file": "[信息] 不确定字段 ({count}):",
+        "uncertainty_description": "查询验证时记录的不确定 (item, 字段) 单元格",
+        "help_uncertain_threshold": "列出不确定字段占比超过该百分比的item (默认: 0)",
+        "help_uncertain_field": "仅考虑该字段 (可重复指定)",
+        "help_uncertain_top": "摘要中显示的字段和item数量",
+        "help_uncertain_summary": "按字段和分类统计不确定率 (默认)",
+        "help_uncertain_cells": "列出超过阈值的每个item的不确定单元格",
+        "uncertain_header": "不确定单元格: {cells}个, 涉及 {items}/{total} 个item",
+        "uncertain_by_field": "按字段的不确定率:",
+        "uncertain_by_category": "按分类的不确定率:",
+        "uncertain_above": "超过 {threshold:g}% 的item ({count}):",
+        "uncertain_cells": "待研究的不确定单元格: {pairs}个, 涉及 {items} 个item",
+        "and_more": "  ... 还有 {count} 个",
+        "fields_not_found": "[错误] 找不到fields.yaml: {path}",
+        "field_file": "字段定义文件: {path}",
+        "total_fields": "总字段数: {total} (必填: {required}, 可选: {optional})",
+        "no_json": "[警告] 未找到JSON文件",
+        "file_not_found": "[警告] 文件不存在: {path}",
+        "summary": "汇总",
+        "passed": "验证通过: {passed}/{total}",
+        "average_coverage": "平均覆盖率: {rate:.1f}%",
+        "daemon_running": "[错误] 守护进程已在运行: {path}",
+        "listening": "正在监听: {path}",
+        "validate_description": "验证JSON文件是否覆盖fields.yaml中定义的所有字段",
+        "help_fields": "fields.yaml路径",
+        "help_json": "要验证的JSON文件路径",
+        "help_dir": "包含JSON文件的目录",
+        "help_quiet": "仅显示摘要",
+        "help_jobs": "工作进程数 (0 = CPU核心数)",
+        "help_stream": "使用流式解析器提取字段 (默认: 超过{mb} MB的文件)",
+        "help_no_cache": "不使用{cache}和已编译的schema",
+        "help_format": "输出格式",
+        "help_top": "json/ndjson汇总中列出的最常缺失字段数量",
+        "help_serve": "以Unix域套接字验证守护进程方式运行",
+        "help_socket": "守护进程套接字路径 (默认: $RESEARCH_VALIDATE_SOCKET 或按用户区分的临时路径)",
+        "help_no_daemon": "始终在进程内验证",
+        "help_profile": "记录每个文件各阶段耗时和读取字节数",
+        "help_slowest": "--profile 列出的最慢文件数量",
+        "store_description": "将已验证的结果JSON汇总到一个按字段分列的SQLite存储中",
+        "help_store": "通过汇总存储 {store} 读取结果 (新增或修改的文件会被更新)",
+        "help_store_build": "构建或更新存储 (默认)",
+        "help_store_values": "列出某个字段的所有值",
+        "help_store_field": "字段名",
+        "help_include_uncertain": "包含标记为不确定的值",
+        "store_built": "存储: {path} ({items}项, 更新 {updated}, 删除 {removed})",
+        "store_values": "{field}: {count}个值",
+        "store_uncertain": "含不确定字段的项目: {count}/{total}",
+        "timings_header": "耗时",
+        "timings_totals": "文件: {files} (缓存: {cached})  读取: {mb:.1f} MB  总耗时: {wall:.3f} s  Schema: {schema:.3f} s",
+        "timings_slowest": "最慢的文件 ({count}个, ms):",
+        "coverage_description": "根据结果JSON文件构建字段覆盖矩阵 (items x 字段)",
+        "help_include_json": "要包含的JSON文件路径",
+        "help_summary": "各字段填充率和各分类缺口 (默认)",
+        "help_missing": "列出缺少指定字段的items",
+        "help_missing_fields": "字段名 (默认: 缺少必填字段的items)",
+        "help_export": "导出矩阵",
+        "help_export_format": "导出格式",
+        "help_output": "输出文件 (默认: 标准输出)",
+        "unknown_fields": "[错误] 未定义的字段: {fields}",
+        "items_missing_required": "缺少必填字段的items ({count}/{total}):",
+        "field_missing_in": "[{field}] 缺失: {count}/{total} 个items:",
+        "matrix_header": "items数: {items}  字段数: {fields}",
+        "fill_rates": "字段填充率:",
+        "category_gaps": "分类缺口:",
+        "category_gap": "  [{category}] 缺失单元格: {cells}, 有缺口的items: {items}/{total}",
+        "report_description": "根据调研结果JSON文件生成report.md",
+        "help_outline": "outline.yaml路径 (默认: ./outline.yaml 或 */outline.yaml)",
+        "help_report_output": "报告路径 (默认: outline.yaml同目录下的report.md)",
+        "help_title": "报告标题 (默认: outline.yaml中的topic)",
+        "help_toc_fields": "目录中显示的摘要字段 (逗号分隔，可写作 field:标签)",
+        "help_list_toc_fields": "列出适合放入目录的字段后退出",
+        "table_of_contents": "目录",
+        "other_info": "其他信息",
+        "uncertain_fields": "不确定字段",
+        "toc_candidates": "摘要字段候选:",
+        "toc_candidate": "  {field}: {count}/{total} 个items (例: {example})",
+        "report_written": "报告已生成: {path} ({count} 个items)",
+        "help_incremental": "复用{cache}中缓存的item章节，仅重新渲染有变化的item",
+        "report_rendered": "重新渲染的item: {rendered}/{count}",
+        "resume_description": "根据output_dir中的续传索引规划下一批调研",
+        "help_limit": "最多显示N个待调研item (0 = 全部)",
+        "outline_not_found": "[错误] 找不到outline.yaml: {path}",
+        "resume_bootstrap": "正在根据{count}个已有JSON文件建立续传索引",
+        "resume_done": "已完成: {done}/{total}",
+        "resume_failed": "验证失败 ({count}):",
+        "resume_todo": "待调研 ({count}):",
+        "scheduler_description": "从outline的工作队列持续填满N个调研agent槽位",
+        "help_slots": "并行agent数 (默认: execution.batch_size)",
+        "help_items_per_agent": "每个agent处理的item数 (默认: execution.items_per_agent)",
+        "help_stale_after": "认领超过该秒数的item重新入队",
+        "help_max_attempts": "item启动达到该次数后不再重新入队",
+        "help_next": "为空闲槽位认领item并输出需要启动的agent (默认)",
+        "help_finished": "自上次调用以来已结束的agent ID",
+        "help_sched_status": "显示运行中的agent、队列长度和耗时估计",
+        "help_run": "使用模拟agent或命令行agent在本地运行调度器",
+        "help_simulate": "使用先休眠再写入完整JSON的模拟agent",
+        "help_agent_cmd": "每个item执行的shell命令，替换{name}、{output_path}和{fields_path}",
+        "help_sim_duration": "模拟item的基础耗时 (秒)",
+        "help_seed": "模拟耗时的随机种子",
+        "sched_launch": "启动 {agent}: {items}",
+        "sched_status": "运行中的agent: {running} | 排队: {queued} | 已完成: {done}/{total}",
+        "sched_gave_up": "已尝试{attempts}次不再入队: {items}",
+        "sched_finished": "所有agent在{seconds:.1f}秒内完成",
+        "sched_estimates": "各类别平均耗时:",
+        "sched_estimate": "  {category}: {seconds:.1f}秒 ({count} 个items)",
+        "dedup_description": "基于规范化名称、别名和slug的去重索引检查新item",
+        "help_dedup_check": "检查候选item (默认)",
+        "help_dedup_names": "候选item名称",
+        "help_dedup_from": "候选item的YAML/JSON文件 (名称或item字典列表，'-'表示标准输入)",
+        "help_dedup_apply": "将接受的item追加到outline.yaml",
+        "help_dedup_allow_near": "将近似重复项也作为新item接受",
+        "help_dedup_collisions": "报告共用同一JSON文件slug的已有item",
+        "dedup_new": "[新增] {name} -> {slug}.json",
+        "dedup_duplicate": "[重复] {name} = {matches}",
+        "dedup_near_duplicate": "[近似] {name} ~ {matches}",
+        "dedup_slug_collision": "[slug冲突] {name} -> {slug}.json 已被 {matches} 使用",
+        "dedup_summary": "已接受: {accepted}/{total}",
+        "dedup_applied": "已向{path}追加{count}个item",
+        "dedup_collisions": "slug冲突: {count}",
+        "uncertain_marker": "[不确定]",
+        "migrate_description": "fields.yaml变更后修补已有结果JSON，并列出仍需调研的(item, 字段)对",
+        "help_dry_run": "只报告将要修改的内容，不写入文件",
+        "help_migrate_run": "比较schema差异并修补受影响的JSON (默认)",
+        "help_migrate_old": "变更前的fields.yaml (默认: 上次迁移的快照或验证器的编译schema)",
+        "help_migrate_pending": "重新检查记录的(item, 字段)对并列出仍需调研的部分",
+        "migrate_no_old": "[错误] 无法确定变更前的schema: 请指定--old或在output_dir中保留{snapshot}",
+        "migrate_diff": "schema变更: 新增 {added}，移动 {moved}，删除 {removed}",
+        "migrate_files": "已修补的JSON文件: {changed}/{scanned}",
+        "migrate_pending": "仍需调研: {items}个item中的{pairs}个字段",
+        "help_migrate_snapshot": "编辑前将当前fields.yaml记录为变更前的schema ({snapshot})",
+        "migrate_snapshot": "已写入schema快照: {path}",
+    },
+}
+
+_locale = DEFAULT_LOCALE
+
+
+def set_locale(locale):
+    global _locale
+    if locale not in MESSAGES:
+        raise ValueError(f"Unsupported locale: {locale} (available: {', '.join(sorted(MESSAGES))})")
+    _locale = locale
+
+
+def get_locale():
+    return _locale
+
+
+def msg(key, **kwargs):
+    template = MESSAGES[_locale].get(key) or MESSAGES[DEFAULT_LOCALE][key]
+    return template.format(**kwargs) if kwargs else template
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+from pathlib import Path
+
+from .locales import msg, set_locale
+from .outline import find_outline, load_outline, resolve_output_dir
+from .schema import (
+    CATEGORY_MAPPING,
+    NESTED_KEYS,
+    UNCERTAIN_MARKERS,
+    _sha256,
+    category_aliases,
+    compiled_schema_path,
+    load_fields_yaml,
+)
+
+SNAPSHOT_NAME = ".schema_snapshot"
+PENDING_NAME = ".pending_fields"
+
+
+def schema_diff(old, new):
+    old_fields, _, old_categories = old
+    new_fields, _, new_categories = new
+    added = sorted(set(new_fields) - set(old_fields))
+    removed = sorted(set(old_fields) - set(new_fields))
+    moved = sorted(
+        field
+        for field in set(old_fields) & set(new_fields)
+        if old_categories.get(field) != new_categories.get(field)
+    )
+    return added, removed, moved
+
+
+def read_snapshot(output_dir):
+    try:
+        with (Path(output_dir) / SNAPSHOT_NAME).open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return set(data["all_fields"]), set(data["required_fields"]), data["field_categories"]
+
+
+def write_snapshot(output_dir, schema):
+    all_fields, required_fields, field_categories = schema
+    _write_json(
+        Path(output_dir) / SNAPSHOT_NAME,
+        {
+            "all_fields": sorted(all_fields),
+            "required_fields": sorted(required_fields),
+            "field_categories": field_categories,
+        },
+    )
+
+
+def previous_schema(fields_path, output_dir):
+    snapshot = read_snapshot(output_dir)
+    if snapshot is not None:
+        return snapshot
+    try:
+        with compiled_schema_path(Path(fields_path)).open(encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("source") == _sha256(Path(fields_path).read_bytes()):
+        return None
+    return set(data["all_fields"]), set(data["required_fields"]), data["field_categories"]
+
+
+def _write_json(path, data):
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _containers(data):
+    stack = [data]
+    while stack:
+        obj = stack.pop(0)
+        yield obj
+        stack.extend(v for k, v in obj.items() if k in NESTED_KEYS and isinstance(v, dict))
+
+
+def locate(data, field):
+    for container in _containers(data):
+        if field in container:
+            return container
+    return None
+
+
+def is_nested(data):
+    return any(k in NESTED_KEYS and isinstance(v, dict) for k, v in data.items())
+
+
+def category_container(data, category, create=False):
+    aliases = category_aliases(category)
+    for alias in aliases:
+        if isinstance(data.get(alias), dict):
+            return data[alias]
+    if create and aliases[0] in CATEGORY_MAPPING:
+        data[aliases[0]] = {}
+        return data[aliases[0]]
+    return None
+
+
+def is_placeholder(value):
+    return value is None or (isinstance(value, str) and value.strip() in UNCERTAIN_MARKERS)
+
+
+def migrate_item(data, added, moved, field_categories, placeholder):
+    changed = False
+    nested = is_nested(data)
+    uncertain = data.get("uncertain") if isinstance(data.get("uncertain"), list) else []
+    for field in moved:
+        holder = locate(data, field)
+        if holder is None or not nested:
+            continue
+        target = category_container(data, field_categories[field], create=True)
+        if target is not None and target is not holder:
+            target[field] = holder.pop(field)
+            changed = True
+    for field in added:
+        if locate(data, field) is not None:
+            continue
+        target = category_container(data, field_categories[field], create=True) if nested else None
+        (data if target is None else target)[field] = placeholder
+        if field not in uncertain:
+            uncertain.append(field)
+        changed = True
+    if changed:
+        data.pop("uncertain", None)
+        data["uncertain"] = uncertain
+    return changed
+
+
+def pending_fields(data, fields):
+    pending = []
+    for field in fields:
+        holder = locate(data, field)
+        if holder is None or is_placeholder(holder[field]):
+            pending.append(field)
+    return pending
+
+
+def read_pending(output_dir):
+    try:
+        with (Path(output_dir) / PENDING_NAME).open(encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_pending(output_dir, pending):
+    path = Path(output_dir) / PENDING_NAME
+    if pending:
+        _write_json(path, pending)
+    else:
+        path.unlink(missing_ok=True)
+
+
+def migrate_results(output_dir, old, new, placeholder, dry_run=False):
+    output_dir = Path(output_dir)
+    added, removed, moved = schema_diff(old, new)
+    field_categories = new[2]
+    pending = read_pending(output_dir)
+    changed_files = scanned = 0
+    if added or moved:
+        for json_path in sorted(output_dir.glob("*.json")):
+            with json_path.open(encoding="utf-8") as f:
+                try:
+                    data = json.load(f)
+                except ValueError:
+                    continue
+            if not isinstance(data, dict):
+                continue
+            scanned += 1
+            if migrate_item(data, added, moved, field_categories, placeholder):
+                changed_files += 1
+                if not dry_run:
+                    _write_json(json_path, data)
+            fields = sorted(set(pending.get(json_path.stem, [])) | set(pending_fields(data, added)))
+            if fields:
+                pending[json_path.stem] = fields
+    for slug in list(pending):
+        pending[slug] = [field for field in pending[slug] if field in new[0]]
+        if not pending[slug]:
+            del pending[slug]
+    if not dry_run:
+        write_pending(output_dir, pending)
+        write_snapshot(output_dir, new)
+    return {
+        "added": added,
+        "removed": removed,
+        "moved": moved,
+        "scanned": scanned,
+        "changed": changed_files,
+        "pending": pending,
+    }
+
+
+def refresh_pending(output_dir, dry_run=False):
+    output_dir = Path(output_dir)
+    pending = {}
+    for slug, fields in read_pending(output_dir).items():
+        json_path = output_dir / f"{slug}.json"
+        try:
+            with json_path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            pending[slug] = fields
+            continue
+        fields = pending_fields(data, fields) if isinstance(data, dict) else fields
+        if fields:
+            pending[slug] = fields
+    if not dry_run:
+        write_pending(output_dir, pending)
+    return pending
+
+
+def _print_pairs(pending):
+    pairs = sum(len(fields) for fields in pending.values())
+    print(msg("migrate_pending", pairs=pairs, items=len(pending)))
+    for slug, fields in pending.items():
+        print(f"  - {slug}: {', '.join(fields)}")
+
+
+def main(argv=None, locale=None):
+    import argparse
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("migrate_description"))
+    parser.add_argument("--outline", type=str, help=msg("help_outline"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"))
+    parser.add_argument("--format", choices=("text", "json"), default="text", help=msg("help_format"))
+    parser.add_argument("--dry-run", action="store_true", help=msg("help_dry_run"))
+    # Options repeated on each subcommand, so they may also follow it; SUPPRESS keeps the top-level value.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--format", choices=("text", "json"), default=argparse.SUPPRESS, help=msg("help_format"))
+    common.add_argument("--dry-run", action="store_true", default=argparse.SUPPRESS, help=msg("help_dry_run"))
+    sub = parser.add_subparsers(dest="command")
+    run = sub.add_parser("run", parents=[common], help=msg("help_migrate_run"))
+    run.add_argument("--old", type=str, help=msg("help_migrate_old"))
+    sub.add_parser("pending", parents=[common], help=msg("help_migrate_pending"))
+    sub.add_parser("snapshot", parents=[common], help=msg("help_migrate_snapshot", snapshot=SNAPSHOT_NAME))
+    args = parser.parse_args(argv)
+    outline_path = find_outline(args.outline)
+    outline = load_outline(outline_path) if outline_path and outline_path.exists() else {}
+    base = outline_path.parent if outline_path else Path.cwd()
+    fields_path = Path(args.fields) if args.fields else base / "fields.yaml"
+    output_dir = Path(args.dir) if args.dir else resolve_output_dir(outline_path or base / "outline.yaml", outline)
+    if not fields_path.exists():
+        print(msg("fields_not_found", path=fields_path))
+        sys.exit(1)
+    new = load_fields_yaml(fields_path)
+
+    if args.command == "snapshot":
+        output_dir.mkdir(parents=True, exist_ok=True)
+        write_snapshot(output_dir, new)
+        print(msg("migrate_snapshot", path=output_dir / SNAPSHOT_NAME))
+        return
+
+    if args.command == "pending":
+        pending = refresh_pending(output_dir, dry_run=args.dry_run)
+        if args.format == "json":
+            json.dump({"pending": pending}, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+        else:
+            _print_pairs(pending)
+        return
+
+    old = load_fields_yaml(args.old) if getattr(args, "old", None) else previous_schema(fields_path, output_dir)
+    if old is None:
+        print(msg("migrate_no_old", snapshot=SNAPSHOT_NAME))
+        sys.exit(1)
+    report = migrate_results(output_dir, old, new, msg("uncertain_marker"), dry_run=args.dry_run)
+    if args.format == "json":
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+    print(msg("migrate_diff", added=len(report["added"]), moved=len(report["moved"]), removed=len(report["removed"])))
+    for key in ("added", "moved", "removed"):
+        if report[key]:
+            print(f"  {key}: {', '.join(report[key])}")
+    print(msg("migrate_files", changed=report["changed"], scanned=report["scanned"]))
+    _print_pairs(report["pending"])
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import re
+from pathlib import Path
+
+_SLUG_STRIP = re.compile(r"[^\w\-]")
+_MATCH_STRIP = re.compile(r"[\W_]")
+
+
+def load_outline(outline_path):
+    import yaml
+    with Path(outline_path).open(encoding="utf-8") as f:
+        return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+
+def find_outline(path=None):
+    if path:
+        return Path(path)
+    for candidate in (Path.cwd() / "outline.yaml", *sorted(Path.cwd().glob("*/outline.yaml"))):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def resolve_output_dir(outline_path, outline):
+    output_dir = Path((outline.get("execution") or {}).get("output_dir") or "./results")
+    if output_dir.is_absolute():
+        return output_dir
+    beside_outline = outline_path.parent / output_dir
+    return beside_outline if beside_outline.exists() or not output_dir.exists() else output_dir
+
+
+def slugify(name):
+    return _SLUG_STRIP.sub("", "_".join(str(name).split()))
+
+
+def match_key(slug):
+    return _MATCH_STRIP.sub("", slug).lower()
+
+
+def outline_items(outline):
+    items = []
+    for item in outline.get("items") or []:
+        name = item.get("name") if isinstance(item, dict) else item
+        if name:
+            items.append((str(name), slugify(name), item))
+    return items
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+
+from .cache import STORE_NAME, ValidationCache, file_digest
+from .extract import _SKIP_KEYS, is_uncertain
+from .locales import get_locale, msg, set_locale
+from .outline import find_outline, load_outline, resolve_output_dir
+from .schema import NESTED_KEYS, UNCERTAIN_MARKERS, _sha256, category_aliases, find_fields_yaml, load_fields_yaml
+
+LONG_TEXT = 100
+SHORT_LIST = 80
+TOC_CANDIDATE_MAX_LENGTH = 30
+REPORT_CACHE_NAME = ".report_cache"
+REPORT_CACHE_VERSION = 1
+
+_ANCHOR_STRIP = re.compile(r"[^\w\- ]")
+
+
+def load_field_order(fields_path):
+    import yaml
+    with Path(fields_path).open(encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    return [
+        (category["category"], [field["name"] for field in category.get("fields", [])])
+        for category in data.get("field_categories", [])
+    ]
+
+
+def iter_item_fields(data):
+    stack = [data]
+    while stack:
+        obj = stack.pop(0)
+        for k, v in obj.items():
+            if k in _SKIP_KEYS:
+                continue
+            if k in NESTED_KEYS:
+                if isinstance(v, dict):
+                    stack.append(v)
+                continue
+            yield k, v
+
+
+def flatten_item(data):
+    flat = {}
+    for k, v in iter_item_fields(data):
+        flat.setdefault(k, v)
+    return flat
+
+
+def _deep_find(data, field):
+    stack = [data]
+    while stack:
+        obj = stack.pop(0)
+        if isinstance(obj, dict):
+            if field in obj:
+                return obj[field]
+            stack.extend(v for v in obj.values() if isinstance(v, (dict, list)))
+        elif isinstance(obj, list):
+            stack.extend(v for v in obj if isinstance(v, (dict, list)))
+    return None
+
+
+def lookup_field(data, flat, field, category):
+    if field in data:
+        return data[field]
+    for alias in category_aliases(category):
+        section = data.get(alias)
+        if isinstance(section, dict) and field in section:
+            return section[field]
+    if field in flat:
+        return flat[field]
+    return _deep_find(data, field)
+
+
+def is_empty(value):
+    return value is None or (isinstance(value, str) and not value.strip()) or value in ([], {})
+
+
+def github_anchor(text, seen):
+    anchor = _ANCHOR_STRIP.sub("", text.strip().lower()).replace(" ", "-")
+    count = seen.get(anchor, 0)
+    seen[anchor] = count + 1
+    return anchor if count == 0 else f"{anchor}-{count}"
+
+
+def format_inline(value):
+    if isinstance(value, dict):
+        return "; ".join(f"{k}: {format_inline(v)}" for k, v in value.items() if not is_empty(v))
+    if isinstance(value, list):
+        return ", ".join(format_inline(v) for v in value if not is_empty(v))
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return " ".join(str(value).split())
+
+
+def format_value(value):
+    if isinstance(value, list):
+        items = [v for v in value if not is_empty(v)]
+        if items and all(isinstance(v, dict) for v in items):
+            return [" | ".join(f"{k}: {format_inline(v)}" for k, v in item.items() if not is_empty(v)) for item in items]
+        inline = format_inline(items)
+        if len(inline) <= SHORT_LIST:
+            return inline
+        return [format_inline(v) for v in items]
+    if isinstance(value, dict):
+        return format_inline(value)
+    text = str(value).strip()
+    if len(text) > LONG_TEXT:
+        return text.replace("\r\n", "\n").replace("\n", "<br>")
+    return format_inline(text)
+
+
+def render_field(name, value):
+    formatted = format_value(value)
+    if isinstance(formatted, list):
+        return f"- **{name}**:\n" + "".join(f"  - {line}\n" for line in formatted)
+    if len(formatted) > LONG_TEXT:
+        return f"- **{name}**:\n  > {formatted}\n"
+    return f"- **{name}**: {formatted}\n"
+
+
+def item_name(data, flat, fallback):
+    for key in ("name", "item_name", "title"):
+        value = data.get(key, flat.get(key))
+        if isinstance(value, str) and value.strip() and not is_uncertain(value):
+            return value.strip()
+    return fallback
+
+
+def render_item(data, flat, field_order, defined, heading):
+    uncertain = data.get("uncertain") if isinstance(data.get("uncertain"), list) else []
+    skipped = {str(f) for f in uncertain}
+    parts = [f"## {heading}\n"]
+    for category, fields in field_order:
+        lines = []
+        for field in fields:
+            if field in skipped:
+                continue
+            value = lookup_field(data, flat, field, category)
+            if is_empty(value) or is_uncertain(value):
+                continue
+            lines.append(render_field(field, value))
+        if lines:
+            parts.append(f"\n### {category}\n\n" + "".join(lines))
+    extra = [
+        render_field(k, v)
+        for k, v in flat.items()
+        if k not in defined and k not in skipped and not is_empty(v) and not is_uncertain(v)
+    ]
+    if extra or uncertain:
+        parts.append(f"\n### {msg('other_info')}\n\n" + "".join(extra))
+        if uncertain:
+            parts.append(f"- **{msg('uncertain_fields')}**:\n" + "".join(f"  - {f}\n" for f in uncertain))
+    parts.append("\n")
+    return "".join(parts)
+
+
+def toc_summary(data, flat, toc_fields, field_categories):
+    values = []
+    for field, label in toc_fields:
+        value = lookup_field(data, flat, field, field_categories.get(field, ""))
+        if is_empty(value) or is_uncertain(value):
+            continue
+        values.append(f"{label}: {format_inline(value)}")
+    return " | ".join(values)
+
+
+def parse_toc_fields(spec):
+    fields = []
+    for part in (spec or "").split(","):
+        part = part.strip()
+        if part:
+            name, _, label = part.partition(":")
+            fields.append((name.strip(), label.strip() or name.strip()))
+    return fields
+
+
+def _load_item(json_path):
+    with json_path.open(encoding="utf-8") as f:
+        data = json.load(f)
+    return data if isinstance(data, dict) else {"items": data}
+
+
+def iter_items(json_paths, loader=_load_item):
+    for json_path in json_paths:
+        yield json_path, loader(json_path)
+
+
+def toc_candidates(json_paths, exclude=(), loader=_load_item):
+    counts = {}
+    examples = {}
+    total = 0
+    for _, data in iter_items(json_paths, loader):
+        total += 1
+        for k, v in iter_item_fields(data):
+            if k in exclude or is_empty(v) or is_uncertain(v) or isinstance(v, (dict, list)):
+                continue
+            if isinstance(v, str) and len(v) > TOC_CANDIDATE_MAX_LENGTH:
+                continue
+            counts[k] = counts.get(k, 0) + 1
+            examples.setdefault(k, format_inline(v))
+    ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    return [(field, count, total, examples[field]) for field, count in ranked]
+
+
+def report_digest(fields_path, toc_fields):
+    payload = json.dumps(
+        [
+            REPORT_CACHE_VERSION,
+            file_digest(Path(fields_path)),
+            [list(field) for field in toc_fields],
+            get_locale(),
+            sorted(NESTED_KEYS),
+            UNCERTAIN_MARKERS,
+        ],
+        ensure_ascii=False,
+    )
+    return _sha256(payload.encode("utf-8"))
+
+
+class ReportCache(ValidationCache):
+    def __init__(self, directory, report_key):
+        self.fragments = Path(directory) / REPORT_CACHE_NAME
+        self.fragments.mkdir(exist_ok=True)
+        super().__init__(directory, report_key, self.fragments / "index.sqlite")
+
+    def fragment_path(self, json_path):
+        return self.fragments / f"{json_path.name}.md"
+
+    def lookup(self, json_path):
+        entry = super().lookup(json_path)
+        if entry is None or not self.fragment_path(json_path).exists():
+            return None
+        return entry
+
+    def store(self, json_path, entry, section):
+        self.fragment_path(json_path).write_text(section, encoding="utf-8")
+        super().store(json_path, entry)
+
+    def save(self):
+        self.evict_missing()
+        keep = {f"{name}.md" for name in self.names()} | {self.path.name, f"{self.path.name}-journal"}
+        for path in self.fragments.iterdir():
+            if path.name not in keep and not path.name.endswith(".tmp"):
+                path.unlink(missing_ok=True)
+        super().save()
+        self.close()
+
+
+def write_report(output_path, json_paths, fields_path, title, toc_fields=(), cache_dir=None, loader=_load_item):
+    output_path = Path(output_path)
+    field_order = load_field_order(fields_path)
+    all_fields, _, field_categories = load_fields_yaml(fields_path)
+    cache = ReportCache(cache_dir, report_digest(fields_path, toc_fields)) if cache_dir else None
+    toc = []
+    seen = {}
+    rendered = 0
+    body_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.body")
+    tmp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with body_path.open("w", encoding="utf-8") as body:
+            for json_path in json_paths:
+                entry = cache.lookup(json_path) if cache else None
+                if entry is not None:
+                    with cache.fragment_path(json_path).open(encoding="utf-8") as fragment:
+                        shutil.copyfileobj(fragment, body)
+                else:
+                    data = loader(json_path)
+                    flat = flatten_item(data)
+                    name = item_name(data, flat, json_path.stem)
+                    section = render_item(data, flat, field_order, all_fields, name)
+                    entry = {"name": name, "summary": toc_summary(data, flat, toc_fields, field_categories)}
+                    body.write(section)
+                    rendered += 1
+                    if cache:
+                        cache.store(json_path, entry, section)
+                toc.append((entry["name"], github_anchor(entry["name"], seen), entry["summary"]))
+        with tmp_path.open("w", encoding="utf-8") as out:
+            out.write(f"# {title}\n\n## {msg('table_of_contents')}\n\n")
+            for i, (name, anchor, summary) in enumerate(toc, 1):
+                out.write(f"{i}. [{name}](#{anchor})" + (f" - {summary}" if summary else "") + "\n")
+            out.write("\n---\n\n")
+            with body_path.open(encoding="utf-8") as body:
+                shutil.copyfileobj(body, out)
+        os.replace(tmp_path, output_path)
+    finally:
+        body_path.unlink(missing_ok=True)
+        tmp_path.unlink(missing_ok=True)
+    if cache:
+        cache.save()
+    return len(toc), rendered
+
+
+def main(argv=None, locale=None):
+    import argparse
+    from .store import ResultStore
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("report_description"))
+    parser.add_argument("--outline", type=str, help=msg("help_outline"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"))
+    parser.add_argument("--output", "-o", type=str, help=msg("help_report_output"))
+    parser.add_argument("--title", type=str, help=msg("help_title"))
+    parser.add_argument("--toc-fields", type=str, default="", help=msg("help_toc_fields"))
+    parser.add_argument("--list-toc-fields", action="store_true", help=msg("help_list_toc_fields"))
+    parser.add_argument("--incremental", "-i", action="store_true", help=msg("help_incremental", cache=REPORT_CACHE_NAME))
+    parser.add_argument("--store", action="store_true", help=msg("help_store", store=STORE_NAME))
+    args = parser.parse_args(argv)
+    outline_path = find_outline(args.outline)
+    outline = load_outline(outline_path) if outline_path and outline_path.exists() else {}
+    base = outline_path.parent if outline_path else Path.cwd()
+    fields_path = Path(args.fields) if args.fields else find_fields_yaml(base / "fields.yaml")
+    if not fields_path.exists():
+        print(msg("fields_not_found", path=fields_path))
+        sys.exit(1)
+    results_dir = Path(args.dir) if args.dir else resolve_output_dir(outline_path or base / "outline.yaml", outline)
+    json_paths = sorted(results_dir.glob("*.json")) if results_dir.exists() else []
+    if not json_paths:
+        print(msg("no_json"))
+        sys.exit(1)
+    if args.store:
+        from .schema import load_schema
+        store = ResultStore(results_dir, load_schema(fields_path))
+        store.refresh(json_paths)
+        loader = store.load
+    else:
+        store, loader = None, _load_item
+    try:
+        if args.list_toc_fields:
+            print(msg("toc_candidates"))
+            for field, count, total, example in toc_candidates(json_paths, exclude={"name"}, loader=loader):
+                print(msg("toc_candidate", field=field, count=count, total=total, example=example))
+            return
+        output_path = Path(args.output) if args.output else base / "report.md"
+        title = args.title or outline.get("topic") or base.name
+        cache_dir = results_dir if args.incremental else None
+        toc_fields = parse_toc_fields(args.toc_fields)
+        count, rendered = write_report(output_path, json_paths, fields_path, title, toc_fields, cache_dir, loader)
+    finally:
+        if store:
+            store.close()
+    print(msg("report_written", path=output_path, count=count))
+    if args.incremental:
+        print(msg("report_rendered", rendered=rendered, count=count))
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .cache import schema_digest
+from .locales import msg, set_locale
+from .outline import find_outline, load_outline, match_key, outline_items, resolve_output_dir
+from .state import ResearchState, sync_state
+
+SCHEDULE_NAME = ".research_schedule"
+SCHEDULE_VERSION = 1
+STALE_AFTER = 3600
+MAX_ATTEMPTS = 2
+
+
+def item_category(item):
+    return str(item.get("category") or "") if isinstance(item, dict) else ""
+
+
+class Scheduler:
+    def __init__(
+        self,
+        output_dir,
+        items,
+        slots=1,
+        items_per_agent=1,
+        stale_after=STALE_AFTER,
+        max_attempts=MAX_ATTEMPTS,
+        schema_key=None,
+    ):
+        self.output_dir = Path(output_dir)
+        self.schema_key = schema_key
+        self.path = self.output_dir / SCHEDULE_NAME
+        self.items = items
+        self.slots = max(1, slots)
+        self.items_per_agent = max(1, items_per_agent)
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self.claims = {}
+        self.attempts = {}
+        self.durations = {}
+        self.next_agent = 1
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") == SCHEDULE_VERSION:
+            self.claims = data.get("claims", {})
+            self.attempts = data.get("attempts", {})
+            self.durations = data.get("durations", {})
+            self.next_agent = data.get("next_agent", 1)
+        self.state = ResearchState(self.output_dir, schema_key)
+
+    def estimate(self, category):
+        count, total = self.durations.get(category, (0, 0.0))
+        if count:
+            return total / count
+        counts = sum(c for c, _ in self.durations.values())
+        return sum(t for _, t in self.durations.values()) / counts if counts else 0.0
+
+    def running(self):
+        return sorted({claim["agent"] for claim in self.claims.values()}, key=lambda a: int(a.split("-")[-1]))
+
+    def refresh(self, finished=()):
+        self.state = ResearchState(self.output_dir, self.schema_key)
+        by_key = {match_key(slug): entry for slug, entry in self.state.entries.items()}
+        cursors = {}
+        completed = []
+        for slug, claim in self.claims.items():
+            entry = by_key.get(match_key(slug))
+            if entry and entry["valid"] and entry["mtime_ns"] / 1e9 >= claim["started"]:
+                completed.append((entry["mtime_ns"] / 1e9, slug, claim))
+        for finished_at, slug, claim in sorted(completed):
+            start = max(claim["started"], cursors.get(claim["agent"], 0.0))
+            cursors[claim["agent"]] = finished_at
+            count, total = self.durations.get(claim["category"], (0, 0.0))
+            self.durations[claim["category"]] = [count + 1, total + max(0.0, finished_at - start)]
+            self.attempts.pop(slug, None)
+            del self.claims[slug]
+        now = time.time()
+        finished = set(finished)
+        for slug in [
+            slug
+            for slug, claim in self.claims.items()
+            if claim["agent"] in finished or now - claim["started"] > self.stale_after
+        ]:
+            del self.claims[slug]
+
+    def queue(self):
+        done, failed, stale, pending = self.state.plan(self.items)
+        for _, slug, _ in done:
+            self.attempts.pop(slug, None)
+        waiting = {slug for _, slug, _ in failed + stale + pending}
+        order = {slug: i for i, (_, slug, _) in enumerate(self.items)}
+        queued = [
+            (name, slug, item)
+            for name, slug, item in self.items
+            if slug in waiting and slug not in self.claims and self.attempts.get(slug, 0) < self.max_attempts
+        ]
+        queued.sort(key=lambda entry: (-self.estimate(item_category(entry[2])), order[entry[1]]))
+        gave_up = [
+            name
+            for name, slug, _ in self.items
+            if slug in waiting and slug not in self.claims and self.attempts.get(slug, 0) >= self.max_attempts
+        ]
+        return done, queued, gave_up
+
+    def next(self, finished=()):
+        self.refresh(finished)
+        _, queued, _ = self.queue()
+        launches = []
+        free = self.slots - len(self.running())
+        now = time.time()
+        while free > 0 and queued:
+            batch, queued = queued[: self.items_per_agent], queued[self.items_per_agent :]
+            agent = f"agent-{self.next_agent}"
+            self.next_agent += 1
+            for name, slug, item in batch:
+                self.claims[slug] = {"agent": agent, "name": name, "category": item_category(item), "started": now}
+                self.attempts[slug] = self.attempts.get(slug, 0) + 1
+            launches.append((agent, batch))
+            free -= 1
+        return launches
+
+    def output_path(self, slug):
+        return (self.output_dir / f"{slug}.json").resolve()
+
+    def save(self):
+        data = {
+            "version": SCHEDULE_VERSION,
+            "claims": self.claims,
+            "attempts": self.attempts,
+            "durations": self.durations,
+            "next_agent": self.next_agent,
+        }
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{SCHEDULE_NAME}.{os.getpid()}.tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def status(self):
+        done, queued, gave_up = self.queue()
+        return {
+            "total": len(self.items),
+            "done": len(done),
+            "queued": len(queued),
+            "running": self.running(),
+            "gave_up": gave_up,
+        }
+
+
+def simulated_agent(fields_path, duration):
+    from .schema import load_fields_yaml
+    all_fields, _, _ = load_fields_yaml(fields_path)
+
+    def run(name, output_path, item):
+        time.sleep(duration(item))
+        data = {field: f"simulated {field}" for field in sorted(all_fields)}
+        data["name"] = name
+        data["uncertain"] = []
+        tmp = output_path.with_name(f".{output_path.name}.tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, output_path)
+
+    return run
+
+
+def command_agent(template, fields_path):
+    import shlex
+    import subprocess
+
+    def run(name, output_path, item):
+        command = template.format(
+            name=shlex.quote(name),
+            output_path=shlex.quote(str(output_path)),
+            fields_path=shlex.quote(str(fields_path)),
+        )
+        subprocess.run(command, shell=True, check=False)
+
+    return run
+
+
+def _run_agent(action, schema, batch, output_path):
+    from .validate import validate_json
+    for name, slug, item in batch:
+        path = output_path(slug)
+        action(name, path, item)
+        if path.exists():
+            state = ResearchState(path.parent, schema_digest(schema), load=False)
+            state.record(path, validate_json(path, *schema))
+            state.flush()
+
+
+def run_local(scheduler, fields_path, action, on_launch=None):
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+    from .schema import load_schema
+    schema = load_schema(fields_path)
+    running = {}
+    finished = []
+    with ThreadPoolExecutor(max_workers=scheduler.slots) as pool:
+        while True:
+            for agent, batch in scheduler.next(finished):
+                if on_launch:
+                    on_launch(agent, batch)
+                running[pool.submit(_run_agent, action, schema, batch, scheduler.output_path)] = agent
+            scheduler.save()
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            finished = []
+            for future in done:
+                finished.append(running.pop(future))
+                future.result()
+
+
+def _print_launch(agent, batch):
+    print(msg("sched_launch", agent=agent, items=", ".join(name for name, _, _ in batch)), flush=True)
+
+
+def main(argv=None, locale=None):
+    import argparse
+    from .schema import load_schema
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("scheduler_description"))
+    parser.add_argument("--outline", type=str, help=msg("help_outline"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"))
+    parser.add_argument("--slots", type=int, help=msg("help_slots"))
+    parser.add_argument("--items-per-agent", type=int, help=msg("help_items_per_agent"))
+    parser.add_argument("--stale-after", type=float, default=STALE_AFTER, help=msg("help_stale_after"))
+    parser.add_argument("--max-attempts", type=int, default=MAX_ATTEMPTS, help=msg("help_max_attempts"))
+    sub = parser.add_subparsers(dest="command")
+    nxt = sub.add_parser("next", help=msg("help_next"))
+    nxt.add_argument("--finished", nargs="*", default=[], help=msg("help_finished"))
+    nxt.add_argument("--format", choices=("text", "json"), default="text", help=msg("help_format"))
+    sub.add_parser("status", help=msg("help_sched_status"))
+    run = sub.add_parser("run", help=msg("help_run"))
+    agent = run.add_mutually_exclusive_group(required=True)
+    agent.add_argument("--simulate", action="store_true", help=msg("help_simulate"))
+    agent.add_argument("--agent-cmd", type=str, help=msg("help_agent_cmd"))
+    run.add_argument("--sim-duration", type=float, default=0.2, help=msg("help_sim_duration"))
+    run.add_argument("--seed", type=int, default=0, help=msg("help_seed"))
+    args = parser.parse_args(argv)
+    outline_path = find_outline(args.outline)
+    if outline_path is None or not outline_path.exists():
+        print(msg("outline_not_found", path=outline_path or "outline.yaml"))
+        sys.exit(1)
+    outline = load_outline(outline_path)
+    execution = outline.get("execution") or {}
+    fields_path = Path(args.fields) if args.fields else outline_path.parent / "fields.yaml"
+    output_dir = Path(args.dir) if args.dir else resolve_output_dir(outline_path, outline)
+    schema = load_schema(fields_path) if fields_path.exists() else None
+    scheduler = Scheduler(
+        output_dir,
+        outline_items(outline),
+        slots=args.slots or int(execution.get("batch_size") or 1),
+        items_per_agent=args.items_per_agent or int(execution.get("items_per_agent") or 1),
+        stale_after=args.stale_after,
+        max_attempts=args.max_attempts,
+        schema_key=schema_digest(schema) if schema else None,
+    )
+    if schema:
+        sync_state(scheduler.state, schema, scheduler.items)
+
+    if args.command == "run":
+        if not fields_path.exists():
+            print(msg("fields_not_found", path=fields_path))
+            sys.exit(1)
+        if args.simulate:
+            import random
+            rng = random.Random(args.seed)
+            weights = {}
+
+            def duration(item):
+                category = item_category(item)
+                weight = weights.setdefault(category, 1 + len(weights) % 3)
+                return args.sim_duration * weight * rng.uniform(0.8, 1.2)
+
+            action = simulated_agent(fields_path, duration)
+        else:
+            action = command_agent(args.agent_cmd, fields_path)
+        started = time.perf_counter()
+        run_local(scheduler, fields_path, action, on_launch=_print_launch)
+        print(msg("sched_finished", seconds=time.perf_counter() - started))
+        _print_status(scheduler)
+        return
+
+    if args.command == "status":
+        scheduler.refresh()
+        _print_status(scheduler)
+        return
+
+    launches = scheduler.next(args.finished if args.command == "next" else ())
+    scheduler.save()
+    status = scheduler.status()
+    if getattr(args, "format", "text") == "json":
+        status["launch"] = [
+            {
+                "agent": agent,
+                "items": [
+                    {"name": name, "slug": slug, "output_path": str(scheduler.output_path(slug)), "item": item}
+                    for name, slug, item in batch
+                ],
+            }
+            for agent, batch in launches
+        ]
+        json.dump(status, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+    for agent, batch in launches:
+        _print_launch(agent, batch)
+    _print_status(scheduler, status)
+
+
+def _print_status(scheduler, status=None):
+    status = status or scheduler.status()
+    print(
+        msg(
+            "sched_status",
+            running=len(status["running"]),
+            queued=status["queued"],
+            done=status["done"],
+            total=status["total"],
+        )
+    )
+    if status["gave_up"]:
+        print(msg("sched_gave_up", attempts=scheduler.max_attempts, items=", ".join(status["gave_up"])))
+    if scheduler.durations:
+        print(msg("sched_estimates"))
+        for category, (count, total) in sorted(scheduler.durations.items(), key=lambda kv: -kv[1][1] / kv[1][0]):
+            print(msg("sched_estimate", category=category or "-", seconds=total / count, count=count))
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+from pathlib import Path
+
+CATEGORY_MAPPING = {
+    "basic_info": ["basic_info", "Basic Info", "基本情報", "基本信息"],
+    "technical_features": [
+        "technical_features",
+        "technical_characteristics",
+        "Technical Features",
+        "技術的特徴",
+        "技术特性",
+    ],
+    "performance_metrics": ["performance_metrics", "performance", "Performance Metrics", "性能指標", "性能指标"],
+    "milestone_significance": [
+        "milestone_significance",
+        "milestones",
+        "Milestone Significance",
+        "マイルストーン・重要性",
+        "里程碑意义",
+    ],
+    "business_info": ["business_info", "commercial_info", "Business Info", "ビジネス情報", "商业信息"],
+    "competition_ecosystem": [
+        "competition_ecosystem",
+        "competition",
+        "Competition Ecosystem",
+        "Competition & Ecosystem",
+        "競合・エコシステム",
+        "竞争与生态",
+    ],
+    "history": ["history", "History", "歴史", "历史沿革"],
+    "market_positioning": ["market_positioning", "market", "Market Positioning", "市場ポジショニング", "市场定位"],
+}
+
+NESTED_KEYS = frozenset(k for keys in CATEGORY_MAPPING.values() for k in keys)
+
+UNCERTAIN_MARKERS = ("[uncertain]", "[不确定]", "[不確定]")
+
+COMPILED_SUFFIX = ".compiled.json"
+COMPILED_VERSION = 2
+
+
+def category_aliases(category):
+    for canonical, aliases in CATEGORY_MAPPING.items():
+        if category == canonical or category in aliases:
+            return [canonical, *aliases]
+    return [category]
+
+
+def nested_keys_for(category_mapping=None):
+    if category_mapping is None:
+        return NESTED_KEYS
+    return {k for keys in category_mapping.values() for k in keys}
+
+
+def find_fields_yaml(path):
+    fields_path = Path(path)
+    if not fields_path.exists():
+        for p in (Path.cwd() / "fields.yaml", Path.cwd().parent / "fields.yaml"):
+            if p.exists():
+                return p
+    return fields_path
+
+
+def _parse_fields(data):
+    items = [
+        (field["name"], category["category"], field.get("required", False))
+        for category in data.get("field_categories", [])
+        for field in category.get("fields", [])
+    ]
+    all_fields = {name for name, _, _ in items}
+    required_fields = {name for name, _, required in items if required}
+    field_categories = {name: category for name, category, _ in items}
+    return all_fields, required_fields, field_categories
+
+
+def load_fields_yaml(fields_path):
+    import yaml
+    with Path(fields_path).open(encoding="utf-8") as f:
+        return _parse_fields(yaml.safe_load(f))
+
+
+def compiled_schema_path(fields_path):
+    return fields_path.with_name(f".{fields_path.name}{COMPILED_SUFFIX}")
+
+
+def _sha256(data):
+    import hashlib
+    return hashlib.sha256(data).hexdigest()
+
+
+def _load_compiled_schema(compiled_path, fields_path):
+    with compiled_path.open(encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != COMPILED_VERSION or data.get("nested_keys") != sorted(NESTED_KEYS):
+        return None
+    st = fields_path.stat()
+    if (data.get("size"), data.get("mtime_ns")) != (st.st_size, st.st_mtime_ns):
+        if data.get("source") != _sha256(fields_path.read_bytes()):
+            return None
+        # Same content under a new stamp (checkout, touch): re-stamp so later loads skip the hash.
+        _write_compiled_data(compiled_path, {**data, "size": st.st_size, "mtime_ns": st.st_mtime_ns})
+    return frozenset(data["all_fields"]), frozenset(data["required_fields"]), data["field_categories"]
+
+
+def _write_compiled_schema(compiled_path, fields_path, schema, source):
+    all_fields, required_fields, field_categories = schema
+    st = fields_path.stat()
+    data = {
+        "version": COMPILED_VERSION,
+        "source": _sha256(source),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "all_fields": sorted(all_fields),
+        "required_fields": sorted(required_fields),
+        "field_categories": field_categories,
+        "nested_keys": sorted(NESTED_KEYS),
+    }
+    _write_compiled_data(compiled_path, data)
+
+
+def _write_compiled_data(compiled_path, data):
+    tmp = compiled_path.with_name(f"{compiled_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, compiled_path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def load_schema(fields_path, use_compiled=True):
+    fields_path = Path(fields_path)
+    if not use_compiled:
+        return load_fields_yaml(fields_path)
+    compiled_path = compiled_schema_path(fields_path)
+    try:
+        schema = _load_compiled_schema(compiled_path, fields_path)
+        if schema is not None:
+            return schema
+    except (OSError, ValueError, KeyError):
+        pass
+    import yaml
+    source = fields_path.read_bytes()
+    all_fields, required_fields, field_categories = _parse_fields(yaml.safe_load(source.decode("utf-8")))
+    schema = frozenset(all_fields), frozenset(required_fields), field_categories
+    _write_compiled_schema(compiled_path, fields_path, schema, source)
+    return schema
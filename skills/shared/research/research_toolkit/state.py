@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from .locales import msg, set_locale
+from .outline import find_outline, load_outline, match_key, outline_items, resolve_output_dir
+
+STATE_NAME = ".research_state"
+STATE_VERSION = 1
+COMPACT_SLACK = 256
+
+
+def _now():
+    return time.strftime("%Y-%m-%dT%H:%M:%S%z")
+
+
+class ResearchState:
+    def __init__(self, directory, schema_key=None, load=True):
+        self.directory = Path(directory)
+        self.path = self.directory / STATE_NAME
+        self.schema_key = schema_key
+        self.loaded = load
+        self.entries = {}
+        self.lines = 0
+        self.pending = []
+        if not load:
+            return
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record.get("version") == STATE_VERSION:
+                        previous = self.entries.get(record["slug"])
+                        if previous:
+                            record["first_seen"] = previous["first_seen"]
+                        self.entries[record["slug"]] = record
+                        self.lines += 1
+        except OSError:
+            pass
+
+    def exists(self):
+        return self.path.exists()
+
+    def record(self, json_path, result):
+        json_path = Path(json_path)
+        try:
+            st = json_path.stat()
+        except OSError:
+            return
+        slug = json_path.stem
+        previous = self.entries.get(slug, {})
+        coverage = round(result["coverage_rate"], 1)
+        uncertain = result.get("uncertain_fields", [])
+        if (
+            previous.get("size") == st.st_size
+            and previous.get("mtime_ns") == st.st_mtime_ns
+            and previous.get("valid") == result["valid"]
+            and previous.get("coverage") == coverage
+            and previous.get("uncertain") == uncertain
+            and previous.get("schema") == self.schema_key
+        ):
+            return
+        now = _now()
+        entry = {
+            "version": STATE_VERSION,
+            "slug": slug,
+            "file": json_path.name,
+            "status": "done" if result["valid"] else "failed",
+            "valid": result["valid"],
+            "coverage": coverage,
+            "missing_required": result["missing_required"],
+            "uncertain": uncertain,
+            "schema": self.schema_key,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "first_seen": previous.get("first_seen", now),
+            "validated_at": now,
+        }
+        self.entries[slug] = entry
+        self.pending.append(entry)
+
+    def is_current(self, entry):
+        if self.schema_key is not None and entry.get("schema") != self.schema_key:
+            return False
+        try:
+            st = (self.directory / entry["file"]).stat()
+        except OSError:
+            return False
+        return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+
+    def flush(self):
+        if not self.pending:
+            return
+        data = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in self.pending).encode("utf-8")
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError:
+            return
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        self.lines += len(self.pending)
+        self.pending = []
+
+    def compact(self):
+        self.flush()
+        if not self.loaded or self.lines <= len(self.entries) + COMPACT_SLACK:
+            return
+        tmp = self.path.with_name(f"{STATE_NAME}.{os.getpid()}.tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                for entry in self.entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            os.replace(tmp, self.path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return
+        self.lines = len(self.entries)
+
+    def plan(self, items):
+        by_key = {match_key(slug): entry for slug, entry in self.entries.items()}
+        done, failed, stale, pending = [], [], [], []
+        for name, slug, _ in items:
+            entry = by_key.get(match_key(slug))
+            if entry is None:
+                pending.append((name, slug, None))
+            elif not self.is_current(entry):
+                stale.append((name, slug, entry))
+            elif entry["valid"]:
+                done.append((name, slug, entry))
+            else:
+                failed.append((name, slug, entry))
+        return done, failed, stale, pending
+
+
+def record_results(json_paths, results, schema_key=None, create=False):
+    # Directory runs load the entries so unchanged results are not appended again;
+    # single-file runs only append.
+    states = {}
+    try:
+        for json_path, result in zip(json_paths, results):
+            json_path = Path(json_path)
+            if json_path.parent not in states:
+                state = ResearchState(json_path.parent, schema_key, load=create)
+                states[json_path.parent] = state if create or state.exists() else None
+            if states[json_path.parent] is not None:
+                states[json_path.parent].record(json_path, result)
+            yield result
+    finally:
+        for state in states.values():
+            if state is not None:
+                state.compact()
+
+
+def _validate_into(state, schema, json_paths):
+    from .validate import validate_cached
+    json_paths = [p for p in json_paths if p.exists()]
+    for json_path, result in zip(json_paths, validate_cached(json_paths, schema)):
+        state.record(json_path, result)
+    state.flush()
+
+
+def sync_state(state, schema, items):
+    if not state.exists() and state.directory.exists():
+        wanted = {match_key(slug) for _, slug, _ in items}
+        json_paths = [p for p in sorted(state.directory.glob("*.json")) if match_key(p.stem) in wanted]
+        print(msg("resume_bootstrap", count=len(json_paths)), file=sys.stderr)
+        _validate_into(state, schema, json_paths)
+    _, _, stale, pending = state.plan(items)
+    # Results written without a validation run (e.g. after the state was created) have no entry yet.
+    json_paths = [state.directory / entry["file"] for _, _, entry in stale]
+    json_paths += [p for p in (state.directory / f"{slug}.json" for _, slug, _ in pending) if p.exists()]
+    if json_paths:
+        _validate_into(state, schema, json_paths)
+
+
+def main(argv=None, locale=None):
+    import argparse
+    from .cache import schema_digest
+    from .schema import load_schema
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("resume_description"))
+    parser.add_argument("--outline", type=str, help=msg("help_outline"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"))
+    parser.add_argument("--format", choices=("text", "json"), default="text", help=msg("help_format"))
+    parser.add_argument("--limit", type=int, default=0, help=msg("help_limit"))
+    args = parser.parse_args(argv)
+    outline_path = find_outline(args.outline)
+    if outline_path is None or not outline_path.exists():
+        print(msg("outline_not_found", path=outline_path or "outline.yaml"))
+        sys.exit(1)
+    outline = load_outline(outline_path)
+    fields_path = Path(args.fields) if args.fields else outline_path.parent / "fields.yaml"
+    output_dir = Path(args.dir) if args.dir else resolve_output_dir(outline_path, outline)
+    items = outline_items(outline)
+    schema = load_schema(fields_path) if fields_path.exists() else None
+    state = ResearchState(output_dir, schema_digest(schema) if schema else None)
+    if schema:
+        sync_state(state, schema, items)
+    done, failed, stale, pending = state.plan(items)
+    state.compact()
+    todo = _in_outline_order(items, failed, stale + pending)
+    if args.limit > 0:
+        todo = todo[: args.limit]
+    if args.format == "json":
+        json.dump(
+            {
+                "total": len(items),
+                "done": [slug for _, slug, _ in done],
+                "failed": [
+                    {"name": name, "slug": slug, "missing_required": entry["missing_required"]}
+                    for name, slug, entry in failed
+                ],
+                "todo": [{"name": name, "slug": slug, "status": status} for name, slug, status in todo],
+            },
+            sys.stdout,
+            ensure_ascii=False,
+            indent=2,
+        )
+        print()
+        return
+    print(msg("resume_done", done=len(done), total=len(items)))
+    if failed:
+        print(msg("resume_failed", count=len(failed)))
+        for name, _, entry in failed:
+            print(f"  - {name}: {', '.join(entry['missing_required'])}")
+    print(msg("resume_todo", count=len(todo)))
+    for name, slug, status in todo:
+        print(f"  - {name} ({slug}.json, {status})")
+
+
+def _in_outline_order(items, failed, pending):
+    status = {slug: "failed" for _, slug, _ in failed}
+    status.update((slug, "pending") for _, slug, _ in pending)
+    return [(name, slug, status[slug]) for name, slug, _ in items if slug in status]
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sqlite3
+import sys
+from functools import partial
+from pathlib import Path
+
+from . import validate
+from .cache import STORE_NAME, schema_digest
+from .extract import STREAM_THRESHOLD, extract_json_fields, may_be_uncertain
+from .locales import get_locale, msg, set_locale
+from .outline import find_outline, load_outline, resolve_output_dir
+from .report import _load_item, flatten_item, is_empty, lookup_field
+from .schema import NESTED_KEYS, UNCERTAIN_MARKERS, _sha256, category_aliases, find_fields_yaml, load_schema
+
+STORE_VERSION = "4"
+ROW_COLUMNS = (
+    "file",
+    "name",
+    "size",
+    "mtime_ns",
+    "sha256",
+    "valid",
+    "coverage",
+    "uncertain",
+    "uncertain_fields",
+    "result",
+    "complete",
+    "extra",
+    "uncertain_list",
+)
+DIGEST_CHUNK_SIZE = 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS columns (field TEXT PRIMARY KEY, col TEXT NOT NULL, category TEXT);
+"""
+
+
+def store_digest(schema):
+    payload = json.dumps(
+        [STORE_VERSION, schema_digest(schema), get_locale(), sorted(NESTED_KEYS), UNCERTAIN_MARKERS],
+        ensure_ascii=False,
+    )
+    return _sha256(payload.encode("utf-8"))
+
+
+def _file_sha256(path):
+    import hashlib
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(partial(f.read, DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_row(json_path, schema, columns, stream=None):
+    # Large items go through the streaming extractor and keep their field columns empty
+    # (complete = 0), so a refresh never holds a whole large item in memory.
+    all_fields, required_fields, field_categories = schema
+    st = json_path.stat()
+    if stream is None:
+        stream = st.st_size >= STREAM_THRESHOLD
+    if stream:
+        result = validate.validate_json(json_path, *schema, stream=True)
+        name, sha, encoded, extra, uncertain_list = None, _file_sha256(json_path), {}, None, None
+    else:
+        raw = json_path.read_bytes()
+        data = validate._json_loads(raw)
+        uncertain = set()
+        json_fields = extract_json_fields(data, uncertain=uncertain, scan_values=may_be_uncertain(raw))
+        result = validate.compare_fields(json_path, json_fields, all_fields, required_fields, field_categories, uncertain)
+        item = data if isinstance(data, dict) else {"items": data}
+        flat = flatten_item(item)
+        encoded, deep = {}, False
+        for field in columns:
+            category = field_categories.get(field, "")
+            value = lookup_field(item, flat, field, category)
+            if field in item or field in flat or any(
+                isinstance(item.get(alias), dict) and field in item[alias] for alias in category_aliases(category)
+            ):
+                encoded[field] = json.dumps(value, ensure_ascii=False)
+            elif not is_empty(value):
+                encoded[field], deep = json.dumps(value, ensure_ascii=False), True
+        # Fields the report would only find by searching the whole item cannot be rebuilt from
+        # the columns, so such rows leave extra empty and the report reads their file.
+        extra = None if deep else json.dumps({k: v for k, v in flat.items() if k not in all_fields}, ensure_ascii=False)
+        listed = item.get("uncertain")
+        uncertain_list = json.dumps(listed, ensure_ascii=False) if isinstance(listed, list) else None
+        name, sha = item.get("name", flat.get("name")), _sha256(raw)
+    uncertain = result["uncertain_fields"]
+    return (
+        json_path.name,
+        name if isinstance(name, str) else None,
+        st.st_size,
+        st.st_mtime_ns,
+        sha,
+        int(result["valid"]),
+        result["coverage_rate"],
+        int(bool(uncertain)),
+        json.dumps(uncertain, ensure_ascii=False),
+        json.dumps(result, ensure_ascii=False),
+        int(not stream),
+        extra,
+        uncertain_list,
+        *(encoded.get(field) for field in columns),
+    )
+
+
+class ResultStore:
+    def __init__(self, directory, schema):
+        self.directory = Path(directory)
+        self.path = self.directory / STORE_NAME
+        self.schema = schema
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+        self.columns = dict(self.db.execute("SELECT field, col FROM columns"))
+        if dict(self.db.execute("SELECT key, value FROM meta")).get("digest") != store_digest(schema):
+            self._create()
+
+    def _create(self):
+        all_fields, _, field_categories = self.schema
+        self.columns = {field: f"c{i}" for i, field in enumerate(sorted(all_fields))}
+        with self.db:
+            self.db.execute("DROP TABLE IF EXISTS results")
+            self.db.execute("DELETE FROM columns")
+            self.db.execute(
+                "CREATE TABLE results (file TEXT PRIMARY KEY, name TEXT, size INTEGER, mtime_ns INTEGER, "
+                "sha256 TEXT, valid INTEGER, coverage REAL, uncertain INTEGER, uncertain_fields TEXT, "
+                "result TEXT, complete INTEGER, extra TEXT, uncertain_list TEXT"
+                + "".join(f", {col} TEXT" for col in self.columns.values())
+                + ")"
+            )
+            self.db.executemany(
+                "INSERT INTO columns (field, col, category) VALUES (?, ?, ?)",
+                [(field, col, field_categories.get(field)) for field, col in self.columns.items()],
+            )
+            self.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('digest', ?)", (store_digest(self.schema),))
+
+    def refresh(self, json_paths, jobs=1, stream=None):
+        # Rows left incomplete by a streaming build are rebuilt once a refresh would parse them.
+        json_paths = [Path(p) for p in json_paths]
+        rows = self.db.execute("SELECT file, size, mtime_ns, sha256, complete FROM results")
+        stamps = {file: stamp for file, *stamp in rows}
+        columns = [*ROW_COLUMNS, *self.columns.values()]
+        insert = f"INSERT OR REPLACE INTO results ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        changed = []
+        with self.db:
+            for json_path in json_paths:
+                st = json_path.stat()
+                stamp = stamps.get(json_path.name)
+                if stamp and not stamp[3] and not (stream or (stream is None and st.st_size >= STREAM_THRESHOLD)):
+                    changed.append(json_path)
+                    continue
+                if stamp and stamp[0] == st.st_size and stamp[1] == st.st_mtime_ns:
+                    continue
+                if stamp and stamp[0] == st.st_size and stamp[2] == _file_sha256(json_path):
+                    self.db.execute("UPDATE results SET mtime_ns = ? WHERE file = ?", (st.st_mtime_ns, json_path.name))
+                    continue
+                changed.append(json_path)
+            build = partial(build_row, schema=self.schema, columns=tuple(self.columns), stream=stream)
+            if jobs <= 1 or len(changed) < 2:
+                self.db.executemany(insert, map(build, changed))
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+                chunksize = max(1, len(changed) // (jobs * 4))
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    self.db.executemany(insert, pool.map(build, changed, chunksize=chunksize))
+            present = {p.name for p in self.directory.glob("*.json")}
+            removed = [file for file in stamps if file not in present]
+            self.db.executemany("DELETE FROM results WHERE file = ?", [(file,) for file in removed])
+        return len(changed), len(removed)
+
+    def result(self, json_path):
+        row = self.db.execute("SELECT result FROM results WHERE file = ?", (Path(json_path).name,)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def load(self, json_path):
+        # Rebuilds the item from its columns: schema fields as the report would look them up,
+        # the remaining flattened fields and the uncertain list. Rows without extra read the file.
+        fields = list(self.columns)
+        query = f"SELECT complete, extra, uncertain_list, {', '.join(self.columns.values())} FROM results WHERE file = ?"
+        row = self.db.execute(query, (Path(json_path).name,)).fetchone()
+        if row is None or row[1] is None:
+            return _load_item(self.directory / Path(json_path).name)
+        complete, extra, uncertain_list, *values = row
+        data = {field: json.loads(value) for field, value in zip(fields, values) if value is not None}
+        data.update(json.loads(extra))
+        if uncertain_list is not None:
+            data["uncertain"] = json.loads(uncertain_list)
+        return data
+
+    def values(self, field, include_uncertain=False):
+        col = self.columns[field]
+        query = f"SELECT file, name, {col}, uncertain_fields FROM results WHERE {col} IS NOT NULL ORDER BY file"
+        for file, name, value, uncertain in self.db.execute(query):
+            value = json.loads(value)
+            if is_empty(value):
+                continue
+            flagged = field in json.loads(uncertain)
+            if flagged and not include_uncertain:
+                continue
+            yield {"file": file, "name": name, "value": value, "uncertain": flagged}
+
+    def stats(self):
+        return self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(valid), 0), COALESCE(SUM(uncertain), 0), COALESCE(AVG(coverage), 0) "
+            "FROM results"
+        ).fetchone()
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def validate_stored(json_paths, schema, jobs=1, stream=None):
+    json_paths = [Path(p) for p in json_paths]
+    stores = {}
+    try:
+        for json_path in json_paths:
+            store = stores.get(json_path.parent)
+            if store is None:
+                store = stores[json_path.parent] = ResultStore(json_path.parent, schema)
+                store.refresh([p for p in json_paths if p.parent == json_path.parent], jobs=jobs, stream=stream)
+            yield store.result(json_path)
+    finally:
+        for store in stores.values():
+            store.close()
+
+
+def main(argv=None, locale=None):
+    import argparse
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("store_description"))
+    parser.add_argument("--outline", type=str, help=msg("help_outline"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"))
+    parser.add_argument("--format", choices=("text", "json"), default="text", help=msg("help_format"))
+    parser.add_argument("--jobs", "-J", type=int, default=1, help=msg("help_jobs"))
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("build", help=msg("help_store_build"))
+    values = sub.add_parser("values", help=msg("help_store_values"))
+    values.add_argument("field", help=msg("help_store_field"))
+    values.add_argument("--include-uncertain", action="store_true", help=msg("help_include_uncertain"))
+    args = parser.parse_args(argv)
+    outline_path = find_outline(args.outline)
+    outline = load_outline(outline_path) if outline_path and outline_path.exists() else {}
+    base = outline_path.parent if outline_path else Path.cwd()
+    fields_path = Path(args.fields) if args.fields else find_fields_yaml(base / "fields.yaml")
+    output_dir = Path(args.dir) if args.dir else resolve_output_dir(outline_path or base / "outline.yaml", outline)
+    if not fields_path.exists():
+        print(msg("fields_not_found", path=fields_path))
+        sys.exit(1)
+    if not output_dir.exists():
+        print(msg("no_json"))
+        sys.exit(1)
+    with ResultStore(output_dir, load_schema(fields_path)) as store:
+        jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+        updated, removed = store.refresh(sorted(output_dir.glob("*.json")), jobs=jobs)
+        if args.command == "values":
+            if args.field not in store.columns:
+                print(msg("unknown_fields", fields=args.field))
+                sys.exit(1)
+            rows = list(store.values(args.field, args.include_uncertain))
+            if args.format == "json":
+                json.dump({"field": args.field, "values": rows}, sys.stdout, ensure_ascii=False, indent=2)
+                print()
+                return
+            for row in rows:
+                flag = f" {msg('uncertain_marker')}" if row["uncertain"] else ""
+                print(f"{row['name'] or row['file']}\t{json.dumps(row['value'], ensure_ascii=False)}{flag}")
+            print(msg("store_values", field=args.field, count=len(rows)))
+            return
+        total, passed, uncertain, coverage = store.stats()
+        if args.format == "json":
+            json.dump(
+                {
+                    "path": str(store.path),
+                    "items": total,
+                    "passed": passed,
+                    "uncertain": uncertain,
+                    "average_coverage": coverage,
+                    "updated": updated,
+                    "removed": removed,
+                },
+                sys.stdout,
+                ensure_ascii=False,
+                indent=2,
+            )
+            print()
+            return
+        print(msg("store_built", path=store.path, items=total, updated=updated, removed=removed))
+        print(msg("passed", passed=passed, total=total))
+        print(msg("average_coverage", rate=coverage))
+        print(msg("store_uncertain", count=uncertain, total=total))
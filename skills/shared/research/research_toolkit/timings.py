@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import time
+from contextlib import contextmanager
+
+PHASES = ("lookup", "read", "parse", "extract", "compare", "output")
+
+_active = None
+
+
+def current():
+    return _active
+
+
+class Timings:
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.files = {}
+        self._pending = {}
+        self.schema = 0.0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def note(self, path, phase, seconds):
+        self._pending.setdefault(str(path), {})[phase] = seconds
+
+    def add(self, record):
+        record = {**self._pending.pop(record["file"], {}), **record}
+        record["total"] = sum(record.get(phase, 0.0) for phase in PHASES)
+        self.files[record["file"]] = record
+        if self.callback:
+            self.callback(record)
+        return record
+
+    def add_phase(self, path, phase, seconds):
+        record = self.files.get(str(path))
+        if record is None:
+            return
+        record[phase] = record.get(phase, 0.0) + seconds
+        record["total"] += seconds
+
+    def stop(self):
+        self.finished = time.perf_counter()
+
+    def slowest(self, n=10):
+        return sorted(self.files.values(), key=lambda r: -r["total"])[:n]
+
+    def summary(self, slowest=10):
+        records = self.files.values()
+        wall = (self.finished or time.perf_counter()) - self.started
+        return {
+            "files": len(self.files),
+            "cached": sum(1 for r in records if r.get("cached")),
+            "bytes": sum(r["bytes"] for r in records),
+            "wall": wall,
+            "schema": self.schema,
+            "phases": {phase: sum(r.get(phase, 0.0) for r in records) for phase in PHASES},
+            "slowest": self.slowest(slowest),
+        }
+
+
+@contextmanager
+def collect_timings(callback=None):
+    global _active
+    previous, _active = _active, Timings(callback)
+    try:
+        yield _active
+    finally:
+        _active.stop()
+        _active = previous
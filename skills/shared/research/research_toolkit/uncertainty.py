@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+import json
+import sys
+from pathlib import Path
+
+from .cache import schema_digest
+from .locales import msg, set_locale
+from .outline import find_outline, load_outline, match_key, outline_items, resolve_output_dir
+from .state import ResearchState, _validate_into
+
+
+class UncertaintyIndex:
+    def __init__(self, items, schema):
+        all_fields, _, field_categories = schema
+        self.fields = sorted(all_fields)
+        self.field_categories = field_categories
+        self.items = {slug: sorted(set(fields)) for slug, fields in items.items()}
+        self.by_field = {}
+        for slug, fields in self.items.items():
+            for field in fields:
+                self.by_field.setdefault(field, []).append(slug)
+
+    @classmethod
+    def from_state(cls, state, schema):
+        return cls({slug: entry.get("uncertain", []) for slug, entry in state.entries.items()}, schema)
+
+    def pairs(self, fields=None):
+        fields = set(fields) if fields else None
+        return [
+            (slug, field)
+            for slug, uncertain in self.items.items()
+            for field in uncertain
+            if fields is None or field in fields
+        ]
+
+    def field_rates(self):
+        total = len(self.items)
+        return {
+            field: {"count": len(slugs), "rate": len(slugs) / total * 100 if total else 0}
+            for field, slugs in sorted(self.by_field.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+        }
+
+    def category_rates(self):
+        unknown = msg("unknown_category")
+        sizes = {}
+        for field in self.fields:
+            category = self.field_categories.get(field, unknown)
+            sizes[category] = sizes.get(category, 0) + 1
+        cells = dict.fromkeys(sizes, 0)
+        for field in self.fields:
+            cells[self.field_categories.get(field, unknown)] += len(self.by_field.get(field, ()))
+        rates = {}
+        for category, size in sizes.items():
+            total = size * len(self.items)
+            rates[category] = {"cells": cells[category], "total": total, "rate": cells[category] / total * 100 if total else 0}
+        return dict(sorted(rates.items(), key=lambda kv: -kv[1]["rate"]))
+
+    def item_rate(self, slug):
+        defined = [f for f in self.items.get(slug, ()) if f in self.field_categories]
+        return len(defined) / len(self.fields) * 100 if self.fields else 0
+
+    def items_above(self, threshold=0.0, fields=None):
+        fields = set(fields) if fields else None
+        above = []
+        for slug, uncertain in self.items.items():
+            selected = [f for f in uncertain if fields is None or f in fields]
+            rate = self.item_rate(slug)
+            if selected and rate > threshold:
+                above.append((slug, selected, rate))
+        return sorted(above, key=lambda entry: (-entry[2], entry[0]))
+
+
+def refresh_state(state, schema, output_dir):
+    if not state.exists():
+        json_paths = sorted(output_dir.glob("*.json"))
+    else:
+        json_paths = [
+            output_dir / entry["file"]
+            for entry in state.entries.values()
+            if "uncertain" not in entry or not state.is_current(entry)
+        ]
+    if json_paths:
+        _validate_into(state, schema, json_paths)
+    for slug in [slug for slug, entry in state.entries.items() if not (output_dir / entry["file"]).exists()]:
+        del state.entries[slug]
+    state.compact()
+
+
+def main(argv=None, locale=None):
+    import argparse
+    from .schema import load_schema
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("uncertainty_description"))
+    parser.add_argument("--outline", type=str, help=msg("help_outline"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"))
+    parser.add_argument("--format", choices=("text", "json"), default="text", help=msg("help_format"))
+    parser.add_argument("--threshold", type=float, default=0.0, help=msg("help_uncertain_threshold"))
+    parser.add_argument("--field", action="append", default=[], help=msg("help_uncertain_field"))
+    parser.add_argument("--top", type=int, default=20, help=msg("help_uncertain_top"))
+    # Options repeated on each subcommand, so they may also follow it; SUPPRESS keeps the top-level value.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--format", choices=("text", "json"), default=argparse.SUPPRESS, help=msg("help_format"))
+    common.add_argument("--threshold", type=float, default=argparse.SUPPRESS, help=msg("help_uncertain_threshold"))
+    common.add_argument("--field", action="append", default=argparse.SUPPRESS, help=msg("help_uncertain_field"))
+    common.add_argument("--top", type=int, default=argparse.SUPPRESS, help=msg("help_uncertain_top"))
+    sub = parser.add_subparsers(dest="command")
+    sub.add_parser("summary", parents=[common], help=msg("help_uncertain_summary"))
+    sub.add_parser("cells", parents=[common], help=msg("help_uncertain_cells"))
+    args = parser.parse_args(argv)
+    outline_path = find_outline(args.outline)
+    outline = load_outline(outline_path) if outline_path and outline_path.exists() else {}
+    base = outline_path.parent if outline_path else Path.cwd()
+    fields_path = Path(args.fields) if args.fields else base / "fields.yaml"
+    output_dir = Path(args.dir) if args.dir else resolve_output_dir(outline_path or base / "outline.yaml", outline)
+    if not fields_path.exists():
+        print(msg("fields_not_found", path=fields_path))
+        sys.exit(1)
+    schema = load_schema(fields_path)
+    state = ResearchState(output_dir, schema_digest(schema))
+    if output_dir.exists():
+        refresh_state(state, schema, output_dir)
+    index = UncertaintyIndex.from_state(state, schema)
+    names = {match_key(slug): name for name, slug, _ in outline_items(outline)}
+    unknown = [f for f in args.field if f not in index.field_categories and f not in index.by_field]
+    if unknown:
+        print(msg("unknown_fields", fields=", ".join(unknown)))
+        sys.exit(1)
+    above = index.items_above(args.threshold, args.field)
+
+    def describe(slug, fields, rate):
+        entry = state.entries[slug]
+        return {
+            "name": names.get(match_key(slug), slug),
+            "slug": slug,
+            "output_path": str((output_dir / entry["file"]).resolve()),
+            "rate": rate,
+            "fields": fields,
+        }
+
+    if args.command == "cells":
+        cells = [describe(*entry) for entry in above]
+        if args.format == "json":
+            json.dump({"threshold": args.threshold, "items": cells}, sys.stdout, ensure_ascii=False, indent=2)
+            print()
+            return
+        print(msg("uncertain_cells", pairs=sum(len(c["fields"]) for c in cells), items=len(cells)))
+        for cell in cells:
+            print(f"  - {cell['name']}: {', '.join(cell['fields'])}")
+        return
+
+    pairs = index.pairs(args.field)
+    uncertain_items = sum(1 for fields in index.items.values() if fields)
+    field_rates = index.field_rates()
+    category_rates = index.category_rates()
+    if args.format == "json":
+        json.dump(
+            {
+                "items": len(index.items),
+                "uncertain_items": uncertain_items,
+                "cells": len(pairs),
+                "fields": field_rates,
+                "categories": category_rates,
+                "above_threshold": [describe(*entry) for entry in above[: args.top]],
+            },
+            sys.stdout,
+            ensure_ascii=False,
+            indent=2,
+        )
+        print()
+        return
+    print(msg("uncertain_header", cells=len(pairs), items=uncertain_items, total=len(index.items)))
+    print("\n" + msg("uncertain_by_field"))
+    for field, rate in list(field_rates.items())[: args.top]:
+        print(f"  {rate['rate']:5.1f}%  {field} ({rate['count']})")
+    print("\n" + msg("uncertain_by_category"))
+    for category, rate in category_rates.items():
+        print(f"  {rate['rate']:5.1f}%  [{category}] ({rate['cells']}/{rate['total']})")
+    print("\n" + msg("uncertain_above", threshold=args.threshold, count=len(above)))
+    for slug, fields, rate in above[: args.top]:
+        print(f"  {rate:5.1f}%  {names.get(match_key(slug), slug)}: {', '.join(fields)}")
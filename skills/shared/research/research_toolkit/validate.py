@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from functools import partial
+from pathlib import Path
+
+from .cache import CACHE_MIN_BYTES, CACHE_NAME, STORE_NAME, ValidationCache, schema_digest
+from .extract import STREAM_THRESHOLD, extract_json_fields, extract_json_fields_stream, may_be_uncertain
+from .locales import get_locale, msg, set_locale
+from .schema import NESTED_KEYS, find_fields_yaml, load_schema
+
+FAST_JSON_MIN_FILES = 50
+
+_worker_schema = None
+_json_loads = json.loads
+
+
+def current_timings():
+    # A collector can only be active once the timings module has been imported.
+    timings = sys.modules.get(f"{__package__}.timings")
+    return None if timings is None else timings.current()
+
+
+def validate_json(json_path, all_fields, required_fields, field_categories, stream=None):
+    json_path = Path(json_path)
+    if stream is None:
+        stream = json_path.stat().st_size >= STREAM_THRESHOLD
+    uncertain = set()
+    if stream:
+        with json_path.open(encoding="utf-8") as f:
+            json_fields = extract_json_fields_stream(f, uncertain=uncertain)
+    else:
+        raw = json_path.read_bytes()
+        json_fields = extract_json_fields(_json_loads(raw), uncertain=uncertain, scan_values=may_be_uncertain(raw))
+    return compare_fields(json_path, json_fields, all_fields, required_fields, field_categories, uncertain)
+
+
+def validate_json_timed(json_path, all_fields, required_fields, field_categories, stream=None):
+    clock = time.perf_counter
+    json_path = Path(json_path)
+    record = {"file": str(json_path), "bytes": json_path.stat().st_size}
+    if stream is None:
+        stream = record["bytes"] >= STREAM_THRESHOLD
+    uncertain = set()
+    start = clock()
+    if stream:
+        with json_path.open(encoding="utf-8") as f:
+            json_fields = extract_json_fields_stream(f, uncertain=uncertain)
+        record["extract"] = clock() - start
+    else:
+        raw = json_path.read_bytes()
+        read = clock()
+        data = _json_loads(raw)
+        parsed = clock()
+        json_fields = extract_json_fields(data, uncertain=uncertain, scan_values=may_be_uncertain(raw))
+        record.update(read=read - start, parse=parsed - read, extract=clock() - parsed)
+    start = clock()
+    result = compare_fields(json_path, json_fields, all_fields, required_fields, field_categories, uncertain)
+    record["compare"] = clock() - start
+    return result, record
+
+
+def compare_fields(json_path, json_fields, all_fields, required_fields, field_categories, uncertain=()):
+    covered = all_fields & json_fields
+    missing = all_fields - json_fields
+    extra = json_fields - all_fields
+    missing_required = missing & required_fields
+    missing_by_category = defaultdict(list)
+    for field in missing:
+        missing_by_category[field_categories.get(field, msg("unknown_category"))].append(field)
+    return {
+        "file": json_path.name,
+        "total_defined": len(all_fields),
+        "covered": len(covered),
+        "missing": len(missing),
+        "extra": len(extra),
+        "coverage_rate": len(covered) / len(all_fields) * 100 if all_fields else 100,
+        "missing_required": sorted(missing_required),
+        "missing_optional": sorted(missing - required_fields),
+        "missing_by_category": {k: sorted(v) for k, v in missing_by_category.items()},
+        "extra_fields": sorted(extra),
+        "uncertain_fields": sorted(uncertain),
+        "valid": len(missing_required) == 0,
+    }
+
+
+def use_fast_json():
+    global _json_loads
+    try:
+        from orjson import loads
+    except ImportError:
+        return False
+    _json_loads = loads
+    return True
+
+
+def _init_worker(schema, fast_json):
+    global _worker_schema
+    _worker_schema = schema
+    if fast_json:
+        use_fast_json()
+
+
+def _validate_in_worker(json_path, stream=None, timed=False):
+    return (validate_json_timed if timed else validate_json)(json_path, *_worker_schema, stream=stream)
+
+
+def validate_many(json_paths, schema, jobs=1, stream=None):
+    json_paths = [Path(p) for p in json_paths]
+    fast_json = len(json_paths) >= FAST_JSON_MIN_FILES and use_fast_json()
+    timings = current_timings()
+    if jobs <= 1 or len(json_paths) < 2:
+        for json_path in json_paths:
+            if timings is None:
+                yield validate_json(json_path, *schema, stream=stream)
+                continue
+            result, record = validate_json_timed(json_path, *schema, stream=stream)
+            timings.add(record)
+            yield result
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(json_paths) // (jobs * 4))
+    worker = partial(_validate_in_worker, stream=stream, timed=timings is not None)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(schema, fast_json)) as pool:
+        if timings is None:
+            yield from pool.map(worker, json_paths, chunksize=chunksize)
+            return
+        for result, record in pool.map(worker, json_paths, chunksize=chunksize):
+            timings.add(record)
+            yield result
+
+
+def validate_cached(json_paths, schema, jobs=1, stream=None, evict=False):
+    json_paths = [Path(p) for p in json_paths]
+    if not evict and sum(p.stat().st_size for p in json_paths) < CACHE_MIN_BYTES:
+        yield from validate_many(json_paths, schema, jobs=jobs, stream=stream)
+        return
+    key = schema_digest(schema)
+    timings = current_timings()
+    clock = time.perf_counter
+    caches = {}
+    hits = []
+    for json_path in json_paths:
+        start = clock()
+        cache = caches.get(json_path.parent)
+        if cache is None:
+            cache = caches[json_path.parent] = ValidationCache(json_path.parent, key)
+        hits.append(cache.lookup(json_path))
+        if timings is not None:
+            if hits[-1] is None:
+                timings.note(json_path, "lookup", clock() - start)
+            else:
+                timings.add({"file": str(json_path), "bytes": 0, "lookup": clock() - start, "cached": True})
+    fresh = validate_many([p for p, hit in zip(json_paths, hits) if hit is None], schema, jobs=jobs, stream=stream)
+    try:
+        for json_path, hit in zip(json_paths, hits):
+            if hit is None:
+                hit = next(fresh)
+                caches[json_path.parent].store(json_path, hit)
+            yield hit
+    finally:
+        for cache in caches.values():
+            if evict:
+                cache.evict_missing()
+            cache.save()
+            cache.close()
+
+
+def summarize_results(results, all_fields, required_fields, missing_files=(), top=20):
+    missing_counts = Counter()
+    for result in results:
+        missing_counts.update(result["missing_required"])
+        missing_counts.update(result["missing_optional"])
+    total = len(results)
+    passed = sum(1 for r in results if r["valid"])
+    return {
+        "total": total,
+        "passed": passed,
+        "failed": total - passed,
+        "average_coverage": sum(r["coverage_rate"] for r in results) / total if total else 0,
+        "field_coverage": {field: total - missing_counts[field] for field in sorted(all_fields)},
+        "most_missing": [
+            {"field": field, "missing": count, "required": field in required_fields}
+            for field, count in sorted(missing_counts.items(), key=lambda kv: (-kv[1], kv[0]))[:top]
+        ],
+        "failed_files": [r["file"] for r in results if not r["valid"]],
+        "missing_files": [str(p) for p in missing_files],
+    }
+
+
+def print_result(result, verbose=True):
+    status = msg("pass") if result["valid"] else msg("fail")
+    line = "=" * 60
+    print(f"\n{line}")
+    print(f"[{status}] {result['file']}")
+    print(line)
+    print(msg("coverage", rate=result["coverage_rate"], covered=result["covered"], total=result["total_defined"]))
+    if result["missing_required"]:
+        print("\n" + msg("missing_required", count=len(result["missing_required"])))
+        print("\n".join(f"  - {f}" for f in result["missing_required"]))
+    if verbose and result["missing_optional"]:
+        missing_required = set(result["missing_required"])
+        print("\n" + msg("missing_optional", count=len(result["missing_optional"])))
+        for cat in sorted(result["missing_by_category"]):
+            optional = [f for f in result["missing_by_category"][cat] if f not in missing_required]
+            if optional:
+                print(f"  [{cat}]: {', '.join(optional)}")
+    if verbose and result["extra_fields"]:
+        extra = result["extra_fields"]
+        print("\n" + msg("extra_fields", count=len(extra)))
+        print(f"  {', '.join(extra[:10])}")
+        if len(extra) > 10:
+            print(msg("and_more", count=len(extra) - 10))
+    if verbose and result.get("uncertain_fields"):
+        print("\n" + msg("uncertain_in_file", count=len(result["uncertain_fields"])))
+        print(f"  {', '.join(result['uncertain_fields'])}")
+
+
+def emit_machine_readable(
+    fmt, validated, all_fields, required_fields, missing_files=(), top=20, timings=None, json_paths=(), slowest=10
+):
+    results = []
+    if fmt == "json":
+        sys.stdout.write('{"results": [')
+    json_paths = iter(json_paths)
+    for result in validated:
+        start = time.perf_counter()
+        if fmt == "ndjson":
+            print(json.dumps({"type": "result", **result}, ensure_ascii=False), flush=True)
+        else:
+            sys.stdout.write(("\n  " if not results else ",\n  ") + json.dumps(result, ensure_ascii=False))
+        results.append(result)
+        if timings is not None:
+            timings.add_phase(next(json_paths), "output", time.perf_counter() - start)
+    summary = summarize_results(results, all_fields, required_fields, missing_files, top)
+    profile = None
+    if timings is not None:
+        timings.stop()
+        profile = timings.summary(slowest)
+    if fmt == "ndjson":
+        print(json.dumps({"type": "summary", **summary}, ensure_ascii=False))
+        if profile is not None:
+            print(json.dumps({"type": "timings", **profile}, ensure_ascii=False))
+    else:
+        timing_field = f", \"timings\": {json.dumps(profile, ensure_ascii=False)}" if profile is not None else ""
+        sys.stdout.write(f"\n], \"summary\": {json.dumps(summary, ensure_ascii=False)}{timing_field}}}\n")
+    if summary["failed"]:
+        sys.exit(1)
+
+
+def print_timings(summary):
+    phases = summary["phases"]
+    total = sum(phases.values()) or 1.0
+    line = "=" * 60
+    print(f"\n{line}")
+    print(msg("timings_header"))
+    print(line)
+    print(
+        msg(
+            "timings_totals",
+            files=summary["files"],
+            cached=summary["cached"],
+            mb=summary["bytes"] / 1024 / 1024,
+            wall=summary["wall"],
+            schema=summary["schema"],
+        )
+    )
+    for phase, seconds in phases.items():
+        print(f"  {phase:<8} {seconds:9.3f} s  {seconds / total * 100:5.1f}%")
+    if summary["slowest"]:
+        print("\n" + msg("timings_slowest", count=len(summary["slowest"])))
+    for record in summary["slowest"]:
+        detail = ", ".join(f"{phase} {record[phase] * 1000:.2f}" for phase in phases if record.get(phase))
+        print(f"  {record['total'] * 1000:9.2f} ms  {record['bytes'] / 1024:8.1f} KB  {record['file']}  ({detail})")
+
+
+def main(argv=None, locale=None):
+    import argparse
+    if locale:
+        set_locale(locale)
+    parser = argparse.ArgumentParser(description=msg("validate_description"))
+    parser.add_argument("--fields", "-f", type=str, help=msg("help_fields"), default="fields.yaml")
+    parser.add_argument("--json", "-j", type=str, nargs="*", help=msg("help_json"))
+    parser.add_argument("--dir", "-d", type=str, help=msg("help_dir"), default="results")
+    parser.add_argument("--quiet", "-q", action="store_true", help=msg("help_quiet"))
+    parser.add_argument("--jobs", "-J", type=int, default=1, help=msg("help_jobs"))
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        default=None,
+        help=msg("help_stream", mb=STREAM_THRESHOLD // 1024 // 1024),
+    )
+    parser.add_argument("--no-cache", action="store_true", help=msg("help_no_cache", cache=CACHE_NAME))
+    parser.add_argument("--format", choices=("text", "json", "ndjson"), default="text", help=msg("help_format"))
+    parser.add_argument("--top", type=int, default=20, help=msg("help_top"))
+    parser.add_argument("--serve", action="store_true", help=msg("help_serve"))
+    parser.add_argument("--socket", type=str, help=msg("help_socket"))
+    parser.add_argument("--no-daemon", action="store_true", help=msg("help_no_daemon"))
+    parser.add_argument("--store", action="store_true", help=msg("help_store", store=STORE_NAME))
+    parser.add_argument("--profile", "--timings", action="store_true", help=msg("help_profile"))
+    parser.add_argument("--slowest", type=int, default=10, help=msg("help_slowest"))
+    args = parser.parse_args(argv)
+    from .daemon import default_socket_path, serve
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    if args.serve:
+        serve(socket_path)
+        return
+    if args.profile:
+        from .timings import collect_timings
+        with collect_timings() as timings:
+            _run(args, socket_path, timings)
+        return
+    _run(args, socket_path)
+
+
+def _run(args, socket_path, timings=None):
+    from .daemon import request_daemon
+    from .state import record_results
+    fields_path = find_fields_yaml(args.fields)
+    if not fields_path.exists():
+        print(msg("fields_not_found", path=fields_path))
+        sys.exit(1)
+    json_files = (
+        [Path(p) for p in args.json]
+        if args.json
+        else sorted(Path(args.dir).glob("*.json")) if Path(args.dir).exists() else []
+    )
+    existing = [p for p in json_files if p.exists()]
+    jobs = args.jobs if args.jobs > 0 else os.cpu_count() or 1
+    response = None
+    # Only file lists (-j) go to the daemon: directory runs are long enough to amortize startup
+    # and would otherwise hold the single-threaded daemon while agents' requests queue behind them.
+    if args.json and existing and not args.no_daemon and not args.store and timings is None:
+        response = request_daemon(
+            socket_path,
+            {
+                "fields": str(fields_path.resolve()),
+                "json": [str(p.resolve()) for p in existing],
+                "jobs": jobs,
+                "stream": args.stream,
+                "cache": not args.no_cache,
+                "nested_keys": sorted(NESTED_KEYS),
+                "locale": get_locale(),
+            },
+        )
+    if response is not None:
+        all_fields, required_fields = response["all_fields"], response["required_fields"]
+        schema_key = response.get("schema")
+        validated = response["results"]
+    else:
+        start = time.perf_counter()
+        schema = load_schema(fields_path, use_compiled=not args.no_cache)
+        if timings is not None:
+            timings.schema = time.perf_counter() - start
+        all_fields, required_fields = schema[0], schema[1]
+        schema_key = schema_digest(schema)
+        if args.store:
+            from .store import validate_stored as validate
+        else:
+            validate = validate_many if args.no_cache else partial(validate_cached, evict=not args.json)
+        validated = validate(existing, schema, jobs=jobs, stream=args.stream)
+    validated = record_results(existing, validated, schema_key, create=not args.json)
+    missing_files = [p for p in json_files if not p.exists()]
+    if args.format != "text":
+        emit_machine_readable(
+            args.format, validated, all_fields, required_fields, missing_files, args.top, timings, existing, args.slowest
+        )
+        return
+    print(msg("field_file", path=fields_path))
+    print(msg("total_fields", total=len(all_fields), required=len(required_fields), optional=len(all_fields) - len(required_fields)))
+    if not json_files:
+        print(msg("no_json"))
+        sys.exit(0)
+    for json_path in missing_files:
+        print(msg("file_not_found", path=json_path))
+    results = []
+    for json_path, result in zip(existing, validated):
+        start = time.perf_counter()
+        results.append(result)
+        print_result(result, verbose=not args.quiet)
+        if timings is not None:
+            timings.add_phase(json_path, "output", time.perf_counter() - start)
+    line = "=" * 60
+    print(f"\n{line}")
+    print(msg("summary"))
+    print(line)
+    passed = sum(1 for r in results if r["valid"])
+    avg_coverage = sum(r["coverage_rate"] for r in results) / len(results) if results else 0
+    print(msg("passed", passed=passed, total=len(results)))
+    print(msg("average_coverage", rate=avg_coverage))
+    if timings is not None:
+        timings.stop()
+        print_timings(timings.summary(args.slowest))
+    if passed < len(results):
+        sys.exit(1)
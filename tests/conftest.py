@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills" / "shared" / "research"))
+
+FIELDS_YAML = """\
+field_categories:
+- category: Basic Info
+  fields:
+  - name: name
+    required: true
+  - name: vendor
+    required: true
+  - name: release_date
+- category: Technical Features
+  fields:
+  - name: architecture
+  - name: context_window
+  - name: benchmarks
+"""
+
+
+@pytest.fixture(autouse=True)
+def english():
+    from research_toolkit.locales import set_locale
+    set_locale("en")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "fields.yaml").write_text(FIELDS_YAML, encoding="utf-8")
+    (tmp_path / "results").mkdir()
+    return tmp_path
+
+
+def write_json(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
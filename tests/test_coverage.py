@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import io
+import json
+
+import pytest
+
+from conftest import write_json
+from research_toolkit.coverage import CoverageMatrix, main
+from research_toolkit.schema import load_schema
+
+ITEMS = {
+    "Alpha.json": {"name", "vendor", "release_date", "architecture", "context_window", "benchmarks"},
+    "Beta.json": {"name", "vendor", "architecture"},
+    "Gamma.json": {"name", "context_window"},
+}
+
+
+@pytest.fixture
+def matrix(project):
+    matrix = CoverageMatrix(load_schema(project / "fields.yaml"))
+    for item, fields in ITEMS.items():
+        matrix.add(item, fields | {"not_in_schema"})
+    return matrix
+
+
+def test_fill_rates(matrix):
+    rates = matrix.fill_rates()
+    assert rates["name"] == 100
+    assert rates["vendor"] == pytest.approx(200 / 3)
+    assert rates["benchmarks"] == pytest.approx(100 / 3)
+    assert set(rates) == {"name", "vendor", "release_date", "architecture", "context_window", "benchmarks"}
+
+
+def test_category_gaps(matrix):
+    assert matrix.category_gaps() == {
+        "Basic Info": {"fields": 3, "missing_cells": 3, "items_with_gaps": 2},
+        "Technical Features": {"fields": 3, "missing_cells": 4, "items_with_gaps": 2},
+    }
+
+
+def test_items_missing(matrix):
+    assert matrix.items_missing("vendor") == ["Gamma.json"]
+    assert matrix.items_missing("name") == []
+    assert matrix.items_missing("benchmarks") == ["Beta.json", "Gamma.json"]
+    assert matrix.items_missing_required() == ["Gamma.json"]
+
+
+def test_csv_export(matrix):
+    out = io.StringIO()
+    matrix.write_csv(out)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0] == ["item", *matrix.fields]
+    assert {row[0]: {f for f, bit in zip(matrix.fields, row[1:]) if bit == "1"} for row in rows[1:]} == ITEMS
+
+
+def test_ndjson_export(matrix):
+    out = io.StringIO()
+    matrix.write_ndjson(out)
+    columns, *rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert columns == {"type": "columns", "fields": matrix.fields}
+    for row in rows:
+        bits = int(row["bits"], 16)
+        covered = {f for i, f in enumerate(matrix.fields) if bits >> i & 1}
+        assert covered == ITEMS[row["item"]]
+        assert row["missing"] == sorted(set(matrix.fields) - covered)
+
+
+def test_matrix_from_validation_results(project, capsys):
+    results = project / "results"
+    write_json(results / "Alpha.json", {"name": "Alpha", "vendor": "Acme", "architecture": "MoE"})
+    write_json(results / "Beta.json", {"basic_info": {"name": "Beta"}})
+    main(["-f", str(project / "fields.yaml"), "-d", str(results), "--no-cache", "missing", "vendor", "architecture"])
+    out = capsys.readouterr().out
+    assert out.count("  - Beta.json") == 2
+    assert "Alpha.json" not in out
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import json
+import socket
+import time
+
+import pytest
+
+from conftest import write_json
+from research_toolkit import daemon, validate
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets")
+
+
+@pytest.fixture
+def wedged(project):
+    # Accepts connections into the backlog but never answers, like a stopped or busy daemon.
+    path = project / "wedged.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+    yield path
+    server.close()
+
+
+def test_request_gives_up_on_a_wedged_daemon(wedged):
+    start = time.perf_counter()
+    assert daemon.request_daemon(wedged, {"ping": True}, timeout=0.2) is None
+    assert time.perf_counter() - start < 5
+
+
+def test_validation_falls_back_when_the_daemon_does_not_answer(project, wedged, monkeypatch, capsys):
+    monkeypatch.setattr(daemon, "DAEMON_TIMEOUT", 0.2)
+    claude = write_json(project / "results" / "Claude.json", {"name": "Claude", "vendor": "Anthropic"})
+    validate.main(["-f", str(project / "fields.yaml"), "--socket", str(wedged), "--format", "json", "-j", str(claude)])
+    assert json.loads(capsys.readouterr().out)["summary"]["passed"] == 1
+
+
+def test_directory_runs_do_not_use_the_daemon(project, wedged, monkeypatch, capsys):
+    def unexpected(*args, **kwargs):
+        raise AssertionError("directory runs must validate in-process")
+
+    monkeypatch.setattr(daemon, "request_daemon", unexpected)
+    write_json(project / "results" / "Claude.json", {"name": "Claude", "vendor": "Anthropic"})
+    validate.main(
+        ["-f", str(project / "fields.yaml"), "--socket", str(wedged), "--format", "json", "-d", str(project / "results")]
+    )
+    assert json.loads(capsys.readouterr().out)["summary"]["passed"] == 1
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+import yaml
+
+from research_toolkit.dedup import ItemIndex, append_items, main
+
+OUTLINE = """\
+# Research outline
+topic: LLMs
+items:
+- GPT-4o
+- name: Claude 3 Opus  # flagship
+  aliases: [Opus]
+- Llama (Meta)
+- C++
+
+execution:
+  batch_size: 2
+"""
+
+
+@pytest.fixture
+def outline(tmp_path):
+    path = tmp_path / "outline.yaml"
+    path.write_text(OUTLINE, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize(
+    "name, status, matches",
+    [
+        ("gpt 4o", "duplicate", ["GPT-4o"]),
+        ("Opus", "duplicate", ["Claude 3 Opus"]),
+        ("Opus 3 Claude", "duplicate", ["Claude 3 Opus"]),
+        ("Llama", "duplicate", ["Llama (Meta)"]),
+        ("Claude 3 Opuss", "near_duplicate", ["Claude 3 Opus"]),
+        ("C", "slug_collision", ["C++"]),
+        ("Gemini", "new", []),
+    ],
+)
+def test_check_classifies_candidates(outline, name, status, matches):
+    index = ItemIndex(outline)
+    try:
+        result = index.check(name)
+    finally:
+        index.close()
+    assert (result["status"], result.get("matches", [])) == (status, matches)
+
+
+def test_apply_appends_and_keeps_outline_text(outline, capsys):
+    main(["--outline", str(outline), "--format", "json", "check", "Gemini", "gpt 4o", "--apply"])
+    report = json.loads(capsys.readouterr().out)
+    assert report["accepted"] == 1
+    text = outline.read_text(encoding="utf-8")
+    assert text == OUTLINE.replace("- C++\n", "- C++\n- name: Gemini\n")
+    main(["--outline", str(outline), "--format", "json", "check", "gemini"])
+    assert json.loads(capsys.readouterr().out)["results"][0]["status"] == "duplicate"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "topic: t\nitems:\n  - A  # first\n  - name: B\n    category: x\n# tail\nexecution: {}\n",
+        "topic: t\nitems: []  # none yet\n\nexecution:\n  batch_size: 1\n",
+        "topic: t\nitems:\n- A",
+        "topic: t\n",
+        "topic: t\nitems: [A, B]\n",
+    ],
+)
+def test_append_items_preserves_existing_items(tmp_path, text):
+    path = tmp_path / "outline.yaml"
+    path.write_text(text, encoding="utf-8")
+    before = yaml.safe_load(text)
+    new = [{"name": "Néw", "category": "c"}, {"name": "Z"}]
+    append_items(path, new)
+    after = yaml.safe_load(path.read_text(encoding="utf-8"))
+    assert after == {**before, "items": (before.get("items") or []) + new}
+    comments = [line[line.index("#") :] for line in text.splitlines() if "#" in line]
+    assert all(comment in path.read_text(encoding="utf-8") for comment in comments)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import random
+
+import pytest
+
+from research_toolkit.extract import extract_json_fields, extract_json_fields_stream
+
+FUZZ_CASES = 20000
+KEYS = ["name", "vendor", "basic_info", "Basic Info", "technical_features", "基本情報", "uncertain", "_source_file", "x"]
+STRINGS = ["plain", "[uncertain]", "maybe [不确定] yes", "[不確定]", 'a"b', "back\\slash", "", "[x]", "uncertain", "é"]
+
+
+def random_value(rng, depth):
+    r = rng.random()
+    if depth > 3 or r < 0.4:
+        return rng.choice([rng.choice(STRINGS), rng.randint(-5, 5), 1.5, True, None])
+    if r < 0.7:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return random_object(rng, depth + 1)
+
+
+def random_object(rng, depth):
+    # A list of pairs rather than a dict so that keys can repeat.
+    pairs = []
+    for _ in range(rng.randint(0, 5)):
+        key = rng.choice(KEYS)
+        if key == "uncertain" and rng.random() < 0.7:
+            value = [rng.choice([*KEYS, 1, "z"]) for _ in range(rng.randint(0, 3))]
+        else:
+            value = random_value(rng, depth)
+        pairs.append((key, value))
+    return ("object", pairs)
+
+
+def dump(value, rng):
+    ensure_ascii = rng.random() < 0.5
+    space = rng.choice(["", " ", "\n  "])
+    if isinstance(value, tuple):
+        members = (f"{space}{json.dumps(k, ensure_ascii=ensure_ascii)}{space}:{space}{dump(v, rng)}" for k, v in value[1])
+        return "{" + ",".join(members) + space + "}"
+    if isinstance(value, list):
+        return "[" + ",".join(space + dump(v, rng) for v in value) + space + "]"
+    return json.dumps(value, ensure_ascii=ensure_ascii)
+
+
+def random_document(seed):
+    rng = random.Random(seed)
+    if rng.random() < 0.8:
+        return dump(random_object(rng, 0), rng), rng
+    return dump([random_object(rng, 1) for _ in range(rng.randint(0, 3))], rng), rng
+
+
+def extract_both(text, chunk_size):
+    tree, stream = set(), set()
+    fields = extract_json_fields(json.loads(text), uncertain=tree)
+    streamed = extract_json_fields_stream(io.StringIO(text), chunk_size=chunk_size, uncertain=stream)
+    return (fields, tree), (streamed, stream)
+
+
+def test_stream_matches_tree_extractor():
+    mismatches = []
+    for seed in range(FUZZ_CASES):
+        text, rng = random_document(seed)
+        expected, actual = extract_both(text, rng.randint(1, 16))
+        if expected != actual:
+            mismatches.append((seed, text, expected, actual))
+    assert not mismatches[:3]
+
+
+def test_stream_collects_uncertain_fields():
+    text = json.dumps(
+        {
+            "name": "Claude",
+            "basic_info": {"vendor": "[uncertain] Anthropic", "release_date": "2023"},
+            "benchmarks": [{"mmlu": "[不确定]"}],
+            "uncertain": ["license"],
+        }
+    )
+    uncertain = set()
+    fields = extract_json_fields_stream(io.StringIO(text), chunk_size=7, uncertain=uncertain)
+    assert fields == {"name", "vendor", "release_date", "benchmarks"}
+    assert uncertain == {"vendor", "benchmarks", "license"}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_stream_decodes_escapes_and_ignores_keys(chunk_size):
+    text = (
+        '{"a": "[uncert\\u0061in]", "b": "\\u005b\\u4e0d\\u786e\\u5b9a]", "c": {"[uncertain]": 1},'
+        ' "d": ["x\\n[uncertain\\"]"], "e": [{"k": "ok", "[不確定]": ["y", "[不確定]"]}], "f": "[uncertain\\"]"}'
+    )
+    expected, actual = extract_both(text, chunk_size)
+    assert expected == actual == ({"a", "b", "c", "d", "e", "f"}, {"a", "b", "e"})
+
+
+def test_stream_last_duplicate_key_wins():
+    text = '{"basic_info": {"vendor": "[uncertain]"}, "basic_info": {"name": "x"}, "uncertain": ["a"], "uncertain": 1}'
+    assert extract_both(text, 4) == (({"name"}, set()), ({"name"}, set()))
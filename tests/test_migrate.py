@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from conftest import write_json
+from research_toolkit.migrate import PENDING_NAME, SNAPSHOT_NAME, main, migrate_results, refresh_pending
+from research_toolkit.schema import load_fields_yaml
+
+
+def add_fields(fields_path, category, *lines):
+    text = fields_path.read_text(encoding="utf-8")
+    marker = f"- category: {category}\n  fields:\n"
+    fields_path.write_text(text.replace(marker, marker + "".join(f"  {line}\n" for line in lines)), encoding="utf-8")
+
+
+def read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_migrate_adds_placeholders_in_flat_and_nested_items(project):
+    results = project / "results"
+    flat = write_json(results / "Alpha.json", {"name": "Alpha", "vendor": "Acme"})
+    nested = write_json(results / "Beta.json", {"basic_info": {"name": "Beta", "vendor": "B"}, "uncertain": ["vendor"]})
+    old = load_fields_yaml(project / "fields.yaml")
+    add_fields(project / "fields.yaml", "Basic Info", "- name: license")
+    report = migrate_results(results, old, load_fields_yaml(project / "fields.yaml"), "[uncertain]")
+    assert report["added"] == ["license"]
+    assert (report["scanned"], report["changed"]) == (2, 2)
+    assert read(flat) == {"name": "Alpha", "vendor": "Acme", "license": "[uncertain]", "uncertain": ["license"]}
+    assert read(nested) == {
+        "basic_info": {"name": "Beta", "vendor": "B", "license": "[uncertain]"},
+        "uncertain": ["vendor", "license"],
+    }
+    assert read(results / PENDING_NAME) == {"Alpha": ["license"], "Beta": ["license"]}
+
+
+def test_migrate_moves_fields_between_nested_categories(project):
+    results = project / "results"
+    item = write_json(
+        results / "Beta.json",
+        {"basic_info": {"name": "Beta", "vendor": "B", "release_date": "2024"}, "technical_features": {}},
+    )
+    old = load_fields_yaml(project / "fields.yaml")
+    fields = project / "fields.yaml"
+    text = fields.read_text(encoding="utf-8").replace("  - name: release_date\n", "")
+    fields.write_text(text + "  - name: release_date\n", encoding="utf-8")
+    report = migrate_results(results, old, load_fields_yaml(fields), "[uncertain]")
+    assert report["moved"] == ["release_date"]
+    assert read(item) == {
+        "basic_info": {"name": "Beta", "vendor": "B"},
+        "technical_features": {"release_date": "2024"},
+        "uncertain": [],
+    }
+
+
+def test_pending_clears_once_fields_are_filled(project):
+    results = project / "results"
+    write_json(results / "Alpha.json", {"name": "Alpha", "vendor": "Acme"})
+    (project / "outline.yaml").write_text("topic: t\nitems:\n- Alpha\n", encoding="utf-8")
+    main(["--outline", str(project / "outline.yaml"), "snapshot"])
+    assert (results / SNAPSHOT_NAME).exists()
+    add_fields(project / "fields.yaml", "Technical Features", "- name: license", "- name: modality")
+    main(["--outline", str(project / "outline.yaml"), "run"])
+    assert read(results / PENDING_NAME) == {"Alpha": ["license", "modality"]}
+    write_json(results / "Alpha.json", {**read(results / "Alpha.json"), "license": "MIT"})
+    assert refresh_pending(results) == {"Alpha": ["modality"]}
+    write_json(results / "Alpha.json", {**read(results / "Alpha.json"), "modality": "text"})
+    assert refresh_pending(results) == {}
+    assert not (results / PENDING_NAME).exists()
+
+
+def test_options_may_follow_the_subcommand(project, capsys):
+    results = project / "results"
+    write_json(results / "Alpha.json", {"name": "Alpha", "vendor": "Acme"})
+    (project / "outline.yaml").write_text("topic: t\nitems:\n- Alpha\n", encoding="utf-8")
+    main(["--outline", str(project / "outline.yaml"), "snapshot"])
+    capsys.readouterr()
+    add_fields(project / "fields.yaml", "Technical Features", "- name: license")
+    main(["--outline", str(project / "outline.yaml"), "run", "--dry-run", "--format", "json"])
+    assert json.loads(capsys.readouterr().out)["added"] == ["license"]
+    assert not (results / PENDING_NAME).exists()
+    main(["--outline", str(project / "outline.yaml"), "--format", "json", "run"])
+    capsys.readouterr()
+    main(["--outline", str(project / "outline.yaml"), "pending", "--format", "json"])
+    assert json.loads(capsys.readouterr().out) == {"pending": {"Alpha": ["license"]}}
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+from conftest import write_json
+from research_toolkit.report import write_report
+
+ITEMS = {
+    "Alpha": {
+        "name": "Alpha",
+        "vendor": "Acme",
+        "release_date": "[uncertain]",
+        "architecture": "Transformer",
+        "context_window": 128000,
+        "benchmarks": [{"name": "MMLU", "score": 86.4}, {"name": "GSM8K", "score": None}],
+        "homepage": "https://example.com/alpha",
+    },
+    "Beta": {
+        "basic_info": {"name": "Beta", "vendor": "Beta Labs", "release_date": "2024-05"},
+        "technical_features": {
+            "architecture": "Mixture of experts with a very long description that goes on and on to exceed "
+            "the long text threshold of one hundred chars",
+            "context_window": "[uncertain] 1M",
+        },
+        "uncertain": ["release_date", "context_window"],
+    },
+    "Beta_2": {"name": "Beta", "vendor": "", "architecture": ["dense", "decoder-only"]},
+}
+
+GOLDEN = """\
+# Models
+
+## Table of Contents
+
+1. [Alpha](#alpha) - Vendor: Acme
+2. [Beta](#beta) - Vendor: Beta Labs
+3. [Beta](#beta-1)
+
+---
+
+## Alpha
+
+### Basic Info
+
+- **name**: Alpha
+- **vendor**: Acme
+
+### Technical Features
+
+- **architecture**: Transformer
+- **context_window**: 128000
+- **benchmarks**:
+  - name: MMLU | score: 86.4
+  - name: GSM8K
+
+### Other Info
+
+- **homepage**: https://example.com/alpha
+
+## Beta
+
+### Basic Info
+
+- **name**: Beta
+- **vendor**: Beta Labs
+
+### Technical Features
+
+- **architecture**:
+  > Mixture of experts with a very long description that goes on and on to exceed the long text threshold of one hundred chars
+
+### Other Info
+
+- **Uncertain fields**:
+  - release_date
+  - context_window
+
+## Beta
+
+### Basic Info
+
+- **name**: Beta
+
+### Technical Features
+
+- **architecture**: dense, decoder-only
+
+"""
+
+TOC = [("vendor", "Vendor")]
+
+
+def write_items(results):
+    return [write_json(results / f"{slug}.json", data) for slug, data in ITEMS.items()]
+
+
+def render(project, paths, toc_fields=TOC, cache_dir=None):
+    output = project / "report.md"
+    counts = write_report(output, paths, project / "fields.yaml", "Models", toc_fields, cache_dir=cache_dir)
+    return output.read_text(encoding="utf-8"), counts
+
+
+def test_report_matches_golden(project):
+    text, counts = render(project, write_items(project / "results"))
+    assert text == GOLDEN
+    assert counts == (3, 3)
+
+
+def test_incremental_report_reuses_unchanged_items(project):
+    results = project / "results"
+    paths = write_items(results)
+    assert render(project, paths, cache_dir=results) == (GOLDEN, (3, 3))
+    assert render(project, paths, cache_dir=results) == (GOLDEN, (3, 0))
+    write_json(paths[0], {**ITEMS["Alpha"], "vendor": "Acme Corp"})
+    text, counts = render(project, paths, cache_dir=results)
+    assert counts == (3, 1)
+    assert "Vendor: Acme Corp" in text and "- **vendor**: Acme Corp" in text
+    assert text == render(project, paths)[0]
+
+
+def test_incremental_report_drops_removed_items(project):
+    results = project / "results"
+    paths = write_items(results)
+    render(project, paths, cache_dir=results)
+    paths[2].unlink()
+    text, counts = render(project, paths[:2], cache_dir=results)
+    assert counts == (2, 0)
+    assert "#beta-1" not in text
+    assert not (results / ".report_cache" / "Beta_2.json.md").exists()
+
+
+def test_incremental_report_rebuilds_on_fields_change(project):
+    results = project / "results"
+    paths = write_items(results)
+    render(project, paths, cache_dir=results)
+    fields = project / "fields.yaml"
+    fields.write_text(fields.read_text(encoding="utf-8") + "  - name: homepage\n", encoding="utf-8")
+    text, counts = render(project, paths, cache_dir=results)
+    assert counts == (3, 3)
+    assert "### Other Info\n\n- **homepage**" not in text
+    assert text == render(project, paths)[0]
+
+
+def test_incremental_report_rebuilds_on_toc_fields_change(project):
+    results = project / "results"
+    paths = write_items(results)
+    render(project, paths, cache_dir=results)
+    text, counts = render(project, paths, toc_fields=[("architecture", "Arch")], cache_dir=results)
+    assert counts == (3, 3)
+    assert "1. [Alpha](#alpha) - Arch: Transformer\n" in text
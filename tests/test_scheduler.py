@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from conftest import write_json
+from research_toolkit.scheduler import main
+from research_toolkit.state import ResearchState
+
+OUTLINE = """\
+topic: LLMs
+items:
+- name: Claude
+  category: closed
+- name: GPT
+  category: closed
+- name: Llama
+  category: open
+- name: Mistral
+  category: open
+execution:
+  output_dir: ./results
+  batch_size: 2
+"""
+
+
+def write_outline(project):
+    path = project / "outline.yaml"
+    path.write_text(OUTLINE, encoding="utf-8")
+    return path
+
+
+def test_simulated_run_completes_every_item(project, capsys):
+    outline = write_outline(project)
+    main(["--outline", str(outline), "run", "--simulate", "--sim-duration", "0.01"])
+    out = capsys.readouterr().out
+    assert out.count("Launch agent-") == 4
+    results = project / "results"
+    assert sorted(p.stem for p in results.glob("*.json")) == ["Claude", "GPT", "Llama", "Mistral"]
+    entries = ResearchState(results).entries
+    assert sorted(entries) == ["Claude", "GPT", "Llama", "Mistral"]
+    assert all(entry["status"] == "done" for entry in entries.values())
+    main(["--outline", str(outline), "next", "--format", "json"])
+    status = json.loads(capsys.readouterr().out)
+    assert (status["done"], status["queued"], status["launch"]) == (4, 0, [])
+
+
+def test_next_skips_items_with_valid_json_before_first_state(project, capsys):
+    outline = write_outline(project)
+    write_json(project / "results" / "Claude.json", {"name": "Claude", "vendor": "Anthropic"})
+    write_json(project / "results" / "GPT.json", {"name": "GPT"})
+    main(["--outline", str(outline), "--slots", "4", "next", "--format", "json"])
+    status = json.loads(capsys.readouterr().out)
+    launched = [item["name"] for launch in status["launch"] for item in launch["items"]]
+    assert launched == ["GPT", "Llama", "Mistral"]
+    assert status["done"] == 1
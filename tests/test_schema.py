@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import pytest
+
+from research_toolkit import schema
+from research_toolkit.schema import compiled_schema_path, load_schema
+
+
+@pytest.fixture
+def compiled(project):
+    # Loads once to write the sidecar, then plants a marker field that only the sidecar knows.
+    fields_path = project / "fields.yaml"
+    load_schema(fields_path)
+    path = compiled_schema_path(fields_path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    path.write_text(json.dumps({**data, "all_fields": [*data["all_fields"], "from_sidecar"]}), encoding="utf-8")
+    return path
+
+
+def test_sidecar_is_reused(project, compiled):
+    assert "from_sidecar" in load_schema(project / "fields.yaml")[0]
+    assert "from_sidecar" not in load_schema(project / "fields.yaml", use_compiled=False)[0]
+
+
+def test_sidecar_is_restamped_when_only_mtime_changes(project, compiled):
+    fields_path = project / "fields.yaml"
+    st = fields_path.stat()
+    os.utime(fields_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert "from_sidecar" in load_schema(fields_path)[0]
+    assert json.loads(compiled.read_text(encoding="utf-8"))["mtime_ns"] == st.st_mtime_ns + 10**9
+
+
+def test_sidecar_is_rebuilt_when_fields_change(project, compiled):
+    fields_path = project / "fields.yaml"
+    fields_path.write_text(fields_path.read_text(encoding="utf-8") + "  - name: license\n", encoding="utf-8")
+    all_fields = load_schema(fields_path)[0]
+    assert "license" in all_fields and "from_sidecar" not in all_fields
+    assert "license" in json.loads(compiled.read_text(encoding="utf-8"))["all_fields"]
+
+
+def test_sidecar_is_rebuilt_when_nested_keys_change(project, compiled, monkeypatch):
+    monkeypatch.setattr(schema, "NESTED_KEYS", schema.NESTED_KEYS | {"extra_section"})
+    assert "from_sidecar" not in load_schema(project / "fields.yaml")[0]
+    assert "extra_section" in json.loads(compiled.read_text(encoding="utf-8"))["nested_keys"]
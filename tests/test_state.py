@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from conftest import write_json
+from research_toolkit import state, validate
+from research_toolkit.state import STATE_NAME
+
+
+@pytest.fixture
+def results(project, monkeypatch):
+    monkeypatch.setenv("RESEARCH_VALIDATE_SOCKET", str(project / "no-daemon.sock"))
+    results = project / "results"
+    write_json(results / "Claude.json", {"name": "Claude", "vendor": "Anthropic"})
+    write_json(results / "GPT.json", {"basic_info": {"name": "GPT", "vendor": "OpenAI"}})
+    return results
+
+
+def test_only_directory_runs_create_the_state_file(project, results, capsys):
+    args = ["-f", str(project / "fields.yaml"), "--format", "json"]
+    validate.main([*args, "-j", str(results / "Claude.json")])
+    assert not (results / STATE_NAME).exists()
+    validate.main([*args, "-d", str(results)])
+    assert (results / STATE_NAME).exists()
+    validate.main([*args, "-j", str(results / "GPT.json")])
+    capsys.readouterr()
+    assert sorted(state.ResearchState(results).entries) == ["Claude", "GPT"]
+
+
+def test_resume_entries_go_stale_when_fields_change(project, results, capsys):
+    (project / "outline.yaml").write_text("topic: t\nitems:\n- Claude\n- GPT\n", encoding="utf-8")
+    resume = ["--outline", str(project / "outline.yaml"), "--format", "json"]
+    state.main(resume)
+    assert json.loads(capsys.readouterr().out)["done"] == ["Claude", "GPT"]
+    fields = project / "fields.yaml"
+    fields.write_text(
+        fields.read_text(encoding="utf-8").replace("  - name: release_date\n", "  - name: release_date\n    required: true\n"),
+        encoding="utf-8",
+    )
+    state.main(resume)
+    report = json.loads(capsys.readouterr().out)
+    assert report["done"] == []
+    assert [f["missing_required"] for f in report["failed"]] == [["release_date"], ["release_date"]]
+
+
+def test_directory_runs_skip_unchanged_entries(project, results, capsys):
+    args = ["-f", str(project / "fields.yaml"), "-d", str(results), "--format", "json"]
+    validate.main(args)
+    lines = (results / STATE_NAME).read_text(encoding="utf-8").count("\n")
+    validate.main(args)
+    validate.main([*args, "--no-cache"])
+    capsys.readouterr()
+    assert (results / STATE_NAME).read_text(encoding="utf-8").count("\n") == lines == 2
+
+
+def test_resume_validates_results_written_after_the_state(project, results, capsys):
+    (project / "outline.yaml").write_text("topic: t\nitems:\n- Claude\n- GPT\n- Gemini\n", encoding="utf-8")
+    resume = ["--outline", str(project / "outline.yaml"), "--format", "json"]
+    state.main(resume)
+    assert json.loads(capsys.readouterr().out)["todo"] == [{"name": "Gemini", "slug": "Gemini", "status": "pending"}]
+    write_json(results / "Gemini.json", {"name": "Gemini", "vendor": "Google"})
+    state.main(resume)
+    report = json.loads(capsys.readouterr().out)
+    assert (report["done"], report["todo"]) == (["Claude", "GPT", "Gemini"], [])
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+import json
+import sqlite3
+
+import pytest
+
+from conftest import write_json
+from research_toolkit import validate
+from research_toolkit.cache import STORE_NAME
+from research_toolkit.report import toc_candidates, write_report
+from research_toolkit.schema import load_schema
+from research_toolkit.store import ResultStore, validate_stored
+
+ITEMS = {
+    "Alpha": {"name": "Alpha", "vendor": "Acme", "context_window": 128000},
+    "Beta": {"basic_info": {"name": "Beta", "vendor": "[uncertain] Beta Labs"}},
+    "Gamma": {"name": "Gamma", "vendor": "G", "architecture": "MoE", "uncertain": ["vendor"]},
+}
+
+
+@pytest.fixture
+def results(project):
+    results = project / "results"
+    for slug, data in ITEMS.items():
+        write_json(results / f"{slug}.json", data)
+    return results
+
+
+@pytest.fixture
+def store(project, results):
+    store = ResultStore(results, load_schema(project / "fields.yaml"))
+    yield store
+    store.close()
+
+
+def paths(results):
+    return sorted(results.glob("*.json"))
+
+
+def test_refresh_only_rebuilds_changed_rows(results, store):
+    assert store.refresh(paths(results)) == (3, 0)
+    assert store.refresh(paths(results)) == (0, 0)
+    (results / "Alpha.json").touch()
+    assert store.refresh(paths(results)) == (0, 0)
+    write_json(results / "Alpha.json", {**ITEMS["Alpha"], "vendor": "Acme Corp"})
+    assert store.refresh(paths(results)) == (1, 0)
+    assert [row["value"] for row in store.values("vendor")] == ["Acme Corp"]
+
+
+def test_refresh_evicts_deleted_files(results, store):
+    store.refresh(paths(results))
+    (results / "Gamma.json").unlink()
+    assert store.refresh(paths(results)) == (0, 1)
+    assert store.result(results / "Gamma.json") is None
+    assert store.stats()[0] == 2
+
+
+def test_values_skip_uncertain_unless_asked(results, store):
+    store.refresh(paths(results))
+    assert list(store.values("vendor")) == [{"file": "Alpha.json", "name": "Alpha", "value": "Acme", "uncertain": False}]
+    assert [(row["name"], row["uncertain"]) for row in store.values("vendor", include_uncertain=True)] == [
+        ("Alpha", False),
+        ("Beta", True),
+        ("Gamma", True),
+    ]
+    assert list(store.values("context_window")) == [
+        {"file": "Alpha.json", "name": "Alpha", "value": 128000, "uncertain": False}
+    ]
+
+
+def test_store_does_not_copy_item_json(results, store):
+    store.refresh(paths(results))
+    columns = [row[1] for row in store.db.execute("PRAGMA table_info(results)")]
+    assert "data" not in columns
+    assert store.load(results / "Beta.json") == {"name": "Beta", "vendor": "[uncertain] Beta Labs"}
+
+
+def test_report_from_store_matches_report_from_files(project, results, store):
+    write_json(results / "Delta.json", {"name": "Delta", "technical_features": {"benchmarks": {"mmlu": 80}}, "stars": 5})
+    write_json(results / "List.json", [{"name": "Epsilon", "vendor": "E"}])
+    store.refresh(paths(results))
+    fields_path = project / "fields.yaml"
+    toc = [("vendor", "Vendor"), ("stars", "Stars")]
+    write_report(project / "files.md", paths(results), fields_path, "T", toc)
+    write_report(project / "store.md", paths(results), fields_path, "T", toc, loader=store.load)
+    assert (project / "store.md").read_text() == (project / "files.md").read_text()
+    assert toc_candidates(paths(results), loader=store.load) == toc_candidates(paths(results))
+
+
+def test_streamed_rows_are_completed_by_a_later_refresh(project, results):
+    schema = load_schema(project / "fields.yaml")
+    list(validate_stored(paths(results), schema, stream=True))
+    with ResultStore(results, schema) as store:
+        assert store.load(results / "Beta.json") == ITEMS["Beta"]
+        assert store.refresh(paths(results), stream=True) == (0, 0)
+        assert store.refresh(paths(results)) == (3, 0)
+        assert [row["value"] for row in store.values("vendor")] == ["Acme"]
+
+
+def test_top_level_list_is_validated_like_validate_json(project, results):
+    write_json(results / "List.json", [{"name": "Epsilon", "vendor": "E", "architecture": "Dense"}])
+    schema = load_schema(project / "fields.yaml")
+    assert list(validate_stored(paths(results), schema)) == list(validate.validate_many(paths(results), schema))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_stored_matches_validate_many(project, results, jobs):
+    schema = load_schema(project / "fields.yaml")
+    expected = list(validate.validate_many(paths(results), schema))
+    assert list(validate_stored(paths(results), schema, jobs=jobs)) == expected
+
+
+def test_streamed_items_are_validated_without_field_columns(project, results):
+    schema = load_schema(project / "fields.yaml")
+    expected = list(validate.validate_many(paths(results), schema))
+    assert list(validate_stored(paths(results), schema, stream=True)) == expected
+    db = sqlite3.connect(results / STORE_NAME)
+    try:
+        assert db.execute("SELECT name, c0 FROM results").fetchall() == [(None, None)] * 3
+    finally:
+        db.close()
+
+
+def test_validate_json_store_flag(project, results, monkeypatch, capsys):
+    monkeypatch.setenv("RESEARCH_VALIDATE_SOCKET", str(project / "no-daemon.sock"))
+    args = ["-f", str(project / "fields.yaml"), "-d", str(results), "--format", "json"]
+    validate.main([*args, "--no-cache"])
+    expected = json.loads(capsys.readouterr().out)
+    validate.main([*args, "--store"])
+    assert json.loads(capsys.readouterr().out) == expected
+    assert (results / STORE_NAME).exists()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from conftest import write_json
+from research_toolkit import validate
+from research_toolkit.schema import load_schema
+from research_toolkit.timings import PHASES, collect_timings, current
+from research_toolkit.validate import validate_json, validate_json_timed, validate_many
+
+
+@pytest.fixture
+def items(project):
+    results = project / "results"
+    return [write_json(results / f"item{i}.json", {"name": f"item{i}", "vendor": "v"}) for i in range(4)]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_timed_validation_matches_untimed(project, items, stream):
+    schema = load_schema(project / "fields.yaml")
+    result, record = validate_json_timed(items[0], *schema, stream=stream)
+    assert result == validate_json(items[0], *schema, stream=stream)
+    assert record["file"] == str(items[0])
+    assert record["bytes"] == items[0].stat().st_size
+    phases = {"extract", "compare"} if stream else {"read", "parse", "extract", "compare"}
+    assert phases <= set(record) <= {"file", "bytes", *PHASES}
+    assert all(record[phase] >= 0 for phase in phases)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_collect_timings_delivers_a_record_per_file(project, items, jobs):
+    schema = load_schema(project / "fields.yaml")
+    delivered = []
+    with collect_timings(delivered.append) as timings:
+        assert current() is timings
+        results = list(validate_many(items, schema, jobs=jobs))
+    assert current() is None
+    assert [r["file"] for r in results] == [p.name for p in items]
+    assert sorted(r["file"] for r in delivered) == sorted(str(p) for p in items)
+    assert all(r["total"] == pytest.approx(sum(r.get(phase, 0.0) for phase in PHASES)) for r in delivered)
+    summary = timings.summary(slowest=2)
+    assert (summary["files"], summary["cached"]) == (4, 0)
+    assert summary["bytes"] == sum(p.stat().st_size for p in items)
+    assert len(summary["slowest"]) == 2
+    assert summary["wall"] >= summary["phases"]["extract"]
+
+
+def test_timings_are_off_outside_collect(project, items):
+    delivered = []
+    with collect_timings(delivered.append):
+        pass
+    list(validate_many(items, load_schema(project / "fields.yaml")))
+    assert delivered == []
+
+
+
+def test_profile_flag_reports_timings(project, items, capsys):
+    args = ["-f", str(project / "fields.yaml"), "-d", str(project / "results"), "--format", "json", "--profile"]
+    validate.main(args)
+    first = json.loads(capsys.readouterr().out)["timings"]
+    validate.main(args)
+    second = json.loads(capsys.readouterr().out)["timings"]
+    assert (first["files"], first["cached"]) == (4, 0)
+    assert (second["files"], second["cached"]) == (4, 4)
+    assert second["phases"]["parse"] == 0
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from conftest import write_json
+from research_toolkit.cache import schema_digest
+from research_toolkit.schema import load_schema
+from research_toolkit.state import ResearchState
+from research_toolkit.uncertainty import UncertaintyIndex, main, refresh_state
+
+ITEMS = {
+    "Alpha": ["vendor", "architecture", "not_in_schema"],
+    "Beta": ["vendor"],
+    "Gamma": [],
+}
+
+
+@pytest.fixture
+def index(project):
+    return UncertaintyIndex(ITEMS, load_schema(project / "fields.yaml"))
+
+
+@pytest.fixture
+def results(project, monkeypatch):
+    monkeypatch.setenv("RESEARCH_VALIDATE_SOCKET", str(project / "no-daemon.sock"))
+    results = project / "results"
+    write_json(results / "Alpha.json", {"name": "Alpha", "vendor": "[uncertain]", "architecture": "[uncertain] MoE"})
+    write_json(results / "Beta.json", {"basic_info": {"name": "Beta", "vendor": "B"}, "uncertain": ["vendor"]})
+    write_json(results / "Gamma.json", {"name": "Gamma", "vendor": "G"})
+    return results
+
+
+def test_field_rates(index):
+    rates = index.field_rates()
+    assert list(rates) == ["vendor", "architecture", "not_in_schema"]
+    assert rates["vendor"] == {"count": 2, "rate": pytest.approx(200 / 3)}
+    assert rates["architecture"] == {"count": 1, "rate": pytest.approx(100 / 3)}
+
+
+def test_category_rates(index):
+    assert index.category_rates() == {
+        "Basic Info": {"cells": 2, "total": 9, "rate": pytest.approx(200 / 9)},
+        "Technical Features": {"cells": 1, "total": 9, "rate": pytest.approx(100 / 9)},
+    }
+
+
+def test_items_above_threshold_and_fields(index):
+    assert index.items_above() == [
+        ("Alpha", ["architecture", "not_in_schema", "vendor"], pytest.approx(100 / 3)),
+        ("Beta", ["vendor"], pytest.approx(100 / 6)),
+    ]
+    assert [slug for slug, _, _ in index.items_above(20)] == ["Alpha"]
+    assert index.items_above(fields=["architecture"]) == [("Alpha", ["architecture"], pytest.approx(100 / 3))]
+    assert index.pairs(["vendor"]) == [("Alpha", "vendor"), ("Beta", "vendor")]
+
+
+def test_refresh_state_drops_deleted_files(project, results):
+    schema = load_schema(project / "fields.yaml")
+    state = ResearchState(results, schema_digest(schema))
+    refresh_state(state, schema, results)
+    assert UncertaintyIndex.from_state(state, schema).items == {
+        "Alpha": ["architecture", "vendor"],
+        "Beta": ["vendor"],
+        "Gamma": [],
+    }
+    (results / "Beta.json").unlink()
+    state = ResearchState(results, schema_digest(schema))
+    refresh_state(state, schema, results)
+    assert sorted(state.entries) == ["Alpha", "Gamma"]
+
+
+def test_cells_options_may_follow_the_subcommand(project, results, capsys):
+    args = ["-f", str(project / "fields.yaml"), "-d", str(results)]
+    main([*args, "--threshold", "20", "cells", "--format", "json"])
+    assert [(item["slug"], item["fields"]) for item in json.loads(capsys.readouterr().out)["items"]] == [
+        ("Alpha", ["architecture", "vendor"])
+    ]
+    main([*args, "cells", "--field", "vendor", "--format", "json"])
+    assert [item["slug"] for item in json.loads(capsys.readouterr().out)["items"]] == ["Alpha", "Beta"]
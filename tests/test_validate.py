@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+import json
+import sqlite3
+
+import pytest
+
+from conftest import write_json
+from research_toolkit import validate
+from research_toolkit.cache import CACHE_NAME
+
+
+@pytest.fixture
+def results(project, monkeypatch):
+    monkeypatch.setenv("RESEARCH_VALIDATE_SOCKET", str(project / "no-daemon.sock"))
+    results = project / "results"
+    write_json(results / "Claude.json", {"name": "Claude", "vendor": "Anthropic", "uncertain": ["vendor"]})
+    write_json(results / "GPT.json", {"basic_info": {"name": "GPT", "vendor": "[uncertain]"}})
+    return results
+
+
+def run(project, *args):
+    validate.main(["-f", str(project / "fields.yaml"), "--format", "json", *args])
+
+
+def test_default_path_falls_back_to_in_process_validation(project, results, capsys):
+    run(project, "-d", str(results))
+    report = json.loads(capsys.readouterr().out)
+    assert report["summary"]["passed"] == 2
+    assert [r["uncertain_fields"] for r in report["results"]] == [["vendor"], ["vendor"]]
+
+
+def test_stream_and_tree_results_agree(project, results, capsys):
+    run(project, "-d", str(results), "--no-cache")
+    tree = json.loads(capsys.readouterr().out)["results"]
+    run(project, "-d", str(results), "--stream")
+    assert json.loads(capsys.readouterr().out)["results"] == tree
+
+
+def cache_entries(results):
+    db = sqlite3.connect(results / CACHE_NAME)
+    try:
+        return db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+    finally:
+        db.close()
+
+
+def cache_names(results):
+    db = sqlite3.connect(results / CACHE_NAME)
+    try:
+        return sorted(name for name, in db.execute("SELECT name FROM entries"))
+    finally:
+        db.close()
+
+
+def test_editing_fields_invalidates_the_cache(project, results, capsys):
+    run(project, "-d", str(results))
+    assert json.loads(capsys.readouterr().out)["summary"]["passed"] == 2
+    assert cache_names(results) == ["Claude.json", "GPT.json"]
+    fields = project / "fields.yaml"
+    fields.write_text(
+        fields.read_text(encoding="utf-8").replace("  - name: release_date\n", "  - name: release_date\n    required: true\n"),
+        encoding="utf-8",
+    )
+    with pytest.raises(SystemExit):
+        run(project, "-d", str(results))
+    report = json.loads(capsys.readouterr().out)
+    assert report["summary"]["passed"] == 0
+    assert [r["missing_required"] for r in report["results"]] == [["release_date"], ["release_date"]]
+
+
+def test_directory_runs_evict_deleted_and_renamed_results(project, results, capsys):
+    run(project, "-d", str(results))
+    (results / "Claude.json").unlink()
+    (results / "GPT.json").rename(results / "GPT-4.json")
+    run(project, "-d", str(results))
+    capsys.readouterr()
+    assert cache_names(results) == ["GPT-4.json"]
+
+
+def test_file_list_runs_keep_cache_entries(project, results, monkeypatch, capsys):
+    monkeypatch.setattr(validate, "CACHE_MIN_BYTES", 0)
+    run(project, "-d", str(results))
+    (results / "GPT.json").touch()
+    run(project, "-j", str(results / "GPT.json"))
+    capsys.readouterr()
+    assert cache_entries(results) == 2
+
+
+def test_small_file_lists_skip_the_cache(project, results, monkeypatch, capsys):
+    def no_cache(*args, **kwargs):
+        raise AssertionError("cache opened")
+
+    monkeypatch.setattr(validate, "ValidationCache", no_cache)
+    run(project, "-j", str(results / "Claude.json"))
+    assert json.loads(capsys.readouterr().out)["summary"]["passed"] == 1
+    assert not (results / CACHE_NAME).exists()